@@ -0,0 +1,107 @@
+import threading
+import time
+
+
+class CancellationToken:
+    """
+    Flag a caller sets to ask a running solver to stop.
+
+    Solvers poll the token between units of work, so cancel() may be called
+    from another thread (a GUI callback, a request handler) while the solver
+    runs; the solver then stops and returns the best schedule found so far.
+    """
+
+    def __init__(self, event=None):
+        """
+        Initialize an uncancelled token.
+
+        Args:
+            event: Event to wrap, a new threading.Event by default; a multiprocessing.Event
+                lets worker processes see the cancellation
+        """
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        """Ask every solver holding this token to stop."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True once cancel() has been called."""
+        return self._event.is_set()
+
+
+class AnytimeSolver:
+    """
+    Common interface of solvers that can be stopped early.
+
+    solve() returns the best schedule found, whether the solver finished,
+    ran out of time or was cancelled, and leaves a ScheduleResult in result;
+    run() returns that result. Subclasses poll interruption() between units
+    of work and call report_improvement() whenever their incumbent improves.
+    Nothing is printed unless verbose is set.
+
+    Attributes:
+        time_limit (Optional[float]): Seconds the solver may run, None for no limit
+        cancel_token (Optional[CancellationToken]): Token that stops the solver when cancelled
+        on_improvement (Optional[Callable]): Called as on_improvement(schedule, makespan, elapsed)
+            each time the incumbent improves
+        start_time (Optional[float]): perf_counter() value when the current run started
+        interrupted (Optional[str]): "time_limit" or "cancelled" if the last run stopped early
+        proven_optimal (bool): True if the last run proved its schedule optimal
+        verbose (bool): Print the result at the end of every run
+        result (Optional[ScheduleResult]): Result of the last run
+    """
+
+    def __init__(self, time_limit=None, cancel_token=None, on_improvement=None, verbose=False):
+        """
+        Initialize the anytime state.
+
+        Args:
+            time_limit: Seconds the solver may run, None for no limit
+            cancel_token: CancellationToken polled while solving
+            on_improvement: Callback fired with (schedule, makespan, elapsed seconds) on each improvement
+            verbose: Print the result at the end of every run
+        """
+        self.time_limit = time_limit
+        self.cancel_token = cancel_token
+        self.on_improvement = on_improvement
+        self.start_time = None
+        self.interrupted = None
+        self.proven_optimal = False
+        self.verbose = verbose
+        self.result = None
+
+    def solve(self):
+        """Solve the problem and return the best schedule found, None if there is none."""
+        raise NotImplementedError
+
+    def run(self):
+        """Solve the problem and return its ScheduleResult."""
+        self.solve()
+        return self.result
+
+    def start_clock(self):
+        """Start timing a new run."""
+        self.start_time = time.perf_counter()
+        self.interrupted = None
+        self.proven_optimal = False
+
+    def elapsed(self) -> float:
+        """Return the seconds since the current run started."""
+        if self.start_time is None:
+            return 0.0
+        return time.perf_counter() - self.start_time
+
+    def interruption(self):
+        """Return "cancelled" or "time_limit" if the run must stop now, None otherwise."""
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            return "cancelled"
+        if self.time_limit is not None and self.elapsed() >= self.time_limit:
+            return "time_limit"
+        return None
+
+    def report_improvement(self, schedule, makespan):
+        """Pass a new incumbent to the on_improvement callback, if any."""
+        if self.on_improvement is not None:
+            self.on_improvement(schedule, makespan, self.elapsed())
\ No newline at end of file
@@ -1,73 +1,400 @@
-class BacktrackingAlgorithm:
-    def __init__(self, problem_instance):
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import multiprocessing
+from algorithms.anytime import AnytimeSolver, CancellationToken
+from algorithms.presolve import presolve as presolve_problem
+from algorithms.search_state import SearchState
+from models.schedule_result import ScheduleResult
+from utils.schedule_decoder import ScheduleDecoder
+
+# Sentinel stored in the shared bound while no worker has found a schedule.
+NO_BOUND = -1
+
+_worker_algorithm = None
+
+
+def _init_worker(problem_instance, symmetry_breaking, shared_bound, time_limit, stop_event):
+    global _worker_algorithm
+    _worker_algorithm = BacktrackingAlgorithm(problem_instance, symmetry_breaking=symmetry_breaking,
+                                              time_limit=time_limit, cancel_token=CancellationToken(stop_event))
+    _worker_algorithm.shared_bound = shared_bound
+    _worker_algorithm.start_clock()
+    _worker_algorithm.prepare_search()
+
+
+def _solve_subproblem(prefix):
+    return _worker_algorithm.solve_subproblem(prefix)
+
+
+class BacktrackingAlgorithm(AnytimeSolver):
+    # Number of nodes expanded between reads of the shared bound and checks for a deadline or cancellation.
+    BOUND_SYNC_INTERVAL = 1024
+    # Seconds the parallel search waits for a subproblem before checking for a deadline or cancellation.
+    POOL_POLL_INTERVAL = 0.05
+
+    def __init__(self, problem_instance, branch_and_bound=True, symmetry_breaking=True, workers=1, split_depth=None,
+                 presolve=True, time_limit=None, cancel_token=None, on_improvement=None, verbose=False):
+        super().__init__(time_limit, cancel_token, on_improvement, verbose)
         self.problem_instance = problem_instance
+        # Problem the search runs on: the presolved one when presolve is enabled.
+        self.search_problem = problem_instance
+        self.presolve = presolve
+        self.presolve_result = None
+        self.branch_and_bound = branch_and_bound
+        self.symmetry_breaking = symmetry_breaking
+        self.workers = workers
+        self.split_depth = split_depth
         self.best_schedule = None
+        self.best_makespan = None
+        self.bound = None
+        self.shared_bound = None
+        self.nodes_expanded = 0
+        self.optimality_gap = None
+        self.infeasibility = None
 
     def is_valid_schedule(self, schedule):
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-
-        for job, resource in schedule:
-            if resource_occupancy[resource.resource_id] + job.processing_time > resource.capacity:
-                return False
-
-            if job.dependency is not None:
-                dependency_scheduled = False
-                for j, _ in schedule:
-                    if j.job_id == job.dependency:
-                        dependency_scheduled = True
-                        break
-                if not dependency_scheduled:
-                    return False
-
-            resource_occupancy[resource.resource_id] += job.processing_time
-
-        return True
-
-    def backtrack(self, schedule, remaining_jobs):
-        if not remaining_jobs:
-            if self.is_valid_schedule(schedule):
-                if self.best_schedule is None or len(schedule) < len(self.best_schedule):
-                    self.best_schedule = schedule.copy()
+        return ScheduleDecoder(self.problem_instance).decode(schedule).feasible
+
+    def check_interruption(self):
+        """Record and return whether the run has to stop, polling only every BOUND_SYNC_INTERVAL nodes."""
+        if not self.interrupted and self.nodes_expanded % self.BOUND_SYNC_INTERVAL == 0:
+            self.interrupted = self.interruption()
+        return self.interrupted is not None
+
+    def backtrack(self, state):
+        self.nodes_expanded += 1
+        if self.check_interruption():
             return
 
-        current_job = remaining_jobs[0]
+        if state.is_complete():
+            if state.is_valid() and (self.best_makespan is None or state.makespan < self.best_makespan):
+                self.best_schedule = state.schedule.copy()
+                self.best_makespan = state.makespan
+                self.report_incumbent()
+            return
 
-        for resource in self.problem_instance.resources:
-            new_schedule = schedule.copy()
-            new_schedule.append((current_job, resource))
+        for resource_index in range(len(state.resources)):
+            state.push(resource_index)
+            self.backtrack(state)
+            state.pop()
+            if self.interrupted:
+                return
 
-            new_remaining_jobs = remaining_jobs[1:]
-            self.backtrack(new_schedule, new_remaining_jobs)
+    def report_incumbent(self):
+        """Pass the incumbent, on the original resources, to the on_improvement callback."""
+        if self.on_improvement is not None:
+            schedule = self.best_schedule
+            if self.presolve_result is not None:
+                schedule = self.presolve_result.restore(schedule)
+            self.report_improvement(schedule, self.best_makespan)
 
-    def solve(self):
-        initial_schedule = []
-        remaining_jobs = self.problem_instance.jobs.copy()
+    def search_order(self):
+        """
+        Order the jobs so that every dependency is assigned before its dependents.
 
-        self.backtrack(initial_schedule, remaining_jobs)
+        This is the order ScheduleDecoder processes the problem's jobs in, so
+        the makespan tracked during the search is the decoded makespan.
+        """
+        jobs = self.search_problem.jobs
+        return [jobs[index] for index in self.search_problem.compile().order.tolist()]
 
-        if self.best_schedule:
-            self.display_schedule()
-        else:
-            print("No valid schedule found.")
-        
-        return self.best_schedule
+    def resource_classes(self):
+        """
+        Group resources into equivalence classes by capacity.
 
-    def display_schedule(self):
-        print("Optimal Schedule (Backtracking Algorithm):")
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-        job_start_times = {job.job_id: 0 for job in self.problem_instance.jobs}
+        Returns a list holding, for each resource, the index of the first
+        resource with the same capacity.
+        """
+        first_with_capacity = {}
+        return [
+            first_with_capacity.setdefault(capacity, index)
+            for index, capacity in enumerate(self.search_problem.compile().capacities.tolist())
+        ]
+
+    def interchangeable_with_previous(self, ordered_jobs):
+        """
+        Flag jobs that can swap resources with the job assigned just before them.
+
+        Two jobs are interchangeable when they have the same processing time,
+        no predecessors, and no other job depends on them. Only neighbours in
+        the search order are flagged, since swapping them leaves every start and
+        end time unchanged.
+        """
+        dependencies = set().union(*(job.predecessors for job in ordered_jobs))
+
+        def is_free(job):
+            return not job.predecessors and job.job_id not in dependencies
+
+        flags = [False] * len(ordered_jobs)
+        for index in range(1, len(ordered_jobs)):
+            previous_job, job = ordered_jobs[index - 1], ordered_jobs[index]
+            flags[index] = (is_free(previous_job) and is_free(job)
+                            and previous_job.processing_time == job.processing_time)
+        return flags
+
+    def lower_bound(self, state):
+        """
+        Return a lower bound on the makespan of any completion of a partial schedule.
+
+        The final resource end times sum to at least the time already committed
+        plus the remaining work, the longest remaining job cannot start before
+        the earliest resource becomes free, and no schedule beats the problem's
+        own lower bound.
+        """
+        depth = state.depth
+        balanced_bound = -(-(state.committed_time + self.remaining_work[depth]) // len(state.resources))
+        earliest_free_bound = min(state.resource_end) + self.longest_remaining_job[depth]
+        return max(state.makespan, balanced_bound, earliest_free_bound, self.problem_bound)
+
+    def candidates(self, state):
+        """
+        Return the (end time, resource index) pairs worth trying for the next job.
+
+        The list is sorted by end time. It is empty if the job's dependency cannot be met.
+        """
+        depth = state.depth
+        if state.blocked[depth]:
+            return []
 
-        for assignment in self.best_schedule:
-            job = assignment[0]
-            resource = assignment[1]
+        processing_time = state.jobs[depth].processing_time
+        dependency_end = state.dependency_end()
+        resource_load = state.resource_load
+        resource_end = state.resource_end
+        capacities = self.capacities
 
-            dependency_start_time = job_start_times[job.dependency] if job.dependency is not None else 0
-            start_time = max(resource_occupancy[resource.resource_id], dependency_start_time)
+        # Symmetry breaking: interchangeable neighbours take resources in
+        # non-decreasing order, and among resources of the same capacity that
+        # are in the same state only the first one is tried.
+        first_resource = 0
+        resource_classes = None
+        if self.symmetry_breaking:
+            if self.interchangeable[depth]:
+                first_resource = state.assignment[depth - 1]
+            resource_classes = self.resource_class
+            seen_states = set()
 
-            end_time = start_time + job.processing_time
+        candidates = []
+        for resource_index in range(len(capacities)):
+            if resource_classes is not None:
+                resource_state = (resource_classes[resource_index], resource_load[resource_index],
+                                  resource_end[resource_index])
+                if resource_state in seen_states:
+                    continue
+                seen_states.add(resource_state)
+            if resource_index >= first_resource and resource_load[resource_index] + processing_time <= capacities[resource_index]:
+                start_time = resource_end[resource_index]
+                if start_time < dependency_end:
+                    start_time = dependency_end
+                candidates.append((start_time + processing_time, resource_index))
+        candidates.sort()
+        return candidates
 
-            print(f"Job {job.job_id} scheduled on Resource {resource.resource_id} "
-                f"Start Time: {start_time}, End Time: {end_time}")
+    def record_incumbent(self, state):
+        self.best_schedule = state.schedule.copy()
+        self.best_makespan = state.makespan
+        self.bound = state.makespan
+        self.report_incumbent()
+
+        if self.shared_bound is not None:
+            with self.shared_bound.get_lock():
+                if self.shared_bound.value == NO_BOUND or state.makespan < self.shared_bound.value:
+                    self.shared_bound.value = state.makespan
+
+    def sync_bound(self):
+        shared = self.shared_bound.value
+        if shared != NO_BOUND and (self.bound is None or shared < self.bound):
+            self.bound = shared
+
+    def branch(self, state):
+        self.nodes_expanded += 1
+        if self.shared_bound is not None and self.nodes_expanded % self.BOUND_SYNC_INTERVAL == 0:
+            self.sync_bound()
+        if self.check_interruption():
+            return
+
+        if state.depth == len(state.jobs):
+            if self.bound is None or state.makespan < self.bound:
+                self.record_incumbent(state)
+            return
+
+        if self.bound is not None and self.lower_bound(state) >= self.bound:
+            return
 
-            resource_occupancy[resource.resource_id] = end_time
-            job_start_times[job.job_id] = end_time
\ No newline at end of file
+        for end_time, resource_index in self.candidates(state):
+            if self.bound is not None and max(state.makespan, end_time) >= self.bound:
+                break
+
+            state.push(resource_index)
+            self.branch(state)
+            state.pop()
+            if self.interrupted:
+                return
+
+    def prepare_search(self):
+        compiled = self.search_problem.compile()
+        # Once the incumbent meets this bound every remaining node is pruned.
+        self.problem_bound = self.search_problem.makespan_lower_bound()
+        self.ordered_jobs = self.search_order()
+        self.capacities = compiled.capacities.tolist()
+        ordered_times = compiled.processing_times[compiled.order].tolist()
+
+        self.remaining_work = [0] * (len(self.ordered_jobs) + 1)
+        self.longest_remaining_job = [0] * (len(self.ordered_jobs) + 1)
+        for index in range(len(self.ordered_jobs) - 1, -1, -1):
+            processing_time = ordered_times[index]
+            self.remaining_work[index] = self.remaining_work[index + 1] + processing_time
+            self.longest_remaining_job[index] = max(self.longest_remaining_job[index + 1], processing_time)
+
+        self.resource_class = self.resource_classes()
+        self.interchangeable = self.interchangeable_with_previous(self.ordered_jobs)
+
+    def branch_and_bound_search(self):
+        self.prepare_search()
+        self.branch(SearchState(self.ordered_jobs, self.search_problem.resources))
+
+    def collect_prefixes(self, state, depth, prefixes):
+        """Collect the canonical, feasible assignments of the first depth jobs."""
+        if state.depth == depth:
+            prefixes.append(tuple(state.assignment[:depth]))
+            return
+
+        for _, resource_index in self.candidates(state):
+            state.push(resource_index)
+            self.collect_prefixes(state, depth, prefixes)
+            state.pop()
+
+    def choose_split_depth(self):
+        """Return the shallowest depth that yields a few subproblems per worker."""
+        if self.split_depth is not None:
+            return min(self.split_depth, len(self.ordered_jobs))
+
+        depth, subproblems = 0, 1
+        while depth < len(self.ordered_jobs) and subproblems < self.workers * 4:
+            subproblems *= len(self.search_problem.resources)
+            depth += 1
+        return depth
+
+    def solve_subproblem(self, prefix):
+        """
+        Search every completion of a fixed assignment of the first jobs.
+
+        Returns the resource indices of the best schedule found (None if the
+        subtree holds nothing better than the shared bound), its makespan, the
+        number of nodes expanded and why the search was cut short, if it was.
+        """
+        self.best_schedule = None
+        self.best_makespan = None
+        self.nodes_expanded = 0
+        self.bound = None
+        self.sync_bound()
+
+        state = SearchState(self.ordered_jobs, self.search_problem.resources)
+        for resource_index in prefix:
+            state.push(resource_index)
+        self.branch(state)
+
+        if self.best_schedule is None:
+            return None, None, self.nodes_expanded, self.interrupted
+        resource_index = {id(resource): index for index, resource in enumerate(self.search_problem.resources)}
+        assignment = [resource_index[id(resource)] for _, resource in self.best_schedule]
+        return assignment, self.best_makespan, self.nodes_expanded, self.interrupted
+
+    def parallel_branch_and_bound_search(self):
+        """
+        Split the top of the search tree into subproblems and solve them in a process pool.
+
+        Workers share the best makespan found so far through a shared-memory
+        value, so every worker prunes against the global incumbent. Results
+        are taken as subproblems complete; ties keep the earliest subproblem,
+        so the schedule does not depend on completion order. Workers honor
+        the remaining time limit themselves and poll a shared stop event,
+        which is set as soon as the run is cancelled or stops, so running
+        subproblems end within BOUND_SYNC_INTERVAL nodes and the pool is left
+        without waiting for them.
+        """
+        self.prepare_search()
+        prefixes = []
+        self.collect_prefixes(SearchState(self.ordered_jobs, self.search_problem.resources),
+                              self.choose_split_depth(), prefixes)
+
+        shared_bound = multiprocessing.Value('q', NO_BOUND)
+        stop_event = multiprocessing.Event()
+        time_limit = None if self.time_limit is None else max(self.time_limit - self.elapsed(), 0.0)
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       initargs=(self.search_problem, self.symmetry_breaking, shared_bound,
+                                                 time_limit, stop_event))
+        best_index = None
+        try:
+            pending = {executor.submit(_solve_subproblem, prefix): index for index, prefix in enumerate(prefixes)}
+            while pending and not self.interrupted:
+                done, _ = wait(pending, timeout=self.POOL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    assignment, makespan, nodes, interrupted = future.result()
+                    self.nodes_expanded += nodes
+                    if assignment is not None and (self.best_makespan is None or (makespan, index) <
+                                                   (self.best_makespan, best_index)):
+                        self.best_makespan = makespan
+                        best_index = index
+                        self.best_schedule = [
+                            (job, self.search_problem.resources[resource_index])
+                            for job, resource_index in zip(self.ordered_jobs, assignment)
+                        ]
+                        self.report_incumbent()
+                    self.interrupted = self.interrupted or interrupted
+                self.interrupted = self.interruption() or self.interrupted
+        finally:
+            if self.interrupted:
+                stop_event.set()
+            executor.shutdown(wait=not self.interrupted, cancel_futures=True)
+        self.bound = self.best_makespan
+
+    def solve(self):
+        self.best_schedule = None
+        self.best_makespan = None
+        self.bound = None
+        self.nodes_expanded = 0
+        self.optimality_gap = None
+        self.infeasibility = None
+        self.start_clock()
+
+        self.search_problem = self.problem_instance
+        if self.presolve:
+            self.presolve_result = presolve_problem(self.problem_instance)
+            if self.presolve_result.infeasible:
+                self.infeasibility = self.presolve_result.infeasibility
+                return self.finish()
+            self.search_problem = self.presolve_result.problem
+        else:
+            self.infeasibility = self.problem_instance.bounds().infeasibility
+            if self.infeasibility:
+                return self.finish()
+
+        if self.branch_and_bound:
+            if self.search_problem.resources and self.workers > 1:
+                self.parallel_branch_and_bound_search()
+            elif self.search_problem.resources:
+                self.branch_and_bound_search()
+        else:
+            self.backtrack(SearchState(self.search_order(), self.search_problem.resources))
+
+        if self.presolve_result is not None:
+            self.best_schedule = self.presolve_result.restore(self.best_schedule)
+
+        if self.best_schedule:
+            # A search that ran to completion proves its incumbent optimal.
+            self.proven_optimal = not self.interrupted
+            self.optimality_gap = 0.0 if self.proven_optimal else self.problem_instance.optimality_gap(self.best_makespan)
+        return self.finish()
+
+    def finish(self):
+        """Build the result of the run, print it if verbose and return the best schedule."""
+        self.result = ScheduleResult(self.problem_instance, self.best_schedule, "Backtracking Algorithm",
+                                     elapsed=self.elapsed(), nodes_expanded=self.nodes_expanded,
+                                     optimality_gap=self.optimality_gap, proven_optimal=self.proven_optimal,
+                                     interrupted=self.interrupted, infeasibility=self.infeasibility)
+        if self.verbose:
+            self.display_schedule()
+        return self.best_schedule
+
+    def display_schedule(self):
+        print(self.result.render("Optimal Schedule (Backtracking Algorithm):"))
\ No newline at end of file
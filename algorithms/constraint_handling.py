@@ -0,0 +1,82 @@
+CONSTRAINT_HANDLING = ("reject", "penalty", "repair")
+MUTATIONS = ("random", "capacity_aware")
+
+
+def resource_loads(assignment, processing_times, resource_count):
+    """Return the total processing time assigned to each resource index."""
+    loads = [0] * resource_count
+    for resource, processing_time in zip(assignment, processing_times):
+        loads[resource] += processing_time
+    return loads
+
+
+def total_overload(loads, capacities):
+    """Return the processing time by which all resources together exceed their capacities."""
+    return sum(load - capacity for load, capacity in zip(loads, capacities) if load > capacity)
+
+
+def penalized_makespan(makespan, overload, total_work):
+    """
+    Grade a schedule by its capacity overload first and its makespan second.
+
+    No valid schedule finishes after total_work, the time taken to run every
+    job one after another, so weighting the overload by total_work + 1 keeps
+    every overloaded schedule worse than every valid one while still ranking
+    overloaded schedules by how far they are from valid.
+
+    Args:
+        makespan: Makespan of the schedule, capacities ignored
+        overload: Total processing time above capacity
+        total_work: Sum of all processing times of the problem
+
+    Returns:
+        int: makespan for a valid schedule, larger than total_work otherwise
+    """
+    return makespan + (total_work + 1) * overload
+
+
+def is_feasible_fitness(fitness, total_work):
+    """Return True if a fitness value belongs to a valid schedule rather than a rejected or penalized one."""
+    # A valid makespan never exceeds the time taken to run every job one after another.
+    return fitness <= total_work
+
+
+def repair_assignment(assignment, processing_times, capacities, domains):
+    """
+    Move jobs off overloaded resources until every capacity holds or no move is left.
+
+    Jobs on an overloaded resource are moved longest first, so the overload
+    is cleared with as few moves as possible, each to the resource of its
+    domain with the most room left that can still hold it.
+
+    Args:
+        assignment: Resource index of each job
+        processing_times: Processing time of each job
+        capacities: Capacity of each resource
+        domains: Resource indices each job may use
+
+    Returns:
+        list: Repaired resource index of each job (the input list if nothing was overloaded)
+    """
+    loads = resource_loads(assignment, processing_times, len(capacities))
+    overloaded = [resource for resource, load in enumerate(loads) if load > capacities[resource]]
+    if not overloaded:
+        return assignment
+
+    repaired = list(assignment)
+    for resource in overloaded:
+        jobs = sorted((index for index, assigned in enumerate(repaired) if assigned == resource),
+                      key=lambda index: -processing_times[index])
+        for index in jobs:
+            if loads[resource] <= capacities[resource]:
+                break
+            processing_time = processing_times[index]
+            target, room = None, processing_time - 1
+            for candidate in domains[index]:
+                if candidate != resource and capacities[candidate] - loads[candidate] > room:
+                    target, room = candidate, capacities[candidate] - loads[candidate]
+            if target is not None:
+                repaired[index] = target
+                loads[resource] -= processing_time
+                loads[target] += processing_time
+    return repaired
\ No newline at end of file
@@ -0,0 +1,334 @@
+import math
+import numpy as np
+from algorithms.anytime import AnytimeSolver
+from algorithms.backtracking_algorithm import BacktrackingAlgorithm
+from algorithms.list_scheduling import best_heuristic_schedule
+from algorithms.presolve import presolve as presolve_problem
+from models.schedule_result import ScheduleResult
+from utils.schedule_decoder import ScheduleDecoder
+
+try:
+    from scipy.optimize import Bounds, LinearConstraint, milp
+    from scipy.sparse import csr_array
+except ImportError:
+    milp = None
+
+BACKENDS = ("auto", "milp", "branch_and_bound")
+
+# scipy.optimize.milp status codes. Status 1 means an iteration or time limit
+# stopped the solver; it is reported as "time_limit" only when one was set.
+MILP_STATUSES = {
+    0: "optimal",
+    1: "iteration_limit",
+    2: "infeasible",
+    3: "unbounded",
+    4: "numerical_error",
+}
+
+
+class MilpModel:
+    """
+    Mixed-integer linear program of a problem.
+
+    Variables are, in order: x[j, r] = 1 if job j runs on resource r, the
+    start time s[j] of every job and the makespan. Jobs are numbered by their
+    position in the problem's job list and resources likewise.
+
+    Constraints:
+        - every job is assigned to exactly one resource
+        - the work on a resource is at most its capacity
+        - a job starts after each of its predecessors ends
+        - a resource processes its jobs in ScheduleDecoder order: if jobs i and
+          j share resource r and i is processed before j, s[j] >= s[i] + p[i]
+          (big-M switched off when they do not share it)
+        - the makespan is at least every job's end time
+
+    Starts are only bounded from below, but minimizing the makespan lets every
+    job start as early as the decoder would start it, so the optimum equals
+    the optimum over decoded schedules.
+
+    Attributes:
+        job_count (int): Number of jobs
+        resource_count (int): Number of resources
+        horizon (int): Upper bound on the makespan, used as big-M
+        c (np.ndarray): Objective coefficients
+        integrality (np.ndarray): 1 for the binary assignment variables, 0 otherwise
+        bounds (Bounds): Variable bounds
+        constraints (list): LinearConstraint blocks
+    """
+
+    def __init__(self, problem_instance, horizon):
+        """
+        Build the model.
+
+        Args:
+            problem_instance: Problem to formulate, with satisfiable dependencies
+            horizon: Makespan no optimal schedule exceeds
+        """
+        compiled = problem_instance.compile()
+        dag = compiled.dag
+        times = compiled.processing_times.astype(float)
+        capacities = compiled.capacities.astype(float)
+        job_count, resource_count = compiled.job_count, compiled.resource_count
+        self.job_count = job_count
+        self.resource_count = resource_count
+        self.horizon = horizon
+
+        assignment_count = job_count * resource_count
+        start = assignment_count
+        makespan = assignment_count + job_count
+        variable_count = makespan + 1
+
+        self.c = np.zeros(variable_count)
+        self.c[makespan] = 1.0
+        self.integrality = np.zeros(variable_count)
+        self.integrality[:assignment_count] = 1
+
+        lower = np.zeros(variable_count)
+        upper = np.full(variable_count, float(horizon))
+        upper[:assignment_count] = 1.0
+        # A job never goes to a resource too small to hold it on its own.
+        too_small = times[:, None] > capacities[None, :]
+        upper[:assignment_count][too_small.ravel()] = 0.0
+        lower[start:makespan] = dag.earliest_start
+        upper[start:makespan] = horizon - times
+        lower[makespan] = problem_instance.makespan_lower_bound()
+        self.bounds = Bounds(lower, upper)
+
+        rows, columns, values, row_lower, row_upper = [], [], [], [], []
+
+        def add_row(entries, low, high):
+            row = len(row_lower)
+            for column, value in entries:
+                rows.append(row)
+                columns.append(column)
+                values.append(value)
+            row_lower.append(low)
+            row_upper.append(high)
+
+        for job in range(job_count):
+            add_row([(job * resource_count + resource, 1.0) for resource in range(resource_count)], 1.0, 1.0)
+        for resource in range(resource_count):
+            add_row([(job * resource_count + resource, times[job]) for job in range(job_count)],
+                    -np.inf, capacities[resource])
+        for job in range(job_count):
+            for predecessor in dag.predecessors[job]:
+                add_row([(start + job, 1.0), (start + predecessor, -1.0)], times[predecessor], np.inf)
+            add_row([(makespan, 1.0), (start + job, -1.0)], times[job], np.inf)
+
+        # s[j] - s[i] - M x[i, r] - M x[j, r] >= p[i] - 2M for i processed before j.
+        order = dag.order
+        for position, later in enumerate(order):
+            for earlier in order[:position]:
+                for resource in range(resource_count):
+                    if too_small[earlier, resource] or too_small[later, resource]:
+                        continue
+                    add_row([(start + later, 1.0), (start + earlier, -1.0),
+                             (earlier * resource_count + resource, -float(horizon)),
+                             (later * resource_count + resource, -float(horizon))],
+                            times[earlier] - 2 * horizon, np.inf)
+
+        # Cuts that tighten the LP relaxation without removing any optimal schedule:
+        # a job starts no earlier than the work processed before it on its resource,
+        # the makespan is at least every resource's load, and resources of equal
+        # capacity, being interchangeable, are ordered by load.
+        for position, later in enumerate(order):
+            earlier_jobs = order[:position]
+            earlier_work = float(sum(times[earlier] for earlier in earlier_jobs))
+            if not earlier_work:
+                continue
+            for resource in range(resource_count):
+                if too_small[later, resource]:
+                    continue
+                add_row([(start + later, 1.0), (later * resource_count + resource, -earlier_work)] +
+                        [(earlier * resource_count + resource, -times[earlier]) for earlier in earlier_jobs],
+                        -earlier_work, np.inf)
+        for resource in range(resource_count):
+            add_row([(makespan, 1.0)] + [(job * resource_count + resource, -times[job]) for job in range(job_count)],
+                    0.0, np.inf)
+        for resource in range(resource_count - 1):
+            for other in range(resource + 1, resource_count):
+                if capacities[other] == capacities[resource]:
+                    add_row([(job * resource_count + resource, times[job]) for job in range(job_count)] +
+                            [(job * resource_count + other, -times[job]) for job in range(job_count)], 0.0, np.inf)
+                    break
+
+        matrix = csr_array((values, (rows, columns)), shape=(len(row_lower), variable_count))
+        self.constraints = [LinearConstraint(matrix, row_lower, row_upper)]
+
+    def assignment(self, solution):
+        """Return the resource index of each job in a solution vector."""
+        x = np.asarray(solution[:self.job_count * self.resource_count]).reshape(self.job_count, self.resource_count)
+        return x.argmax(axis=1).tolist()
+
+
+class ExactAlgorithm(AnytimeSolver):
+    """
+    Exact solver: a MILP solved with scipy.optimize.milp, or branch and bound.
+
+    With backend="auto" the MILP is used when SciPy is installed and the
+    built-in branch-and-bound search otherwise. The list-scheduling
+    heuristics provide the big-M horizon and an incumbent, so a run cut short
+    by time_limit still returns a schedule when any heuristic found one.
+    scipy.optimize.milp cannot be interrupted, so the cancel token is only
+    checked before the MILP starts; the branch-and-bound backend checks it
+    throughout its search.
+    """
+
+    def __init__(self, problem_instance, time_limit=None, mip_gap=0.0, backend="auto", presolve=True,
+                 cancel_token=None, on_improvement=None, verbose=False):
+        """
+        Initialize the solver.
+
+        Args:
+            problem_instance: Problem to solve
+            time_limit: Seconds the solver may run, None for no limit
+            mip_gap: Relative gap at which the MILP may stop as optimal enough
+            backend: "auto", "milp" or "branch_and_bound"
+            presolve: Solve the presolved problem
+            cancel_token: CancellationToken that stops the solver early
+            on_improvement: Callback fired with (schedule, makespan, elapsed seconds) on each improvement
+            verbose: Print the result at the end of every run
+
+        Raises:
+            ValueError: If the backend is unknown, or "milp" is requested without SciPy
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend must be one of {', '.join(BACKENDS)}")
+        if backend == "milp" and milp is None:
+            raise ValueError("The milp backend needs scipy.optimize.milp (SciPy 1.9 or later)")
+
+        super().__init__(time_limit, cancel_token, on_improvement, verbose)
+        self.problem_instance = problem_instance
+        self.mip_gap = mip_gap
+        self.backend = backend
+        self.presolve = presolve
+        self.presolve_result = None
+        self.best_schedule = None
+        self.best_makespan = None
+        self.optimality_gap = None
+        self.status = None
+        self.infeasibility = None
+        self.solver_used = None
+
+    def solve(self):
+        self.best_schedule = None
+        self.best_makespan = None
+        self.optimality_gap = None
+        self.status = None
+        self.infeasibility = None
+        self.start_clock()
+
+        self.solver_used = "milp" if self.backend == "milp" or (self.backend == "auto" and milp is not None) \
+            else "branch_and_bound"
+        if self.solver_used == "milp":
+            self.solve_milp()
+        else:
+            self.solve_branch_and_bound()
+
+        self.result = ScheduleResult(self.problem_instance, self.best_schedule, "Exact Algorithm",
+                                     elapsed=self.elapsed(), solver_used=self.solver_used, status=self.status,
+                                     optimality_gap=self.optimality_gap, proven_optimal=self.proven_optimal,
+                                     interrupted=self.interrupted, infeasibility=self.infeasibility)
+        if self.verbose:
+            self.display_schedule()
+        return self.best_schedule
+
+    def solve_branch_and_bound(self):
+        algorithm = BacktrackingAlgorithm(self.problem_instance, presolve=self.presolve, time_limit=self.time_limit,
+                                          cancel_token=self.cancel_token, on_improvement=self.on_improvement)
+        self.best_schedule = algorithm.solve()
+        self.best_makespan = algorithm.best_makespan
+        self.optimality_gap = algorithm.optimality_gap
+        self.presolve_result = algorithm.presolve_result
+        self.interrupted = algorithm.interrupted
+        self.proven_optimal = algorithm.proven_optimal
+        if algorithm.interrupted:
+            self.status = algorithm.interrupted
+        elif self.best_schedule is None:
+            self.status = "infeasible"
+            self.infeasibility = (self.presolve_result.infeasibility if self.presolve_result
+                                  else self.problem_instance.bounds().infeasibility)
+        else:
+            self.status = "optimal"
+
+    def solve_milp(self):
+        problem = self.problem_instance
+        if self.presolve:
+            self.presolve_result = presolve_problem(problem)
+            self.infeasibility = self.presolve_result.infeasibility
+            problem = self.presolve_result.problem
+        else:
+            self.infeasibility = problem.bounds().infeasibility
+        if self.infeasibility:
+            self.status = "infeasible"
+            return
+        if not problem.jobs or not problem.resources:
+            # Nothing to assign: the empty schedule is optimal, and the model would have no variables.
+            self.record([], 0)
+            self.finish_milp(problem, "optimal", None)
+            return
+
+        decoder = ScheduleDecoder(problem)
+        incumbent, horizon, _ = best_heuristic_schedule(problem)
+        if incumbent is None:
+            horizon = problem.compile().total_work
+        else:
+            self.record(incumbent, horizon)
+
+        self.interrupted = self.interruption()
+        if self.interrupted:
+            self.finish_milp(problem, self.interrupted, None)
+            return
+
+        model = MilpModel(problem, horizon)
+        options = {"disp": False, "mip_rel_gap": self.mip_gap}
+        if self.time_limit is not None:
+            options["time_limit"] = max(self.time_limit - self.elapsed(), 0.0)
+        result = milp(model.c, integrality=model.integrality, bounds=model.bounds,
+                      constraints=model.constraints, options=options)
+
+        if result.x is not None:
+            candidate = [(job, problem.resources[index]) for job, index in zip(problem.jobs, model.assignment(result.x))]
+            decoded = decoder.decode(candidate)
+            if decoded.feasible and (self.best_makespan is None or decoded.makespan < self.best_makespan):
+                self.record(candidate, decoded.makespan)
+
+        status = MILP_STATUSES.get(result.status, "numerical_error")
+        if status == "iteration_limit" and self.time_limit is not None:
+            status = self.interrupted = "time_limit"
+        elif status == "infeasible" and self.best_schedule is not None:
+            # A heuristic schedule proves the model feasible, so the solver went wrong numerically.
+            status = "numerical_error"
+        if status == "infeasible":
+            self.status = status
+            self.infeasibility = "the MILP has no feasible solution"
+        else:
+            self.finish_milp(problem, status, result)
+
+    def record(self, schedule, makespan):
+        """Keep a schedule of the solved problem as the incumbent, on the original resources."""
+        self.best_schedule = self.presolve_result.restore(schedule) if self.presolve_result else schedule
+        self.best_makespan = makespan
+        self.report_improvement(self.best_schedule, makespan)
+
+    def finish_milp(self, problem, status, result):
+        """Set the status and the optimality gap proven by the problem bounds and the MILP's dual bound."""
+        self.status = status
+        if self.best_schedule is None:
+            return
+        if status == "optimal" and self.mip_gap == 0:
+            self.optimality_gap = 0.0
+        else:
+            # Integer makespans let the solver's dual bound be rounded up.
+            bound = problem.makespan_lower_bound()
+            dual_bound = getattr(result, "mip_dual_bound", None)
+            if dual_bound is not None and math.isfinite(dual_bound):
+                bound = max(bound, math.ceil(dual_bound - 1e-6))
+            makespan = self.best_makespan
+            self.optimality_gap = max(makespan - bound, 0) / makespan if makespan else 0.0
+        self.proven_optimal = self.optimality_gap == 0.0
+
+    def display_schedule(self):
+        heading = "Optimal Schedule" if self.status == "optimal" else "Best Schedule"
+        print(self.result.render(f"{heading} (Exact Algorithm, {self.solver_used}):"))
\ No newline at end of file
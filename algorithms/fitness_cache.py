@@ -0,0 +1,67 @@
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """
+    Bounded least-recently-used cache of fitness values keyed by chromosome.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept, 0 disables caching
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups that had to be computed
+    """
+
+    def __init__(self, max_size=10000):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries kept (0 disables caching)
+
+        Raises:
+            ValueError: If max_size is negative
+        """
+        if max_size < 0:
+            raise ValueError("Cache size cannot be negative")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        """Return True if a chromosome is cached, without touching the counters."""
+        return key in self._entries
+
+    def get(self, key):
+        """Return the cached fitness of a chromosome, or None on a miss."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store the fitness of a chromosome, evicting the least recently used entry if full."""
+        if self.max_size == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
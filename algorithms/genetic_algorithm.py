@@ -1,145 +1,445 @@
 import random
-
-class GeneticAlgorithm:
-    def __init__(self, problem_instance, population_size=50, generations=100, crossover_prob=0.8, mutation_prob=0.2):
+import time
+import numpy as np
+from algorithms.anytime import AnytimeSolver
+from algorithms.constraint_handling import (CONSTRAINT_HANDLING, MUTATIONS, is_feasible_fitness,
+                                            penalized_makespan, repair_assignment, resource_loads,
+                                            total_overload)
+from algorithms.fitness_cache import FitnessCache
+from algorithms.list_scheduling import HEURISTICS
+from algorithms.local_search import LocalSearch
+from algorithms.presolve import presolve as presolve_problem
+from algorithms.selection import SELECTION_STRATEGIES, truncation_selection
+from algorithms.vectorized_fitness import PopulationEvaluator
+from models.schedule_result import ScheduleResult
+from utils.schedule_decoder import ScheduleDecoder
+
+class GeneticAlgorithm(AnytimeSolver):
+    def __init__(self, problem_instance, population_size=50, generations=100, crossover_prob=0.8, mutation_prob=0.2,
+                 vectorized=True, fitness_cache_size=10000, seed=None, stall_generations=None, time_limit=None,
+                 target_makespan=None, stop_at_lower_bound=True, selection="truncation", tournament_size=3,
+                 presolve=True, local_search=None, local_search_elites=2, local_search_iterations=20,
+                 seed_fraction=0.0, constraint_handling="reject", mutation="random", cancel_token=None,
+                 on_improvement=None, verbose=False):
+        if selection not in SELECTION_STRATEGIES:
+            raise ValueError(f"Selection must be one of {', '.join(SELECTION_STRATEGIES)}")
+        if constraint_handling not in CONSTRAINT_HANDLING:
+            raise ValueError(f"Constraint handling must be one of {', '.join(CONSTRAINT_HANDLING)}")
+        if mutation not in MUTATIONS:
+            raise ValueError(f"Mutation must be one of {', '.join(MUTATIONS)}")
+
+        super().__init__(time_limit, cancel_token, on_improvement, verbose)
         self.problem_instance = problem_instance
         self.population_size = population_size
         self.generations = generations
         self.crossover_prob = crossover_prob
         self.mutation_prob = mutation_prob
-        self.population = []
+        self.vectorized = vectorized
+        self.stall_generations = stall_generations
+        self.target_makespan = target_makespan
+        self.stop_at_lower_bound = stop_at_lower_bound
+        self.selection = selection
+        self.tournament_size = tournament_size
+        # Share of the initial population built by the list-scheduling heuristics.
+        self.seed_fraction = seed_fraction
+        # How capacity violations are treated: "reject" scores them inf, "penalty" grades them by
+        # their overload, "repair" moves jobs off overloaded resources before scoring.
+        self.constraint_handling = constraint_handling
+        self.mutation = mutation
+        # Without a seed the GA keeps drawing from the global random module.
+        self.random = random.Random(seed) if seed is not None else random
+        # Resource index of every job (columns) for every individual (rows).
+        self.population = np.empty((0, len(problem_instance.jobs)), dtype=np.int64)
+        self.fitness_values = []
         self.best_schedule = None
+        self.best_fitness = None
+        self.generations_run = 0
+        self.generations_since_improvement = 0
+        self.first_feasible_generation = None
+        self.first_feasible_time = None
+        self.stop_reason = None
+        self.lower_bound = None
+        self.optimality_gap = None
+        self.selection_times = []
+        # Fitness values computed rather than answered from the cache during the last run, and
+        # lookups the cache answered. The cache's own counters span every run it served.
+        self.fitness_evaluations = 0
+        self.cache_hits = 0
+        # Encodes and decodes chromosomes in both modes; only scores them when vectorized.
+        self.evaluator = PopulationEvaluator(problem_instance)
+        self.fitness_cache = FitnessCache(fitness_cache_size)
+        self.decoder = ScheduleDecoder(problem_instance)
+
+        self.compiled = problem_instance.compile()
+        self.resource_positions = self.compiled.resource_index
+        self.processing_times = self.compiled.processing_times.tolist()
+        self.capacities = self.compiled.capacities.tolist()
+        self.unsatisfiable = self.compiled.missing_dependencies > 0 or self.compiled.dag.has_cycle
+
+        # Memetic step: polish the best individuals of every generation with a local search.
+        self.local_search = None
+        self.local_search_elites = local_search_elites
+        if local_search is not None:
+            self.local_search = LocalSearch(problem_instance, strategy=local_search,
+                                            max_iterations=local_search_iterations, seed=seed)
+
+        # Presolve restricts each gene to the resources its job can use.
+        self.presolve_result = presolve_problem(problem_instance) if presolve else None
+        if self.presolve_result is not None and not self.presolve_result.infeasible:
+            self.domains = self.presolve_result.domains
+        else:
+            self.domains = [problem_instance.resources] * len(problem_instance.jobs)
+        self.domain_indices = [[self.resource_positions[resource.resource_id] for resource in domain]
+                               for domain in self.domains]
 
     def initialize_population(self):
-        for _ in range(self.population_size):
-            schedule = self.generate_random_schedule()
-            self.population.append(schedule)
+        """Replace the population with population_size new chromosomes, heuristic seeds first."""
+        chromosomes = self.heuristic_seeds()
+        for _ in range(self.population_size - len(chromosomes)):
+            chromosome = self.random_chromosome()
+            if self.constraint_handling == "repair":
+                chromosome = self.repair(chromosome)
+            chromosomes.append(chromosome)
+        self.population = self.stack(chromosomes)
+
+    def heuristic_seeds(self):
+        """
+        Return the seed_fraction share of the initial population built by list scheduling.
+
+        Each heuristic contributes its schedule once; the remaining seeds are
+        mutated copies of them, so the seeded part of the population is not
+        made of clones.
+        """
+        count = min(int(round(self.population_size * self.seed_fraction)), self.population_size)
+        if count <= 0 or not self.problem_instance.jobs:
+            return []
+
+        chromosomes = []
+        seen = set()
+        for heuristic in HEURISTICS.values():
+            schedule = heuristic(self.problem_instance)
+            if schedule is None:
+                continue
+            chromosome = self.encode([schedule])[0]
+            if chromosome.tobytes() not in seen:
+                seen.add(chromosome.tobytes())
+                chromosomes.append(chromosome)
+        if not chromosomes:
+            return []
+
+        seeds = chromosomes[:count]
+        while len(seeds) < count:
+            seeds.append(self.mutate(chromosomes[len(seeds) % len(chromosomes)]))
+        return seeds
+
+    def random_chromosome(self):
+        """Return a chromosome giving every job a random resource of its domain."""
+        return np.array([self.random.choice(indices) for indices in self.domain_indices], dtype=np.int64)
 
     def generate_random_schedule(self):
-        schedule = []
-        jobs = self.problem_instance.jobs.copy()
-
-        for job in jobs:
-            resource = random.choice(self.problem_instance.resources)
-            schedule.append((job, resource))
-
-        return schedule
+        return self.decode_chromosome(self.random_chromosome())
 
     def fitness(self, schedule):
-        if not self.is_valid_schedule(schedule):
+        decoded = self.decoder.decode(schedule)
+        if decoded.feasible:
+            return decoded.makespan
+        if self.constraint_handling != "penalty" or self.unsatisfiable:
             return float('inf')
 
-        makespan = self.calculate_makespan(schedule)
-        return makespan
+        loads = [decoded.resource_load[resource_id] for resource_id in self.compiled.resource_ids]
+        return penalized_makespan(decoded.makespan, total_overload(loads, self.capacities),
+                                  self.compiled.total_work)
 
-    def is_valid_schedule(self, schedule):
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-
-        for job, resource in schedule:
-            if resource_occupancy[resource.resource_id] + job.processing_time > resource.capacity:
-                return False
+    def is_feasible_fitness(self, fitness):
+        """Return True if a fitness value belongs to a valid schedule rather than a rejected or penalized one."""
+        return is_feasible_fitness(fitness, self.compiled.total_work)
 
-            if job.dependency is not None:
-                dependency_scheduled = False
-                for j, _ in schedule:
-                    if j.job_id == job.dependency:
-                        dependency_scheduled = True
-                        break
-                if not dependency_scheduled:
-                    return False
+    def repair(self, chromosome):
+        """Return a chromosome with jobs moved off overloaded resources where possible."""
+        assignment = chromosome.tolist()
+        repaired = repair_assignment(assignment, self.processing_times, self.capacities, self.domain_indices)
+        if repaired is assignment:
+            return chromosome
+        return np.array(repaired, dtype=np.int64)
 
-            resource_occupancy[resource.resource_id] += job.processing_time
+    def is_valid_schedule(self, schedule):
+        return self.decoder.decode(schedule).feasible
+
+    def stack(self, chromosomes):
+        """Return chromosomes as a (count, jobs) population matrix."""
+        return np.array(chromosomes, dtype=np.int64).reshape(len(chromosomes), len(self.processing_times))
+
+    def encode(self, schedules):
+        """Return (job, resource) schedules in job order as a population matrix."""
+        return self.evaluator.encode(schedules)
+
+    def decode_chromosome(self, chromosome):
+        """Return the (job, resource) schedule described by a chromosome."""
+        return self.evaluator.decode(chromosome)
+
+    def evaluate_population(self, population):
+        """
+        Return the fitness of every chromosome (row) of a population matrix.
+
+        Fitness values are memoized in fitness_cache under each row's bytes,
+        so elites and duplicate children are only scored once. In vectorized
+        mode the uncached rows are scored in a single batch. Makespans are
+        ints in both modes; invalid schedules score inf.
+        """
+        keys = [chromosome.tobytes() for chromosome in population]
+
+        fitness_values = [self.fitness_cache.get(key) for key in keys]
+        missing = [index for index, value in enumerate(fitness_values) if value is None]
+        self.cache_hits += len(keys) - len(missing)
+        if not missing:
+            return fitness_values
+
+        if self.vectorized:
+            computed = [value if value == float('inf') else int(value) for value in
+                        self.evaluator.evaluate(population[missing],
+                                                penalty=self.constraint_handling == "penalty").tolist()]
+        else:
+            computed = [self.fitness(self.decode_chromosome(population[index])) for index in missing]
 
-        return True
+        self.fitness_evaluations += len(missing)
+        for index, value in zip(missing, computed):
+            fitness_values[index] = value
+            self.fitness_cache.put(keys[index], value)
+        return fitness_values
 
     def calculate_makespan(self, schedule):
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-
-        for job, resource in schedule:
-            dependency_start_time = 0 if job.dependency is None else self.get_job_end_time(job.dependency, schedule, resource_occupancy)
-            start_time = max(resource_occupancy[resource.resource_id], dependency_start_time)
-            end_time = start_time + job.processing_time
-
-            resource_occupancy[resource.resource_id] = end_time
-
-        return max(resource_occupancy.values())
-
-    def get_job_end_time(self, job_id, schedule, resource_occupancy):
-        for job, resource in schedule:
-            if job.job_id == job_id:
-                dependency_start_time = 0 if job.dependency is None else self.get_job_end_time(job.dependency, schedule, resource_occupancy)
-                start_time = max(resource_occupancy.get(resource.resource_id, 0), dependency_start_time)
-                return start_time + job.processing_time
-        return 0
+        return self.decoder.decode(schedule).makespan
 
     def crossover(self, parent1, parent2):
+        """Return the two children of a one-point crossover of two chromosomes."""
         if len(parent1) > 1:
-            crossover_point = random.randint(1, len(parent1) - 1)
+            crossover_point = self.random.randint(1, len(parent1) - 1)
         else:
             crossover_point = 1
-        child1 = parent1[:crossover_point] + parent2[crossover_point:]
-        child2 = parent2[:crossover_point] + parent1[crossover_point:]
+        child1 = np.concatenate((parent1[:crossover_point], parent2[crossover_point:]))
+        child2 = np.concatenate((parent2[:crossover_point], parent1[crossover_point:]))
         return child1, child2
 
-    def mutate(self, schedule):
-        mutated_schedule = schedule.copy()
-        job_index = random.randint(0, len(mutated_schedule) - 1)
-        new_resource = random.choice(self.problem_instance.resources)
-        mutated_schedule[job_index] = (mutated_schedule[job_index][0], new_resource)
-        return mutated_schedule
-
-    def select_parents(self):
-        sorted_population = sorted(self.population, key=lambda x: self.fitness(x))
-        return sorted_population[:int(self.population_size * 0.2)]
+    def mutate(self, chromosome):
+        """Return a copy of a chromosome with one job moved to another resource of its domain."""
+        mutated = chromosome.copy()
+        job_index = self.random.randint(0, len(mutated) - 1)
+        if self.mutation == "capacity_aware":
+            mutated[job_index] = self.capacity_aware_resource(chromosome, job_index)
+        else:
+            mutated[job_index] = self.random.choice(self.domain_indices[job_index])
+        return mutated
+
+    def capacity_aware_resource(self, chromosome, job_index):
+        """Pick a new resource index for a job among those with room left for it, any of its domain if none has."""
+        loads = resource_loads(chromosome.tolist(), self.processing_times, len(self.capacities))
+        processing_time = self.processing_times[job_index]
+        current = chromosome[job_index]
+        fitting = [index for index in self.domain_indices[job_index]
+                   if index != current and loads[index] + processing_time <= self.capacities[index]]
+        if not fitting:
+            return self.random.choice(self.domain_indices[job_index])
+        return self.random.choice(fitting)
+
+    def select_parents(self, fitness_values=None):
+        if fitness_values is None:
+            fitness_values = self.evaluate_population(self.population)
+        select = SELECTION_STRATEGIES[self.selection]
+        selected = select(fitness_values, int(self.population_size * 0.2), self.random,
+                          tournament_size=self.tournament_size)
+        return self.population[selected]
+
+    def makespan_lower_bound(self):
+        """Return the problem's lower bound on the makespan of any schedule."""
+        return self.problem_instance.makespan_lower_bound()
+
+    def should_stop(self):
+        """Return the reason the run should stop now, or None to keep evolving."""
+        if self.best_fitness is not None and self.is_feasible_fitness(self.best_fitness):
+            if self.target_makespan is not None and self.best_fitness <= self.target_makespan:
+                return "target_makespan"
+            if self.stop_at_lower_bound and self.best_fitness <= self.lower_bound:
+                return "lower_bound"
+        if self.stall_generations is not None and self.generations_since_improvement >= self.stall_generations:
+            return "stall"
+        return self.interruption()
+
+    def get_state(self):
+        """
+        Return everything the next generations depend on, so another instance can resume the run.
+
+        Returns:
+            dict: Population, fitness values, best chromosome and fitness, generation counters and the
+            states of the GA's and the local search's random generators
+        """
+        return {
+            "population": self.population,
+            "fitness_values": self.fitness_values,
+            "best": None if self.best_schedule is None else self.encode([self.best_schedule])[0],
+            "best_fitness": self.best_fitness,
+            "generations_run": self.generations_run,
+            "generations_since_improvement": self.generations_since_improvement,
+            "first_feasible_generation": self.first_feasible_generation,
+            "random_state": self.random.getstate(),
+            "local_search_state": None if self.local_search is None else self.local_search.random.getstate(),
+        }
+
+    def set_state(self, state):
+        """Resume from a state returned by get_state(), possibly of another instance on the same problem."""
+        self.population = state["population"]
+        self.fitness_values = state["fitness_values"]
+        self.best_schedule = None if state["best"] is None else self.decode_chromosome(state["best"])
+        self.best_fitness = state["best_fitness"]
+        self.generations_run = state["generations_run"]
+        self.generations_since_improvement = state["generations_since_improvement"]
+        self.first_feasible_generation = state["first_feasible_generation"]
+        self.random.setstate(state["random_state"])
+        if self.local_search is not None:
+            self.local_search.random.setstate(state["local_search_state"])
+
+    def solve(self):
+        return self.evolve()
 
     def evolve(self):
-        self.initialize_population()
+        self.generations_run = 0
+        self.generations_since_improvement = 0
+        self.first_feasible_generation = None
+        self.first_feasible_time = None
+        self.stop_reason = None
+        self.selection_times = []
+        self.fitness_evaluations = 0
+        self.cache_hits = 0
+        self.start_clock()
+        self.lower_bound = self.makespan_lower_bound()
+
+        bounds = self.problem_instance.bounds()
+        infeasibility = self.presolve_result.infeasibility if self.presolve_result else bounds.infeasibility
+        if infeasibility:
+            self.best_schedule = None
+            self.best_fitness = float('inf')
+            self.optimality_gap = float('inf')
+            self.stop_reason = "infeasible"
+            return self.finish(infeasibility)
+        if not self.problem_instance.jobs:
+            # Nothing to evolve, and crossover and mutation need a gene to pick.
+            self.best_schedule = []
+            self.best_fitness = 0
+            self.proven_optimal = True
+            self.optimality_gap = 0.0
+            self.stop_reason = "lower_bound"
+            return self.finish()
 
-        for generation in range(self.generations):
-            parents = self.select_parents()
-            offspring = []
-
-            while len(offspring) < self.population_size - len(parents):
-                parent1, parent2 = random.sample(parents, 2)
-
-                if random.random() < self.crossover_prob:
-                    child1, child2 = self.crossover(parent1, parent2)
-                else:
-                    child1, child2 = parent1, parent2
-
-                if random.random() < self.mutation_prob:
-                    child1 = self.mutate(child1)
-
-                if random.random() < self.mutation_prob:
-                    child2 = self.mutate(child2)
-
-                offspring.extend([child1, child2])
-
-            self.population = parents + offspring
-
-            current_best_schedule = min(self.population, key=lambda x: self.fitness(x))
-
-            if self.best_schedule is None or self.fitness(current_best_schedule) < self.fitness(self.best_schedule):
-                self.best_schedule = current_best_schedule
-
-        self.display_schedule(self.best_schedule)
+        self.initialize_population()
+        self.fitness_values = self.evaluate_population(self.population)
+        self.update_best()
+
+        self.run_generations(self.generations)
+        if self.local_search is not None and self.best_schedule is not None:
+            self.polish_best()
+        if not self.is_feasible_fitness(self.best_fitness):
+            # A penalized best is still not a valid schedule.
+            self.best_fitness = float('inf')
+        self.proven_optimal = self.best_fitness <= self.lower_bound
+        self.optimality_gap = bounds.gap(self.best_fitness)
+        return self.finish()
+
+    def finish(self, infeasibility=None):
+        """Build the result of the run, print it if verbose and return the best schedule."""
+        if self.best_fitness is None or not self.is_feasible_fitness(self.best_fitness):
+            # An overloaded or penalized best is not a schedule to hand back.
+            self.best_schedule = None
+        self.result = ScheduleResult(self.problem_instance, self.best_schedule, "Genetic Algorithm",
+                                     elapsed=self.elapsed(), generations_run=self.generations_run,
+                                     stop_reason=self.stop_reason, optimality_gap=self.optimality_gap,
+                                     proven_optimal=self.proven_optimal, interrupted=self.interrupted,
+                                     infeasibility=infeasibility, fitness_evaluations=self.fitness_evaluations,
+                                     cache_hits=self.cache_hits)
+        if self.verbose:
+            self.display_schedule()
         return self.best_schedule
 
-    def display_schedule(self, schedule):
-        print("Optimal Schedule (Genetic Algorithm):")
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-        job_start_times = {job.job_id: 0 for job in self.problem_instance.jobs}
-        
-        for assignment in schedule:
-            job = assignment[0]
-            resource = assignment[1]
-
-            dependency_start_time = job_start_times[job.dependency] if job.dependency is not None else 0
-            start_time = max(resource_occupancy[resource.resource_id], dependency_start_time)
-            end_time = start_time + job.processing_time
-
-            print(f"Job {job.job_id} scheduled on Resource {resource.resource_id} "
-                f"Start Time: {start_time}, End Time: {end_time}")
-
-            resource_occupancy[resource.resource_id] = end_time
-            job_start_times[job.job_id] = end_time
\ No newline at end of file
+    def run_generations(self, count):
+        if self.start_time is None:
+            self.start_clock()
+        if self.lower_bound is None:
+            self.lower_bound = self.makespan_lower_bound()
+
+        for generation in range(count):
+            self.stop_reason = self.should_stop()
+            if self.stop_reason:
+                break
+            self.evolve_generation()
+        else:
+            self.stop_reason = self.should_stop() or "generations"
+
+        if self.stop_reason in ("time_limit", "cancelled"):
+            self.interrupted = self.stop_reason
+
+    def evolve_generation(self):
+        selection_start = time.perf_counter()
+        parents = self.select_parents(self.fitness_values)
+        self.selection_times.append(time.perf_counter() - selection_start)
+        offspring = []
+
+        while len(offspring) < self.population_size - len(parents):
+            first, second = self.random.sample(range(len(parents)), 2)
+            parent1, parent2 = parents[first], parents[second]
+
+            if self.random.random() < self.crossover_prob:
+                child1, child2 = self.crossover(parent1, parent2)
+            else:
+                child1, child2 = parent1, parent2
+
+            if self.random.random() < self.mutation_prob:
+                child1 = self.mutate(child1)
+
+            if self.random.random() < self.mutation_prob:
+                child2 = self.mutate(child2)
+
+            offspring.extend([child1, child2])
+
+        if self.constraint_handling == "repair":
+            offspring = [self.repair(child) for child in offspring]
+        self.population = np.concatenate((parents, self.stack(offspring)))
+        self.fitness_values = self.evaluate_population(self.population)
+        self.generations_run += 1
+        if self.local_search is not None:
+            self.improve_elites()
+        self.update_best()
+
+    def improve_elites(self):
+        """Replace the best individuals with their local-search improvements."""
+        for index in truncation_selection(self.fitness_values, self.local_search_elites, self.random):
+            improved = self.encode([self.local_search.improve(self.decode_chromosome(self.population[index]))])
+            fitness = self.evaluate_population(improved)[0]
+            if fitness < self.fitness_values[index]:
+                self.population[index] = improved[0]
+                self.fitness_values[index] = fitness
+
+    def polish_best(self):
+        """Run the local search once more on the best schedule found."""
+        improved = self.local_search.improve(self.best_schedule)
+        fitness = self.evaluate_population(self.encode([improved]))[0]
+        if fitness < self.best_fitness:
+            self.best_schedule = improved
+            self.best_fitness = fitness
+            self.report_improvement(self.best_schedule, self.best_fitness)
+
+    def update_best(self):
+        best_index = min(range(len(self.population)), key=lambda index: self.fitness_values[index])
+
+        if self.best_schedule is None or self.fitness_values[best_index] < self.best_fitness:
+            self.best_schedule = self.decode_chromosome(self.population[best_index])
+            self.best_fitness = self.fitness_values[best_index]
+            self.generations_since_improvement = 0
+            if self.is_feasible_fitness(self.best_fitness):
+                if self.first_feasible_generation is None:
+                    self.first_feasible_generation = self.generations_run
+                    self.first_feasible_time = self.elapsed()
+                self.report_improvement(self.best_schedule, self.best_fitness)
+        elif self.is_feasible_fitness(self.best_fitness):
+            # Only a feasible best can stall; until then the search is still looking for one.
+            self.generations_since_improvement += 1
+
+    def display_schedule(self):
+        print(self.result.render("Optimal Schedule (Genetic Algorithm):"))
\ No newline at end of file
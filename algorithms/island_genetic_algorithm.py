@@ -0,0 +1,271 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from algorithms.anytime import AnytimeSolver
+from algorithms.constraint_handling import is_feasible_fitness
+from algorithms.genetic_algorithm import GeneticAlgorithm
+from algorithms.vectorized_fitness import PopulationEvaluator
+from models.schedule_result import ScheduleResult
+
+TOPOLOGIES = ("ring", "all_to_all")
+
+_worker_runner = None
+
+
+def _init_worker(problem_instance, island_options):
+    global _worker_runner
+    _worker_runner = IslandRunner(problem_instance, island_options)
+
+
+def _run_epoch(task):
+    return _worker_runner.run_epoch(*task)
+
+
+class IslandRunner:
+    """
+    Runs epochs of independent islands, each backed by its own GeneticAlgorithm.
+
+    Islands are kept between epochs so their fitness caches survive. Everything
+    else the next generations depend on (population, best, stall counter,
+    generations run and every random state) travels with each task, so an
+    epoch gives the same result whichever process runs it.
+    """
+
+    def __init__(self, problem_instance, island_options):
+        self.problem_instance = problem_instance
+        self.island_options = island_options
+        self.islands = {}
+
+    def run_epoch(self, island_index, seed, state, generations, time_limit=None):
+        """
+        Evolve one island for a number of generations.
+
+        Args:
+            island_index: Index of the island
+            seed: Seed of the island's random generators
+            state: GeneticAlgorithm.get_state() at the end of the previous epoch, None to start the island
+            generations: Number of generations to run
+            time_limit: Seconds the epoch may run, None for no limit
+
+        Returns:
+            tuple: (island_index, island state after the epoch)
+        """
+        algorithm = self.islands.get(island_index)
+        if algorithm is None or state is None:
+            algorithm = GeneticAlgorithm(self.problem_instance, seed=seed, **self.island_options)
+            self.islands[island_index] = algorithm
+
+        if state is None:
+            algorithm.initialize_population()
+            algorithm.fitness_values = algorithm.evaluate_population(algorithm.population)
+        else:
+            algorithm.set_state(state)
+
+        algorithm.time_limit = time_limit
+        algorithm.start_clock()
+        algorithm.run_generations(generations)
+        return island_index, algorithm.get_state()
+
+
+class IslandGeneticAlgorithm(AnytimeSolver):
+    """
+    Island-model genetic algorithm running subpopulations in worker processes.
+
+    Every island evolves independently for migration_interval generations.
+    Then each island sends copies of its best individuals to its neighbours
+    over a ring or all-to-all topology, where they replace the worst
+    individuals. Each island has its own seed, so runs with the same seed are
+    reproducible whether or not they use worker processes.
+
+    The time limit is split across epochs: each epoch gets the time left, and
+    the run stops between epochs once it is spent or the cancel token is set.
+    Only valid schedules become the global best; penalized individuals keep
+    evolving on their islands but are never returned.
+    """
+
+    def __init__(self, problem_instance, islands=4, generations=100, migration_interval=10, migrants=2,
+                 topology="ring", seed=None, workers=None, parallel=True, time_limit=None, cancel_token=None,
+                 on_improvement=None, verbose=False, **island_options):
+        """
+        Initialize the island model.
+
+        Args:
+            problem_instance: Problem to solve
+            islands: Number of subpopulations
+            generations: Total number of generations per island
+            migration_interval: Generations between migrations
+            migrants: Number of individuals each island sends per migration
+            topology: "ring" or "all_to_all"
+            seed: Base seed; island i uses seed + i
+            workers: Number of worker processes (defaults to one per island)
+            parallel: Run islands in worker processes instead of in this process
+            time_limit: Seconds the whole run may take, None for no limit
+            cancel_token: CancellationToken polled between epochs
+            on_improvement: Callback fired with (schedule, makespan, elapsed seconds) on each improvement
+            verbose: Print the result at the end of every run
+            island_options: Extra GeneticAlgorithm arguments such as population_size
+
+        Raises:
+            ValueError: If the topology is unknown or a count is not positive
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topology must be one of {', '.join(TOPOLOGIES)}")
+        if islands <= 0 or migration_interval <= 0:
+            raise ValueError("Islands and migration interval must be positive")
+
+        super().__init__(time_limit, cancel_token, on_improvement, verbose)
+        self.problem_instance = problem_instance
+        self.islands = islands
+        self.generations = generations
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.workers = workers or islands
+        self.parallel = parallel
+        self.island_options = island_options
+        self.compiled = problem_instance.compile()
+        self.evaluator = PopulationEvaluator(problem_instance)
+
+        self.best_schedule = None
+        self.best_fitness = None
+        self.island_best_fitness = [None] * islands
+        self.generations_run = 0
+        self.stop_reason = None
+        self.optimality_gap = None
+
+    def island_seed(self, island_index):
+        return self.seed + island_index
+
+    def neighbours(self, island_index):
+        """Return the islands that receive migrants from an island."""
+        if self.islands == 1:
+            return []
+        if self.topology == "ring":
+            return [(island_index + 1) % self.islands]
+        return [other for other in range(self.islands) if other != island_index]
+
+    def migrate(self, chromosomes, fitness_values):
+        """Copy each island's best individuals over the worst individuals of its neighbours."""
+        outgoing = []
+        for island_index in range(self.islands):
+            ranked = sorted(range(len(chromosomes[island_index])), key=lambda index: fitness_values[island_index][index])
+            outgoing.append([(chromosomes[island_index][index].copy(), fitness_values[island_index][index])
+                             for index in ranked[:self.migrants]])
+
+        incoming = [[] for _ in range(self.islands)]
+        for island_index in range(self.islands):
+            for neighbour in self.neighbours(island_index):
+                incoming[neighbour].extend(outgoing[island_index])
+
+        for island_index, arrivals in enumerate(incoming):
+            population = chromosomes[island_index]
+            arrivals = arrivals[:max(len(population) - 1, 0)]
+            worst_first = sorted(range(len(population)), key=lambda index: fitness_values[island_index][index],
+                                 reverse=True)
+            for target, (chromosome, fitness) in zip(worst_first, arrivals):
+                population[target] = chromosome
+                fitness_values[island_index][target] = fitness
+
+    def record_best(self, chromosomes, fitness_values):
+        """Update each island's and the global best from the valid individuals of an epoch."""
+        for island_index in range(self.islands):
+            best_index = min(range(len(chromosomes[island_index])), key=lambda index: fitness_values[island_index][index])
+            fitness = fitness_values[island_index][best_index]
+            if not is_feasible_fitness(fitness, self.compiled.total_work):
+                # Rejected or penalized: the island has not found a valid schedule yet.
+                continue
+            if self.island_best_fitness[island_index] is None or fitness < self.island_best_fitness[island_index]:
+                self.island_best_fitness[island_index] = fitness
+            if self.best_fitness is None or fitness < self.best_fitness:
+                self.best_fitness = fitness
+                self.best_schedule = self.evaluator.decode(chromosomes[island_index][best_index])
+                self.report_improvement(self.best_schedule, self.best_fitness)
+
+    def should_stop(self, lower_bound):
+        """Return the reason to stop before the next epoch, or None to keep evolving."""
+        if (self.best_fitness is not None and self.island_options.get("stop_at_lower_bound", True)
+                and self.best_fitness <= lower_bound):
+            return "lower_bound"
+        return self.interruption()
+
+    def solve(self):
+        return self.evolve()
+
+    def evolve(self):
+        """Run every island, migrating between epochs, and return the global best schedule."""
+        self.best_schedule = None
+        self.best_fitness = None
+        self.island_best_fitness = [None] * self.islands
+        self.generations_run = 0
+        self.stop_reason = None
+        self.start_clock()
+
+        bounds = self.problem_instance.bounds()
+        if bounds.infeasible:
+            self.optimality_gap = float('inf')
+            self.stop_reason = "infeasible"
+            return self.finish(bounds.infeasibility)
+        if not self.problem_instance.jobs:
+            # Nothing to evolve: the empty schedule is optimal.
+            self.best_schedule = []
+            self.best_fitness = 0
+            self.proven_optimal = True
+            self.optimality_gap = 0.0
+            self.stop_reason = "lower_bound"
+            return self.finish()
+
+        lower_bound = self.problem_instance.makespan_lower_bound()
+        states = [None] * self.islands
+
+        executor = None
+        if self.parallel:
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                           initargs=(self.problem_instance, self.island_options))
+        else:
+            runner = IslandRunner(self.problem_instance, self.island_options)
+
+        try:
+            remaining = self.generations
+            while remaining > 0:
+                self.stop_reason = self.should_stop(lower_bound)
+                if self.stop_reason:
+                    break
+                epoch = min(self.migration_interval, remaining)
+                remaining -= epoch
+                time_left = None if self.time_limit is None else max(self.time_limit - self.elapsed(), 0)
+
+                tasks = [(island_index, self.island_seed(island_index), states[island_index], epoch, time_left)
+                         for island_index in range(self.islands)]
+                results = executor.map(_run_epoch, tasks) if executor else (runner.run_epoch(*task) for task in tasks)
+                for island_index, state in results:
+                    states[island_index] = state
+                    self.generations_run = max(self.generations_run, state["generations_run"])
+
+                # Migration rewrites the populations and fitness lists of the states in place.
+                chromosomes = [state["population"] for state in states]
+                fitness_values = [state["fitness_values"] for state in states]
+                self.record_best(chromosomes, fitness_values)
+                if remaining > 0:
+                    self.migrate(chromosomes, fitness_values)
+            else:
+                self.stop_reason = self.should_stop(lower_bound) or "generations"
+        finally:
+            if executor:
+                executor.shutdown()
+
+        if self.stop_reason in ("time_limit", "cancelled"):
+            self.interrupted = self.stop_reason
+        self.proven_optimal = self.best_fitness is not None and self.best_fitness <= lower_bound
+        self.optimality_gap = bounds.gap(self.best_fitness)
+        return self.finish()
+
+    def finish(self, infeasibility=None):
+        """Build the result of the run, print it if verbose and return the best schedule."""
+        self.result = ScheduleResult(self.problem_instance, self.best_schedule, "Island Genetic Algorithm",
+                                     elapsed=self.elapsed(), generations_run=self.generations_run,
+                                     stop_reason=self.stop_reason, optimality_gap=self.optimality_gap,
+                                     proven_optimal=self.proven_optimal, interrupted=self.interrupted,
+                                     infeasibility=infeasibility)
+        if self.verbose:
+            print(self.result.render("Optimal Schedule (Island Genetic Algorithm):"))
+        return self.best_schedule
\ No newline at end of file
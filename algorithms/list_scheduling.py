@@ -0,0 +1,195 @@
+import bisect
+import heapq
+from algorithms.anytime import AnytimeSolver
+from models.schedule_result import ScheduleResult
+from utils.schedule_decoder import ScheduleDecoder
+
+
+def _by_longest_first(problem_instance):
+    jobs = problem_instance.jobs
+    return sorted(range(len(jobs)), key=lambda index: -jobs[index].processing_time)
+
+
+def lpt_schedule(problem_instance):
+    """
+    Longest processing time first: give each job, longest first, to the least loaded resource it fits on.
+
+    A heap of resource loads gives the least loaded resource in O(log R), but
+    resources the job does not fit on are popped and pushed back at O(log R)
+    each, so the worst case, on tight capacities, is O(n log n + n R log R).
+
+    Returns:
+        list: (job, resource) schedule in problem job order, None if some job fits nowhere
+    """
+    jobs = problem_instance.jobs
+    resources = problem_instance.resources
+    capacities = [resource.capacity for resource in resources]
+    heap = [(0, index) for index in range(len(resources))]
+    assignment = [None] * len(jobs)
+
+    for job_index in _by_longest_first(problem_instance):
+        processing_time = jobs[job_index].processing_time
+        skipped = []
+        while heap and heap[0][0] + processing_time > capacities[heap[0][1]]:
+            skipped.append(heapq.heappop(heap))
+        if not heap:
+            return None
+        load, resource_index = heapq.heappop(heap)
+        assignment[job_index] = resource_index
+        heapq.heappush(heap, (load + processing_time, resource_index))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+
+    return [(job, resources[index]) for job, index in zip(jobs, assignment)]
+
+
+def earliest_finish_schedule(problem_instance):
+    """
+    Earliest finish time: in processing order, put each job where it would finish first.
+
+    Jobs are timed exactly as ScheduleDecoder times them, so every choice sees
+    the real start time after the job's predecessors. The resource that frees
+    up first among those with room for the job always gives the earliest
+    finish, so it is taken from a heap of resource end times. Resources
+    without room are popped and pushed back at O(log R) each, so the worst
+    case is O(n R log R + E).
+
+    Returns:
+        list: (job, resource) schedule in problem job order, None if some job fits nowhere
+    """
+    jobs = problem_instance.jobs
+    resources = problem_instance.resources
+    dag = problem_instance.dag()
+    residual = [resource.capacity for resource in resources]
+    heap = [(0, index) for index in range(len(resources))]
+    job_end = [0] * len(jobs)
+    assignment = [None] * len(jobs)
+
+    for job_index in dag.order:
+        processing_time = jobs[job_index].processing_time
+        dependency_end = max((job_end[predecessor] for predecessor in dag.predecessors[job_index]), default=0)
+
+        skipped = []
+        while heap and residual[heap[0][1]] < processing_time:
+            skipped.append(heapq.heappop(heap))
+        if not heap:
+            return None
+        resource_end, resource_index = heapq.heappop(heap)
+        end_time = max(resource_end, dependency_end) + processing_time
+
+        assignment[job_index] = resource_index
+        residual[resource_index] -= processing_time
+        job_end[job_index] = end_time
+        heapq.heappush(heap, (end_time, resource_index))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+
+    return [(job, resources[index]) for job, index in zip(jobs, assignment)]
+
+
+def best_fit_schedule(problem_instance):
+    """
+    Best fit decreasing: give each job, longest first, to the resource it leaves the least room on.
+
+    Aims for feasibility on tight capacities rather than a short makespan.
+    Binary search finds the best fit in a sorted list of residual capacities
+    in O(log R); moving the resource within the list costs O(R), so the whole
+    run is O(n log n + n R).
+
+    Returns:
+        list: (job, resource) schedule in problem job order, None if some job fits nowhere
+    """
+    jobs = problem_instance.jobs
+    resources = problem_instance.resources
+    residuals = sorted((resource.capacity, index) for index, resource in enumerate(resources))
+    assignment = [None] * len(jobs)
+
+    for job_index in _by_longest_first(problem_instance):
+        processing_time = jobs[job_index].processing_time
+        position = bisect.bisect_left(residuals, (processing_time, -1))
+        if position == len(residuals):
+            return None
+        residual, resource_index = residuals.pop(position)
+        assignment[job_index] = resource_index
+        bisect.insort(residuals, (residual - processing_time, resource_index))
+
+    return [(job, resources[index]) for job, index in zip(jobs, assignment)]
+
+
+HEURISTICS = {
+    "lpt": lpt_schedule,
+    "eft": earliest_finish_schedule,
+    "best_fit": best_fit_schedule,
+}
+
+
+def best_heuristic_schedule(problem_instance, names=None):
+    """
+    Run several heuristics and keep the valid schedule with the shortest makespan.
+
+    Args:
+        problem_instance: Problem to schedule
+        names: Heuristic names to try, every heuristic if None
+
+    Returns:
+        tuple: (schedule, makespan, heuristic name), all None if no heuristic found a valid schedule
+    """
+    decoder = ScheduleDecoder(problem_instance)
+    best = (None, None, None)
+    for name in names or HEURISTICS:
+        schedule = HEURISTICS[name](problem_instance)
+        if schedule is None:
+            continue
+        decoded = decoder.decode(schedule)
+        if decoded.feasible and (best[1] is None or decoded.makespan < best[1]):
+            best = (schedule, decoded.makespan, name)
+    return best
+
+
+class ListScheduler(AnytimeSolver):
+    """
+    Constructive solver built on the list-scheduling heuristics.
+
+    With heuristic="best" every heuristic runs and the schedule with the
+    shortest valid makespan is kept.
+    """
+
+    def __init__(self, problem_instance, heuristic="best", verbose=False):
+        """
+        Initialize the solver.
+
+        Args:
+            problem_instance: Problem to solve
+            heuristic: "lpt", "eft", "best_fit" or "best"
+            verbose: Print the result at the end of every run
+
+        Raises:
+            ValueError: If the heuristic is unknown
+        """
+        if heuristic != "best" and heuristic not in HEURISTICS:
+            raise ValueError(f"Heuristic must be one of best, {', '.join(HEURISTICS)}")
+
+        super().__init__(verbose=verbose)
+        self.problem_instance = problem_instance
+        self.heuristic = heuristic
+        self.best_schedule = None
+        self.best_makespan = None
+        self.best_heuristic = None
+
+    def solve(self):
+        self.start_clock()
+        names = None if self.heuristic == "best" else [self.heuristic]
+        self.best_schedule, self.best_makespan, self.best_heuristic = \
+            best_heuristic_schedule(self.problem_instance, names)
+        if self.best_schedule is not None:
+            self.report_improvement(self.best_schedule, self.best_makespan)
+
+        self.result = ScheduleResult(self.problem_instance, self.best_schedule, "List Scheduling",
+                                     elapsed=self.elapsed(), heuristic=self.best_heuristic,
+                                     optimality_gap=self.problem_instance.optimality_gap(self.best_makespan))
+        if self.verbose:
+            self.display_schedule()
+        return self.best_schedule
+
+    def display_schedule(self):
+        print(self.result.render(f"Schedule (List Scheduling, {self.best_heuristic}):"))
\ No newline at end of file
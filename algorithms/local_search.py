@@ -0,0 +1,360 @@
+import bisect
+import math
+import random
+from models.dag_index import DagIndex
+
+STRATEGIES = ("steepest", "first", "annealing", "tabu")
+
+
+class IncrementalSchedule:
+    """
+    Assignment of jobs to resources that scores candidate moves incrementally.
+
+    Jobs are timed exactly as ScheduleDecoder times them. Moving jobs only
+    changes the timing of jobs processed after the first moved one, so a move
+    is scored by replaying that suffix of the processing order from the
+    resource end times in force just before it. Capacity overload changes in
+    constant time per moved job.
+
+    The score of an assignment is (overload, makespan, total resource end
+    time), compared lexicographically: capacity violations are repaired first,
+    then the makespan is shortened, and the total end time breaks ties so the
+    search can make progress on resources that do not set the makespan.
+
+    Attributes:
+        jobs (list): Jobs in schedule order
+        resources (list): Resources of the problem
+        assignment (list): Resource index of each job
+        loads (list): Total processing time on each resource
+        end_times (list): End time of each job
+        position_ends (list): End time of the job at each position of the processing order
+        score (tuple): Score of the current assignment
+    """
+
+    def __init__(self, problem_instance, schedule):
+        """
+        Build the incremental state of a schedule.
+
+        Args:
+            problem_instance: Problem the schedule belongs to
+            schedule: List of (job, resource) assignments
+        """
+        self.jobs = [job for job, _ in schedule]
+        self.resources = problem_instance.resources
+        resource_index = problem_instance.compile().resource_index
+        self.assignment = [resource_index[resource.resource_id] for _, resource in schedule]
+        self.processing_times = [job.processing_time for job in self.jobs]
+        self.capacities = [resource.capacity for resource in self.resources]
+
+        dag = DagIndex(self.jobs)
+        self.satisfiable = not dag.missing and not dag.cyclic
+        self.order = dag.order
+        self.predecessors = dag.predecessors
+        self.position = [0] * len(self.jobs)
+        for position, index in enumerate(self.order):
+            self.position[index] = position
+        self.predecessor_positions = [[self.position[predecessor] for predecessor in self.predecessors[index]]
+                                      for index in self.order]
+
+        self.loads = [0] * len(self.resources)
+        for index, resource in enumerate(self.assignment):
+            self.loads[resource] += self.processing_times[index]
+        self.overload = sum(max(load - capacity, 0) for load, capacity in zip(self.loads, self.capacities))
+
+        # End times by order position, so the suffix a move retimes is one contiguous slice.
+        self.position_ends = [0] * len(self.jobs)
+        # For every resource, the order positions of its jobs and their end times.
+        self.timeline_positions = [[] for _ in self.resources]
+        self.timeline_ends = [[] for _ in self.resources]
+        self.prefix_makespan = [0] * (len(self.jobs) + 1)
+        self.retime()
+
+    def resource_ends_before(self, start):
+        """Return the end time of each resource's last job before order position start."""
+        resource_end = [0] * len(self.resources)
+        for resource, positions in enumerate(self.timeline_positions):
+            count = bisect.bisect_left(positions, start)
+            if count:
+                resource_end[resource] = self.timeline_ends[resource][count - 1]
+        return resource_end
+
+    def retime(self, start=0):
+        """Recompute the end times, the prefix tables and the score from an order position on."""
+        resource_end = [0] * len(self.resources)
+        for resource, positions in enumerate(self.timeline_positions):
+            count = bisect.bisect_left(positions, start)
+            del positions[count:]
+            del self.timeline_ends[resource][count:]
+            if count:
+                resource_end[resource] = self.timeline_ends[resource][-1]
+
+        makespan = self.prefix_makespan[start]
+        for position in range(start, len(self.order)):
+            index = self.order[position]
+            resource = self.assignment[index]
+            end_time = self.end_time(position, resource, resource_end)
+            resource_end[resource] = end_time
+            self.timeline_positions[resource].append(position)
+            self.timeline_ends[resource].append(end_time)
+            if end_time > makespan:
+                makespan = end_time
+            self.prefix_makespan[position + 1] = makespan
+
+        self.score = (self.overload, makespan, sum(resource_end))
+
+    @property
+    def end_times(self):
+        """Return the end time of each job, in schedule order."""
+        return [self.position_ends[position] for position in self.position]
+
+    def end_time(self, position, resource, resource_end):
+        """Time the job at an order position on a resource after its predecessors, record its end time and return it."""
+        position_ends = self.position_ends
+        dependency_end = 0
+        for predecessor in self.predecessor_positions[position]:
+            if position_ends[predecessor] > dependency_end:
+                dependency_end = position_ends[predecessor]
+        start_time = resource_end[resource] if resource_end[resource] > dependency_end else dependency_end
+        end_time = start_time + self.processing_times[self.order[position]]
+        position_ends[position] = end_time
+        return end_time
+
+    def overload_after(self, changes):
+        """Return the total overload after applying (job index, resource index) changes."""
+        loads = {}
+        for index, resource in changes:
+            old = self.assignment[index]
+            processing_time = self.processing_times[index]
+            loads[old] = loads.get(old, self.loads[old]) - processing_time
+            loads[resource] = loads.get(resource, self.loads[resource]) + processing_time
+        overload = self.overload
+        for resource, load in loads.items():
+            capacity = self.capacities[resource]
+            overload += max(load - capacity, 0) - max(self.loads[resource] - capacity, 0)
+        return overload
+
+    def evaluate(self, changes):
+        """
+        Return the score the assignment would have after some changes, without applying them.
+
+        Args:
+            changes: List of (job index, new resource index) pairs
+
+        Returns:
+            tuple: (overload, makespan, total resource end time)
+        """
+        overload = self.overload_after(changes)
+        start = min(self.position[index] for index, _ in changes)
+        resource_end = self.resource_ends_before(start)
+
+        # The suffix is timed in place and its old end times restored afterwards, so a candidate
+        # costs the length of the suffix rather than a copy of every end time.
+        moved = dict(changes)
+        saved = self.position_ends[start:]
+        makespan = self.prefix_makespan[start]
+        for position in range(start, len(self.order)):
+            index = self.order[position]
+            resource = moved.get(index, self.assignment[index])
+            end_time = self.end_time(position, resource, resource_end)
+            resource_end[resource] = end_time
+            if end_time > makespan:
+                makespan = end_time
+        self.position_ends[start:] = saved
+        return overload, makespan, sum(resource_end)
+
+    def apply(self, changes):
+        """Apply (job index, new resource index) changes and refresh the state."""
+        self.overload = self.overload_after(changes)
+        for index, resource in changes:
+            old = self.assignment[index]
+            self.loads[old] -= self.processing_times[index]
+            self.loads[resource] += self.processing_times[index]
+            self.assignment[index] = resource
+        self.retime(min(self.position[index] for index, _ in changes))
+
+    def schedule(self):
+        """Return the current assignment as a list of (job, resource) pairs in schedule order."""
+        return [(job, self.resources[resource]) for job, resource in zip(self.jobs, self.assignment)]
+
+
+class LocalSearch:
+    """
+    Improves a schedule by reassigning jobs, one move at a time.
+
+    The neighbourhood holds every move of one job to another resource and,
+    optionally, every swap of the resources of two jobs. Four strategies are
+    available:
+
+    - "steepest": take the best improving neighbour until none is left
+    - "first": take the first improving neighbour found in random order
+    - "annealing": simulated annealing over random neighbours
+    - "tabu": take the best neighbour not made tabu by a recent move, even if worse
+    """
+
+    def __init__(self, problem_instance, strategy="steepest", max_iterations=1000, swaps=True, seed=None,
+                 initial_temperature=2.0, cooling=0.995, tabu_tenure=7):
+        """
+        Initialize a local search.
+
+        Args:
+            problem_instance: Problem the schedules belong to
+            strategy: One of "steepest", "first", "annealing" or "tabu"
+            max_iterations: Maximum number of moves (annealing: neighbours tried)
+            swaps: Include two-job swaps in the neighbourhood
+            seed: Seed of the random generator used by "first" and "annealing"
+            initial_temperature: Starting temperature for annealing, in makespan units
+            cooling: Factor the annealing temperature is multiplied by after each neighbour
+            tabu_tenure: Number of iterations a job may not return to a resource it left
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Strategy must be one of {', '.join(STRATEGIES)}")
+
+        self.problem_instance = problem_instance
+        self.strategy = strategy
+        self.max_iterations = max_iterations
+        self.swaps = swaps
+        self.random = random.Random(seed)
+        self.initial_temperature = initial_temperature
+        self.cooling = cooling
+        self.tabu_tenure = tabu_tenure
+
+        self.iterations = 0
+        self.moves_evaluated = 0
+        self.improvements = 0
+        self.best_score = None
+
+    def neighbours(self, state):
+        """Yield every move and swap as a list of (job index, new resource index) changes."""
+        resource_count = len(state.resources)
+        for index, current in enumerate(state.assignment):
+            for resource in range(resource_count):
+                if resource != current:
+                    yield [(index, resource)]
+
+        if self.swaps:
+            assignment = state.assignment
+            for first in range(len(assignment)):
+                for second in range(first + 1, len(assignment)):
+                    if assignment[first] != assignment[second]:
+                        yield [(first, assignment[second]), (second, assignment[first])]
+
+    def random_neighbour(self, state):
+        job_count = len(state.assignment)
+        if self.swaps and job_count > 1 and self.random.random() < 0.5:
+            first, second = self.random.sample(range(job_count), 2)
+            if state.assignment[first] != state.assignment[second]:
+                return [(first, state.assignment[second]), (second, state.assignment[first])]
+        index = self.random.randrange(job_count)
+        resource = self.random.randrange(len(state.resources) - 1)
+        if resource >= state.assignment[index]:
+            resource += 1
+        return [(index, resource)]
+
+    def improve(self, schedule):
+        """
+        Return an improved copy of a schedule, in the same job order.
+
+        Schedules with missing or cyclic dependencies, or without alternative
+        resources, are returned unchanged.
+        """
+        self.iterations = 0
+        self.moves_evaluated = 0
+        self.improvements = 0
+
+        state = IncrementalSchedule(self.problem_instance, schedule)
+        self.best_score = state.score
+        if not schedule or not state.satisfiable or len(state.resources) < 2:
+            return list(schedule)
+
+        if self.strategy == "steepest":
+            self.descend(state, first_improvement=False)
+        elif self.strategy == "first":
+            self.descend(state, first_improvement=True)
+        elif self.strategy == "annealing":
+            return self.anneal(state)
+        else:
+            return self.tabu_search(state)
+
+        self.best_score = state.score
+        return state.schedule()
+
+    def descend(self, state, first_improvement):
+        while self.iterations < self.max_iterations:
+            neighbours = list(self.neighbours(state))
+            if first_improvement:
+                self.random.shuffle(neighbours)
+
+            best_changes, best_score = None, state.score
+            for changes in neighbours:
+                self.moves_evaluated += 1
+                score = state.evaluate(changes)
+                if score < best_score:
+                    best_changes, best_score = changes, score
+                    if first_improvement:
+                        break
+
+            if best_changes is None:
+                return
+            state.apply(best_changes)
+            self.iterations += 1
+            self.improvements += 1
+
+    def anneal(self, state):
+        best_schedule, best_score = state.schedule(), state.score
+        temperature = self.initial_temperature
+
+        while self.iterations < self.max_iterations:
+            self.iterations += 1
+            changes = self.random_neighbour(state)
+            self.moves_evaluated += 1
+            score = state.evaluate(changes)
+
+            # Overload is weighed like makespan so infeasible moves can still be crossed.
+            delta = (score[0] - state.score[0]) + (score[1] - state.score[1])
+            if score < state.score or (temperature > 0 and self.random.random() < math.exp(-delta / temperature)):
+                state.apply(changes)
+                if state.score < best_score:
+                    best_schedule, best_score = state.schedule(), state.score
+                    self.improvements += 1
+            temperature *= self.cooling
+
+        self.best_score = best_score
+        return best_schedule
+
+    def tabu_search(self, state):
+        best_schedule, best_score = state.schedule(), state.score
+        tabu_until = {}
+
+        while self.iterations < self.max_iterations:
+            self.iterations += 1
+            chosen, chosen_score = None, None
+            for changes in self.neighbours(state):
+                self.moves_evaluated += 1
+                score = state.evaluate(changes)
+                tabu = any(tabu_until.get((index, resource), 0) > self.iterations for index, resource in changes)
+                if tabu and not score < best_score:
+                    continue
+                if chosen_score is None or score < chosen_score:
+                    chosen, chosen_score = changes, score
+
+            if chosen is None:
+                break
+            for index, _ in chosen:
+                tabu_until[(index, state.assignment[index])] = self.iterations + self.tabu_tenure
+            state.apply(chosen)
+            if state.score < best_score:
+                best_schedule, best_score = state.schedule(), state.score
+                self.improvements += 1
+
+        self.best_score = best_score
+        return best_schedule
+
+
+def polish(problem_instance, schedule, strategy="steepest", **options):
+    """Return a schedule improved by a LocalSearch, for use after any solver."""
+    if schedule is None:
+        return None
+    return LocalSearch(problem_instance, strategy=strategy, **options).improve(schedule)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import math
+from models.resource import Resource
+from models.job_scheduling_problem import JobSchedulingProblem
+
+
+class PresolveResult:
+    """
+    Outcome of presolving a problem.
+
+    Attributes:
+        original (JobSchedulingProblem): Problem that was presolved
+        problem (JobSchedulingProblem): Reduced problem to solve, None if infeasible
+        infeasibility (Optional[str]): Why no valid schedule exists, None if none was proven
+        domains (list): Resources of the original problem each job can still use, in job order
+        forced (dict): Job id to the only resource it can use
+        removed_resources (list): Resources that cannot host any job
+        clamped_resources (list): Resources whose capacity was lowered to the work they can receive
+        resource_classes_before (int): Distinct capacities before presolve
+        resource_classes_after (int): Distinct capacities after presolve
+        search_space_before (float): log10 of the number of job-to-resource assignments before presolve
+        search_space_after (float): log10 of the number of assignments left by the job domains,
+            -inf if none is left
+    """
+
+    def __init__(self, original):
+        self.original = original
+        self.problem = None
+        self.infeasibility = None
+        self.domains = []
+        self.forced = {}
+        self.removed_resources = []
+        self.clamped_resources = []
+        self.resource_classes_before = len({resource.capacity for resource in original.resources})
+        self.resource_classes_after = self.resource_classes_before
+        # Kept as log10 sums: the counts themselves have thousands of digits on large instances.
+        if original.jobs and not original.resources:
+            self.search_space_before = -math.inf
+        else:
+            self.search_space_before = len(original.jobs) * math.log10(max(len(original.resources), 1))
+        self.search_space_after = self.search_space_before
+        self._original_resources = {}
+
+    @property
+    def infeasible(self) -> bool:
+        """Return True if presolve proved that no valid schedule exists."""
+        return self.infeasibility is not None
+
+    def reduction(self) -> float:
+        """Return how many orders of magnitude presolve cut from the search space."""
+        if self.infeasible or self.search_space_after == -math.inf:
+            return math.inf
+        # Summing logs can leave an unchanged search space a rounding error below zero.
+        return max(self.search_space_before - self.search_space_after, 0.0)
+
+    def restore(self, schedule):
+        """Map a schedule of the reduced problem back onto the original resources."""
+        if schedule is None:
+            return None
+        return [(job, self._original_resources[id(resource)]) for job, resource in schedule]
+
+    def summary(self) -> str:
+        """Return a one-line description of what presolve did."""
+        if self.infeasible:
+            return f"Presolve: infeasible ({self.infeasibility})"
+        return (f"Presolve: {len(self.forced)} forced assignments, {len(self.removed_resources)} resources removed, "
+                f"{len(self.clamped_resources)} capacities clamped, resource classes "
+                f"{self.resource_classes_before} -> {self.resource_classes_after}, "
+                f"search space reduced by 10^{self.reduction():.1f}")
+
+
+def presolve(problem_instance):
+    """
+    Reduce a problem before solving it.
+
+    Each job's domain starts as the resources large enough to hold it. A job
+    left with a single resource is fixed there, which uses up part of that
+    resource's capacity and may shrink other domains; this repeats until
+    nothing changes. Resources outside every domain are removed. Every other
+    capacity is clamped to the most work the resource could ever receive,
+    which never changes which schedules are valid but lets resources that
+    only differed in unusable capacity fall into the same symmetry class.
+
+    Args:
+        problem_instance: Problem to presolve
+
+    Returns:
+        PresolveResult: Reduced problem, proofs and statistics
+    """
+    result = PresolveResult(problem_instance)
+    jobs = problem_instance.jobs
+    resources = problem_instance.resources
+
+    bounds = problem_instance.bounds()
+    if bounds.infeasible:
+        result.infeasibility = bounds.infeasibility
+        result.search_space_after = -math.inf
+        return result
+
+    residual = [resource.capacity for resource in resources]
+    domains = [[index for index, resource in enumerate(resources) if job.processing_time <= resource.capacity]
+               for job in jobs]
+    forced = [False] * len(jobs)
+
+    changed = True
+    while changed:
+        changed = False
+        for job_index, job in enumerate(jobs):
+            domain = domains[job_index]
+            if not forced[job_index]:
+                domain = [index for index in domain if job.processing_time <= residual[index]]
+                domains[job_index] = domain
+            if not domain:
+                result.infeasibility = f"job {job.job_id} fits on no resource once forced jobs are placed"
+                result.search_space_after = -math.inf
+                return result
+            if len(domain) == 1 and not forced[job_index]:
+                forced[job_index] = True
+                residual[domain[0]] -= job.processing_time
+                if residual[domain[0]] < 0:
+                    resource = resources[domain[0]]
+                    result.infeasibility = f"jobs forced onto resource {resource.resource_id} exceed its capacity"
+                    result.search_space_after = -math.inf
+                    return result
+                changed = True
+
+    reachable_work = [0] * len(resources)
+    for job_index, job in enumerate(jobs):
+        for index in domains[job_index]:
+            reachable_work[index] += job.processing_time
+
+    kept = []
+    for index, resource in enumerate(resources):
+        if not reachable_work[index] and jobs:
+            result.removed_resources.append(resource)
+            continue
+        capacity = min(resource.capacity, reachable_work[index]) if jobs else resource.capacity
+        if capacity < resource.capacity:
+            result.clamped_resources.append(resource)
+            reduced = Resource(resource.resource_id, capacity)
+        else:
+            reduced = resource
+        result._original_resources[id(reduced)] = resource
+        kept.append(reduced)
+
+    result.domains = [[resources[index] for index in domain] for domain in domains]
+    result.forced = {job.job_id: resources[domains[job_index][0]]
+                     for job_index, job in enumerate(jobs) if forced[job_index]}
+    result.resource_classes_after = len({resource.capacity for resource in kept})
+    result.search_space_after = sum(math.log10(len(domain)) for domain in domains)
+
+    if result.removed_resources or result.clamped_resources:
+        result.problem = JobSchedulingProblem(jobs, kept)
+    else:
+        result.problem = problem_instance
+    return result
\ No newline at end of file
@@ -0,0 +1,118 @@
+from models.dag_index import DagIndex
+
+
+class SearchState:
+    """
+    Mutable partial schedule shared by every node of the backtracking search.
+
+    Jobs are assigned in a fixed order. Assigning a job with push() and
+    undoing it with pop() both take constant time, so the search never copies
+    the schedule or rebuilds the resource occupancy while descending.
+
+    Attributes:
+        jobs (list): Jobs in the order they are assigned
+        resources (list): Resources jobs can be assigned to
+        predecessor_positions (list): Positions of each job's predecessors in the job order
+        blocked (list): True for jobs whose predecessors are missing or ordered after them
+        schedule (list): Current (job, resource) assignments, in job order
+        depth (int): Number of jobs assigned so far
+        assignment (list): Resource index assigned to each job, None for unassigned jobs
+        resource_load (list): Total processing time assigned to each resource
+        resource_end (list): Time at which each resource becomes free
+        job_end (list): End time of each assigned job, 0 for unassigned jobs
+        makespan (int): Latest end time over the assigned jobs
+        committed_time (int): Sum of the resource end times
+        overloaded (int): Number of assignments that exceeded a capacity
+    """
+
+    def __init__(self, jobs, resources):
+        """
+        Initialize an empty partial schedule.
+
+        Args:
+            jobs: Jobs in the order they will be assigned
+            resources: Resources jobs can be assigned to
+        """
+        self.jobs = jobs
+        self.resources = resources
+
+        dag = DagIndex(jobs)
+        self.predecessor_positions = dag.predecessors
+        # Jobs whose predecessors are not all assigned before them can never start.
+        self.blocked = [
+            index in dag.missing or any(predecessor > index for predecessor in predecessors)
+            for index, predecessors in enumerate(dag.predecessors)
+        ]
+        self.missing_dependencies = sum(self.blocked)
+
+        self.schedule = []
+        self.depth = 0
+        self.assignment = [None] * len(jobs)
+        self.resource_load = [0] * len(resources)
+        self.resource_end = [0] * len(resources)
+        self.job_end = [0] * len(jobs)
+        self.makespan = 0
+        self.committed_time = 0
+        self.overloaded = 0
+        self._undo = []
+
+    def is_complete(self):
+        """Return True if every job has been assigned."""
+        return self.depth == len(self.jobs)
+
+    def is_valid(self):
+        """Return True if the assignments made so far respect capacities and dependencies."""
+        return self.overloaded == 0 and self.missing_dependencies == 0
+
+    def dependency_end(self):
+        """Return the latest end time of the next job's predecessors, 0 if it has none assigned."""
+        job_end = self.job_end
+        dependency_end = 0
+        for predecessor in self.predecessor_positions[self.depth]:
+            if job_end[predecessor] > dependency_end:
+                dependency_end = job_end[predecessor]
+        return dependency_end
+
+    def push(self, resource_index):
+        """Assign the next job to a resource."""
+        job_index = self.depth
+        job = self.jobs[job_index]
+        resource = self.resources[resource_index]
+        job_end = self.job_end
+        dependency_end = 0
+        for predecessor in self.predecessor_positions[job_index]:
+            if job_end[predecessor] > dependency_end:
+                dependency_end = job_end[predecessor]
+        previous_end = self.resource_end[resource_index]
+        end_time = (previous_end if previous_end > dependency_end else dependency_end) + job.processing_time
+        overloaded = self.resource_load[resource_index] + job.processing_time > resource.capacity
+
+        self._undo.append((resource_index, previous_end, self.makespan, overloaded))
+
+        self.schedule.append((job, resource))
+        self.depth += 1
+        self.resource_load[resource_index] += job.processing_time
+        self.committed_time += end_time - previous_end
+        self.resource_end[resource_index] = end_time
+        self.job_end[job_index] = end_time
+        self.assignment[job_index] = resource_index
+        if end_time > self.makespan:
+            self.makespan = end_time
+        if overloaded:
+            self.overloaded += 1
+
+    def pop(self):
+        """Undo the most recent assignment."""
+        job, _ = self.schedule.pop()
+        self.depth -= 1
+        job_index = self.depth
+        resource_index, previous_end, previous_makespan, overloaded = self._undo.pop()
+
+        self.resource_load[resource_index] -= job.processing_time
+        self.committed_time -= self.resource_end[resource_index] - previous_end
+        self.resource_end[resource_index] = previous_end
+        self.job_end[job_index] = 0
+        self.assignment[job_index] = None
+        self.makespan = previous_makespan
+        if overloaded:
+            self.overloaded -= 1
@@ -0,0 +1,92 @@
+import numpy as np
+
+
+def truncation_selection(fitness_values, count, rng, **options):
+    """
+    Select the count fittest individuals.
+
+    Runs in linear time plus O(k log k) with numpy.partition instead of
+    sorting the whole population. Ties keep population order, exactly as a
+    stable sort would.
+
+    Args:
+        fitness_values: Precomputed fitness of each individual (lower is better)
+        count: Number of parents to select
+        rng: Random generator (unused, accepted for a uniform interface)
+
+    Returns:
+        list: Indices of the selected individuals, fittest first
+    """
+    values = np.asarray(fitness_values, dtype=float)
+    count = max(min(count, len(values)), 0)
+    if count == 0:
+        return []
+    if count == len(values):
+        return np.argsort(values, kind='stable').tolist()
+
+    threshold = np.partition(values, count - 1)[count - 1]
+    below = np.flatnonzero(values < threshold)
+    tied = np.flatnonzero(values == threshold)[:count - len(below)]
+    selected = np.concatenate((below, tied))
+    return selected[np.argsort(values[selected], kind='stable')].tolist()
+
+
+def tournament_selection(fitness_values, count, rng, tournament_size=3, **options):
+    """
+    Select count parents, each the fittest of tournament_size random individuals.
+
+    Runs in O(count * tournament_size). Contestants are drawn with replacement, so
+    individuals may be selected more than once.
+
+    Args:
+        fitness_values: Precomputed fitness of each individual (lower is better)
+        count: Number of parents to select
+        rng: Random generator used to draw the contestants
+        tournament_size: Number of contestants per tournament
+
+    Returns:
+        list: Indices of the selected individuals
+    """
+    population_size = len(fitness_values)
+    draw = rng.randrange
+    selected = []
+    for _ in range(count):
+        best = draw(population_size)
+        for _ in range(tournament_size - 1):
+            contestant = draw(population_size)
+            if fitness_values[contestant] < fitness_values[best]:
+                best = contestant
+        selected.append(best)
+    return selected
+
+
+def roulette_selection(fitness_values, count, rng, **options):
+    """
+    Select count parents with probability proportional to 1 / makespan.
+
+    Runs in O(n + count log n). Invalid individuals (infinite fitness) are
+    never selected unless no individual is valid, in which case every
+    individual is equally likely.
+
+    Args:
+        fitness_values: Precomputed fitness of each individual (lower is better)
+        count: Number of parents to select
+        rng: Random generator used to spin the wheel
+
+    Returns:
+        list: Indices of the selected individuals
+    """
+    weights = [1.0 / fitness if 0 < fitness < float('inf') else 0.0 for fitness in fitness_values]
+    if any(fitness == 0 for fitness in fitness_values):
+        # A zero makespan cannot be beaten; give those individuals the whole wheel.
+        weights = [1.0 if fitness == 0 else 0.0 for fitness in fitness_values]
+    if not any(weights):
+        weights = None
+    return rng.choices(range(len(fitness_values)), weights=weights, k=count)
+
+
+SELECTION_STRATEGIES = {
+    "truncation": truncation_selection,
+    "tournament": tournament_selection,
+    "roulette": roulette_selection,
+}
\ No newline at end of file
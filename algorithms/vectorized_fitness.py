@@ -0,0 +1,95 @@
+import numpy as np
+from algorithms.constraint_handling import penalized_makespan
+
+
+class PopulationEvaluator:
+    """
+    Batched fitness evaluation for whole genetic algorithm populations.
+
+    A population is encoded as a 2-D integer array of shape
+    (population_size, n_jobs) holding, for every individual, the index of the
+    resource each job is assigned to. Jobs are in the order of the problem's
+    job list, which is the order every GeneticAlgorithm schedule keeps. Jobs
+    are timed in the same topological order as ScheduleDecoder, so fitness
+    values match GeneticAlgorithm.fitness exactly.
+
+    Attributes:
+        problem_instance (JobSchedulingProblem): Problem being solved
+        compiled (CompiledProblem): Array-backed view of the problem
+        processing_times (np.ndarray): Processing time of each job
+        capacities (np.ndarray): Capacity of each resource
+        predecessors (list): Sorted tuple of predecessor indices for each job
+        order (list): Job indices in the order ScheduleDecoder processes them
+    """
+
+    def __init__(self, problem_instance):
+        """
+        Precompute the problem data used by every evaluation.
+
+        Args:
+            problem_instance: Problem whose schedules will be evaluated
+        """
+        self.problem_instance = problem_instance
+        self.compiled = problem_instance.compile()
+
+        self.resource_index = self.compiled.resource_index
+        self.processing_times = self.compiled.processing_times
+        self.capacities = self.compiled.capacities
+        # Missing predecessors or a cycle make every schedule invalid.
+        self.unsatisfiable = self.compiled.missing_dependencies > 0 or self.compiled.dag.has_cycle
+        self.predecessors = [list(predecessors) for predecessors in self.compiled.dag.predecessors]
+        self.order = self.compiled.order.tolist()
+
+    def encode(self, population):
+        """Encode a list of (job, resource) schedules as a resource index matrix."""
+        return np.array(
+            [[self.resource_index[resource.resource_id] for _, resource in schedule] for schedule in population],
+            dtype=np.int64,
+        ).reshape(len(population), len(self.processing_times))
+
+    def decode(self, chromosome):
+        """Decode one row of a resource index matrix back into a (job, resource) schedule."""
+        resources = self.problem_instance.resources
+        return [(job, resources[index]) for job, index in zip(self.problem_instance.jobs, chromosome)]
+
+    def evaluate(self, matrix, penalty=False):
+        """
+        Compute the fitness of every individual in an encoded population.
+
+        Args:
+            matrix: Resource index matrix of shape (population_size, n_jobs)
+            penalty: Grade capacity violations with penalized_makespan instead of inf
+
+        Returns:
+            np.ndarray: Makespan of each valid individual, inf (or the penalized makespan) for invalid ones
+        """
+        population_size, job_count = matrix.shape
+        resource_count = len(self.capacities)
+        rows = np.arange(population_size)
+
+        loads = np.zeros((population_size, resource_count), dtype=np.int64)
+        np.add.at(loads, (np.repeat(rows, job_count), matrix.ravel()), np.tile(self.processing_times, population_size))
+        valid = np.all(loads <= self.capacities, axis=1)
+        if self.unsatisfiable:
+            valid[:] = False
+
+        occupancy = np.zeros((population_size, resource_count), dtype=np.int64)
+        end_times = np.zeros((population_size, job_count), dtype=np.int64)
+        for job_index in self.order:
+            columns = matrix[:, job_index]
+            start_times = occupancy[rows, columns]
+
+            predecessors = self.predecessors[job_index]
+            if len(predecessors) == 1:
+                start_times = np.maximum(start_times, end_times[:, predecessors[0]])
+            elif predecessors:
+                start_times = np.maximum(start_times, end_times[:, predecessors].max(axis=1))
+
+            end_times[:, job_index] = start_times + self.processing_times[job_index]
+            occupancy[rows, columns] = end_times[:, job_index]
+
+        makespans = occupancy.max(axis=1) if resource_count else np.zeros(population_size, dtype=np.int64)
+        if penalty and not self.unsatisfiable:
+            overload = np.maximum(loads - self.capacities, 0).sum(axis=1)
+            return penalized_makespan(makespans, overload, self.compiled.total_work).astype(float)
+        return np.where(valid, makespans.astype(float), np.inf)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Backtracking benchmark.
+
+Compares the exhaustive enumeration against the branch-and-bound search on
+random instances and reports the nodes expanded and the wall time of each.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.job_scheduling_problem import JobSchedulingProblem
+from algorithms.backtracking_algorithm import BacktrackingAlgorithm
+from utils.random_generator import RandomGenerator
+
+
+def generate_instance(job_count, resource_count):
+    """Generate a random problem instance with the default generator."""
+    jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, job_count + 1)]
+    resources = [RandomGenerator.generate_random_resource(resource_id) for resource_id in range(1, resource_count + 1)]
+    return JobSchedulingProblem(jobs, resources)
+
+
+def run_solver(problem, branch_and_bound):
+    """Solve a problem and return (makespan, nodes expanded, seconds)."""
+    algorithm = BacktrackingAlgorithm(problem, branch_and_bound=branch_and_bound)
+    start = time.perf_counter()
+    algorithm.solve()
+    elapsed = time.perf_counter() - start
+    return algorithm.best_makespan, algorithm.nodes_expanded, elapsed
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Exhaustive vs branch-and-bound backtracking benchmark")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[4, 6, 8, 9])
+    parser.add_argument('--resources', type=int, default=3)
+    parser.add_argument('--instances', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--skip-exhaustive-above', type=int, default=9,
+                        help='Only run the exhaustive search up to this many jobs')
+    args = parser.parse_args()
+
+    print(f"{'jobs':>5} {'mode':>16} {'nodes':>12} {'seconds':>10} {'same optimum':>13}")
+    for job_count in args.jobs:
+        random.seed(args.seed)
+        problems = [generate_instance(job_count, args.resources) for _ in range(args.instances)]
+
+        bnb_results = [run_solver(problem, True) for problem in problems]
+        bnb_nodes = sum(result[1] for result in bnb_results)
+        bnb_time = sum(result[2] for result in bnb_results)
+
+        if job_count <= args.skip_exhaustive_above:
+            exhaustive_results = [run_solver(problem, False) for problem in problems]
+            exhaustive_nodes = sum(result[1] for result in exhaustive_results)
+            exhaustive_time = sum(result[2] for result in exhaustive_results)
+            same = all(a[0] == b[0] for a, b in zip(exhaustive_results, bnb_results))
+            print(f"{job_count:>5} {'exhaustive':>16} {exhaustive_nodes:>12} {exhaustive_time:>10.4f} {'':>13}")
+            print(f"{job_count:>5} {'branch-and-bound':>16} {bnb_nodes:>12} {bnb_time:>10.4f} {str(same):>13}")
+        else:
+            print(f"{job_count:>5} {'branch-and-bound':>16} {bnb_nodes:>12} {bnb_time:>10.4f} {'n/a':>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+GA constraint handling benchmark.
+
+Runs the genetic algorithm with every constraint handling strategy and
+mutation operator on tight random instances and reports how often, how soon
+and how fast each finds its first valid schedule.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.job_scheduling_problem import JobSchedulingProblem
+from algorithms.constraint_handling import CONSTRAINT_HANDLING, MUTATIONS
+from algorithms.genetic_algorithm import GeneticAlgorithm
+from algorithms.presolve import presolve
+from utils.random_generator import RandomGenerator
+
+
+def generate_tight_instances(count, job_count, resource_count, utilization):
+    """
+    Generate instances with the default generator, keeping the tight ones.
+
+    An instance is kept when its jobs use at least `utilization` of the total
+    capacity and presolve does not prove it infeasible.
+    """
+    instances = []
+    while len(instances) < count:
+        jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, job_count + 1)]
+        resources = [RandomGenerator.generate_random_resource(resource_id)
+                     for resource_id in range(1, resource_count + 1)]
+        problem = JobSchedulingProblem(jobs, resources)
+        total_capacity = sum(resource.capacity for resource in resources)
+        if problem.compile().total_work >= utilization * total_capacity and not presolve(problem).infeasible:
+            instances.append(problem)
+    return instances
+
+
+def run_strategy(problems, constraint_handling, mutation, generations, seed):
+    """Return (runs with a valid schedule, first feasible generations, first feasible seconds, makespans)."""
+    found, first_generations, first_times, makespans = 0, [], [], []
+    for index, problem in enumerate(problems):
+        ga = GeneticAlgorithm(problem, generations=generations, seed=seed + index,
+                              constraint_handling=constraint_handling, mutation=mutation)
+        ga.evolve()
+        if ga.first_feasible_generation is not None:
+            found += 1
+            first_generations.append(ga.first_feasible_generation)
+            first_times.append(ga.first_feasible_time)
+            makespans.append(ga.best_fitness)
+    return found, first_generations, first_times, makespans
+
+
+def mean(values):
+    return f"{statistics.mean(values):.2f}" if values else "-"
+
+
+def main():
+    """Run the benchmark and print one row per strategy."""
+    parser = argparse.ArgumentParser(description="GA constraint handling benchmark")
+    parser.add_argument('--instances', type=int, default=20)
+    parser.add_argument('--jobs', type=int, default=16)
+    parser.add_argument('--resources', type=int, default=4)
+    parser.add_argument('--utilization', type=float, default=0.9,
+                        help='Minimum share of the total capacity the jobs must use')
+    parser.add_argument('--generations', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    problems = generate_tight_instances(args.instances, args.jobs, args.resources, args.utilization)
+
+    print(f"{'handling':>9} {'mutation':>15} {'found':>7} {'first gen':>10} {'first ms':>9} {'makespan':>9}")
+    for constraint_handling in CONSTRAINT_HANDLING:
+        for mutation in MUTATIONS:
+            found, first_generations, first_times, makespans = run_strategy(
+                problems, constraint_handling, mutation, args.generations, args.seed)
+            print(f"{constraint_handling:>9} {mutation:>15} {found:>3}/{len(problems):<3} "
+                  f"{mean(first_generations):>10} {mean([t * 1000 for t in first_times]):>9} "
+                  f"{mean(makespans):>9}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Problem representation memory benchmark.
+
+Builds a large random instance and reports the memory and time taken by the
+Job and Resource objects, the compiled array view, and a GA population held
+as (job, resource) schedules versus a resource index matrix.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.job import Job
+from models.resource import Resource
+from models.job_scheduling_problem import JobSchedulingProblem
+from algorithms.genetic_algorithm import GeneticAlgorithm
+
+
+def measure(build):
+    """Return (result, bytes allocated, seconds) for a zero-argument callable."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, allocated, elapsed
+
+
+def timed(run):
+    """Return the seconds a zero-argument callable takes, without tracing allocations."""
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def generate_instance(job_count, resource_count):
+    """Generate a random instance with sparse dependencies and capacities that fit the work."""
+    jobs = [
+        Job(job_id, random.randint(1, 10), random.randint(1, job_id - 1) if job_id > 1 and random.random() < 0.3 else None)
+        for job_id in range(1, job_count + 1)
+    ]
+    capacity = job_count * 10 // resource_count + 10
+    resources = [Resource(resource_id, capacity) for resource_id in range(1, resource_count + 1)]
+    return JobSchedulingProblem(jobs, resources)
+
+
+def main():
+    """Run the benchmark and print one line per measurement."""
+    parser = argparse.ArgumentParser(description="Problem representation memory benchmark")
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--resources', type=int, default=16)
+    parser.add_argument('--population', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    problem, problem_bytes, problem_seconds = measure(lambda: generate_instance(args.jobs, args.resources))
+    compiled, compiled_bytes, compiled_seconds = measure(problem.compile)
+
+    algorithm = GeneticAlgorithm(problem, population_size=args.population, vectorized=True, seed=args.seed)
+    population, population_bytes, population_seconds = measure(
+        lambda: [algorithm.generate_random_schedule() for _ in range(args.population)])
+    matrix, matrix_bytes, matrix_seconds = measure(lambda: algorithm.evaluator.encode(population))
+
+    scalar_seconds = timed(lambda: [algorithm.fitness(schedule) for schedule in population])
+    batch_seconds = timed(lambda: algorithm.evaluator.evaluate(matrix))
+
+    print("Times of allocation rows include tracemalloc overhead.")
+    print(f"{'measurement':<34} {'MiB':>10} {'seconds':>10}")
+    rows = [
+        (f"{args.jobs} jobs + {args.resources} resources", problem_bytes, problem_seconds),
+        ("compiled view", compiled_bytes, compiled_seconds),
+        (f"population of {args.population} schedules", population_bytes, population_seconds),
+        (f"population as {matrix.dtype} matrix", matrix_bytes, matrix_seconds),
+        ("scalar fitness of population", 0, scalar_seconds),
+        ("batched fitness of population", 0, batch_seconds),
+    ]
+    for name, allocated, elapsed in rows:
+        print(f"{name:<34} {allocated / 2 ** 20:>10.2f} {elapsed:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
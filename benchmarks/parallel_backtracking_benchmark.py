@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Parallel backtracking scaling benchmark.
+
+Solves the same random instances with the branch-and-bound search using an
+increasing number of worker processes and reports wall time and speedup.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.resource import Resource
+from models.job_scheduling_problem import JobSchedulingProblem
+from algorithms.backtracking_algorithm import BacktrackingAlgorithm
+from utils.random_generator import RandomGenerator
+
+
+def generate_instance(job_count, resource_count, capacity_scale):
+    """Generate a random instance whose capacities are scaled to keep it feasible."""
+    jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, job_count + 1)]
+    resources = [
+        Resource(resource.resource_id, resource.capacity * capacity_scale)
+        for resource in (RandomGenerator.generate_random_resource(resource_id)
+                         for resource_id in range(1, resource_count + 1))
+    ]
+    return JobSchedulingProblem(jobs, resources)
+
+
+def main():
+    """Run the benchmark and print a scaling table."""
+    parser = argparse.ArgumentParser(description="Parallel branch-and-bound scaling benchmark")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--jobs', type=int, default=14)
+    parser.add_argument('--resources', type=int, default=4)
+    parser.add_argument('--capacity-scale', type=int, default=3)
+    parser.add_argument('--instances', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    problems = [generate_instance(args.jobs, args.resources, args.capacity_scale) for _ in range(args.instances)]
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>8} {'nodes':>12} {'seconds':>10} {'speedup':>8} {'makespans'}")
+    baseline = None
+    for workers in args.workers:
+        nodes = 0
+        makespans = []
+        start = time.perf_counter()
+        for problem in problems:
+            algorithm = BacktrackingAlgorithm(problem, workers=workers)
+            algorithm.solve()
+            nodes += algorithm.nodes_expanded
+            makespans.append(algorithm.best_makespan)
+        elapsed = time.perf_counter() - start
+
+        if baseline is None:
+            baseline = elapsed
+        print(f"{workers:>8} {nodes:>12} {elapsed:>10.3f} {baseline / elapsed:>8.2f} {makespans}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Standard benchmark suite.
+
+Sweeps the backtracking algorithm over job and resource counts and the
+genetic algorithm over job counts, population sizes and generations. Each
+point solves a seeded family of instances and records wall time, peak memory
+and solution quality: the makespan divided by the optimum where a short
+branch-and-bound run proves one, or by the lower bound otherwise. Results can
+be saved as a baseline and later runs compared to it, flagging points whose
+time, memory or quality got worse by more than a threshold.
+
+Run with `python -m benchmarks.suite`; `--save-baseline` and `--baseline`
+take a JSON path. The exit status is 1 when a regression is flagged.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.backtracking_algorithm import BacktrackingAlgorithm
+from algorithms.genetic_algorithm import GeneticAlgorithm
+from utils.instance_generator import DAG_SHAPES, InstanceGenerator
+from utils.instrumentation import profile_solver, summarize
+
+# Metrics compared against the baseline; a larger value is worse for each of them.
+REGRESSION_METRICS = ("wall_time_median", "peak_memory", "quality")
+
+
+def reference_makespan(problem, max_exact_jobs, time_limit):
+    """
+    Return (reference makespan, "optimum" or "lower_bound") of an instance.
+
+    The optimum is only searched for up to max_exact_jobs jobs, and only
+    used when branch and bound proves it within time_limit seconds.
+    """
+    if len(problem.jobs) <= max_exact_jobs:
+        algorithm = BacktrackingAlgorithm(problem, time_limit=time_limit)
+        algorithm.solve()
+        if algorithm.proven_optimal:
+            return algorithm.best_makespan, "optimum"
+    return problem.makespan_lower_bound(), "lower_bound"
+
+
+def benchmark_point(solver, make_solver, problems, references, repeats, warmup, **point):
+    """
+    Profile one solver configuration on every instance of a point and return its result row.
+
+    Args:
+        solver: Name of the solver
+        make_solver: Callable building the solver for (problem, instance index)
+        problems: Instances of the point
+        references: (reference makespan, kind) of each instance
+        repeats: Timed runs per instance
+        warmup: Untimed runs per instance
+        **point: Parameters identifying the point, such as jobs, resources and the instance family
+
+    Returns:
+        dict: The point's parameters and metrics
+    """
+    wall_times, peak_memory, qualities, found, interrupted = [], 0, [], 0, 0
+    for index, (problem, (reference, _)) in enumerate(zip(problems, references)):
+        profile = profile_solver(lambda: make_solver(problem, index), repeats=repeats, warmup=warmup)
+        wall_times.append(profile.summary()['wall_time_median'])
+        peak_memory = max(peak_memory, profile.peak_memory)
+        if profile.result.stats.get('interrupted'):
+            interrupted += 1
+        if profile.result.found and profile.result.feasible:
+            found += 1
+            qualities.append(profile.result.makespan / reference if reference else 1.0)
+
+    kinds = {kind for _, kind in references}
+    wall_time = summarize(wall_times)
+    row = {"key": "/".join([solver] + [f"{name}={value}" for name, value in point.items()]), "solver": solver}
+    row.update(point)
+    row.update({
+        "instances": len(problems),
+        "wall_time_median": wall_time["median"],
+        "wall_time_p95": wall_time["p95"],
+        "peak_memory": peak_memory,
+        "quality": statistics.mean(qualities) if qualities else None,
+        "found": found,
+        "interrupted": interrupted,
+        "reference": kinds.pop() if len(kinds) == 1 else "mixed",
+    })
+    return row
+
+
+def run_suite(args):
+    """Run every point of the sweep and return the result rows."""
+    rows = []
+    families = {}
+    # Part of every point's key, so a baseline only matches runs on the same instances.
+    family = {"dag": args.dag, "tightness": args.tightness, "seed": args.seed, "instances": args.instances}
+
+    def instances(job_count, resource_count):
+        if (job_count, resource_count) not in families:
+            generator = InstanceGenerator(jobs=job_count, resources=resource_count, dag=args.dag,
+                                          tightness=args.tightness, seed=args.seed)
+            problems = generator.family(args.instances)
+            references = [reference_makespan(problem, args.max_exact_jobs, args.reference_time_limit)
+                          for problem in problems]
+            families[job_count, resource_count] = problems, references
+        return families[job_count, resource_count]
+
+    for job_count in args.backtracking_jobs:
+        for resource_count in args.resources:
+            problems, references = instances(job_count, resource_count)
+            rows.append(benchmark_point(
+                "backtracking",
+                lambda problem, index: BacktrackingAlgorithm(problem, time_limit=args.time_limit),
+                problems, references, args.repeats, args.warmup, jobs=job_count, resources=resource_count,
+                **family))
+
+    for job_count in args.genetic_jobs:
+        for resource_count in args.resources:
+            problems, references = instances(job_count, resource_count)
+            for population_size in args.populations:
+                for generations in args.generations:
+                    rows.append(benchmark_point(
+                        "genetic",
+                        lambda problem, index: GeneticAlgorithm(problem, population_size=population_size,
+                                                                generations=generations, seed=args.seed + index,
+                                                                time_limit=args.time_limit),
+                        problems, references, args.repeats, args.warmup, jobs=job_count, resources=resource_count,
+                        population=population_size, generations=generations, **family))
+    return rows
+
+
+def find_regressions(rows, baseline, threshold, min_time, quality_threshold):
+    """
+    Compare result rows to a baseline and return the regressions.
+
+    A metric regresses when it exceeds the baseline value by more than a
+    relative threshold: quality_threshold for the quality ratio, which is
+    deterministic for seeded runs, and threshold for time and memory. Wall
+    times below min_time seconds in the baseline are too noisy to compare
+    and are skipped. A point that finds fewer schedules also regresses.
+    Points whose key, which includes the instance family, is not in the
+    baseline are not compared.
+
+    Args:
+        rows: Result rows of this run
+        baseline: Result rows of the baseline run, keyed by point key
+        threshold: Allowed relative increase of time and memory
+        min_time: Smallest baseline wall time that is compared
+        quality_threshold: Allowed relative increase of the quality ratio
+
+    Returns:
+        list: (key, metric, baseline value, new value) of every regression
+    """
+    regressions = []
+    for row in rows:
+        previous = baseline.get(row["key"])
+        if previous is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = previous.get(metric), row.get(metric)
+            if old is None:
+                continue
+            if new is None:
+                regressions.append((row["key"], metric, old, new))
+            elif metric == "wall_time_median" and old < min_time:
+                continue
+            elif new > old * (1 + (quality_threshold if metric == "quality" else threshold)):
+                regressions.append((row["key"], metric, old, new))
+        if row["found"] < previous.get("found", 0):
+            regressions.append((row["key"], "found", previous["found"], row["found"]))
+    return regressions
+
+
+def format_row(row, width=60):
+    quality = f"{row['quality']:.3f}" if row["quality"] is not None else "-"
+    return (f"{row['key']:<{width}} {row['wall_time_median'] * 1000:>10.2f} {row['wall_time_p95'] * 1000:>10.2f} "
+            f"{row['peak_memory'] / 1024:>10.1f} {quality:>8} {row['found']:>3}/{row['instances']:<3} "
+            f"{row['interrupted']:>5} {row['reference']:>12}")
+
+
+def main(argv=None):
+    """Run the suite, print one row per point and compare to a baseline if given."""
+    parser = argparse.ArgumentParser(description="Standard benchmark suite for both solvers")
+    parser.add_argument('--backtracking-jobs', type=int, nargs='*', default=[8, 12, 16, 20, 24])
+    parser.add_argument('--genetic-jobs', type=int, nargs='*', default=[10, 50, 200])
+    parser.add_argument('--resources', type=int, nargs='+', default=[3])
+    parser.add_argument('--populations', type=int, nargs='+', default=[20, 50])
+    parser.add_argument('--generations', type=int, nargs='+', default=[50, 100])
+    parser.add_argument('--instances', type=int, default=3, help='Instances per point')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed runs per instance')
+    parser.add_argument('--warmup', type=int, default=0, help='Untimed runs per instance')
+    parser.add_argument('--dag', choices=DAG_SHAPES, default='layered', help='DAG shape of the instances')
+    parser.add_argument('--tightness', type=float, default=None,
+                        help='Share of the total capacity the jobs use (default: random capacities of 3-20)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--time-limit', type=float, default=2.0,
+                        help='Seconds a solver may spend on one instance; runs that hit it are counted')
+    parser.add_argument('--max-exact-jobs', type=int, default=12,
+                        help='Largest instance whose optimum is searched for as the quality reference')
+    parser.add_argument('--reference-time-limit', type=float, default=2.0,
+                        help='Seconds the optimum search may take before the lower bound is used')
+    parser.add_argument('--baseline', help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', help='Write the results to this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative increase of wall time or memory that counts as a regression')
+    parser.add_argument('--quality-threshold', type=float, default=0.02,
+                        help='Relative increase of the quality ratio that counts as a regression')
+    parser.add_argument('--min-time', type=float, default=0.001,
+                        help='Baseline wall times below this many seconds are not compared')
+    args = parser.parse_args(argv)
+
+    rows = run_suite(args)
+
+    width = max([60] + [len(row["key"]) for row in rows])
+    print(f"{'point':<{width}} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10} {'quality':>8} {'found':>7} "
+          f"{'stops':>5} {'reference':>12}")
+    for row in rows:
+        print(format_row(row, width))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            json.dump({row["key"]: row for row in rows}, file, indent=2)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = find_regressions(rows, baseline, args.threshold, args.min_time, args.quality_threshold)
+        unmatched = sum(row["key"] not in baseline for row in rows)
+        print(f"\n{len(regressions)} regression(s) against {args.baseline} (threshold {args.threshold:.0%})")
+        if unmatched:
+            print(f"  {unmatched} point(s) not in the baseline, which may use other instances, were not compared")
+        for key, metric, old, new in regressions:
+            print(f"  REGRESSION {key} {metric}: {old} -> {new}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
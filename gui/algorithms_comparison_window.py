@@ -1,16 +1,24 @@
 import tkinter as tk
-from tkinter import ttk
-from models.resource import Resource
-from models.job import Job
-from models.job_scheduling_problem import JobSchedulingProblem
+from tkinter import ttk, messagebox
+from utils.instance_generator import InstanceGenerator
 from utils.scheduler_evaluator import SchedulerEvaluator
-from utils.random_generator import RandomGenerator
 
 class AlgorithmComparisonWindow:
     def __init__(self, master):
         self.master = master
         master.title("Algorithm Comparison")
 
+        self.settings_frame = tk.Frame(master)
+        self.settings_frame.pack(pady=10)
+        self.setting_entries = {}
+        for column, (name, default) in enumerate((("Instances", "5"), ("Jobs", "5"), ("Resources", "3"),
+                                                  ("Seed", ""))):
+            tk.Label(self.settings_frame, text=f"{name}:").grid(row=0, column=2 * column, padx=(10, 2))
+            entry = tk.Entry(self.settings_frame, width=6)
+            entry.insert(0, default)
+            entry.grid(row=0, column=2 * column + 1)
+            self.setting_entries[name] = entry
+
         self.random_button = tk.Button(master, text="Random", command=self.run_comparison)
         self.random_button.pack(pady=10)
 
@@ -28,25 +36,43 @@ class AlgorithmComparisonWindow:
 
         self.instances_scrollbar.config(command=self.instances_text.yview)
 
+    def read_settings(self):
+        """Return (instance count, InstanceGenerator) from the settings fields, None if a field is invalid."""
+        try:
+            instance_count = int(self.setting_entries["Instances"].get())
+            seed_text = self.setting_entries["Seed"].get().strip()
+            generator = InstanceGenerator(jobs=int(self.setting_entries["Jobs"].get()),
+                                          resources=int(self.setting_entries["Resources"].get()),
+                                          seed=int(seed_text) if seed_text else None)
+            if instance_count <= 0:
+                raise ValueError("Instances must be positive")
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter positive whole numbers for the settings.")
+            return None
+        return instance_count, generator
+
     def run_comparison(self):
+        settings = self.read_settings()
+        if settings is None:
+            return
+        instance_count, generator = settings
+
         instances = []
         total_backtracking = 0
         total_genetic = 0
         total_backtracking_time = 0
         total_genetic_time = 0
+        gaps = []
 
-        instances_text = "Random Instances:\n"
-        for instance_id in range(1, 6):
-            jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 6)]
-            resources = [RandomGenerator.generate_random_resource(resource_id) for resource_id in range(1, 4)]
-
-            problem_instance = JobSchedulingProblem(jobs, resources)
+        instances_text = f"Random Instances (seed {generator.seed}):\n"
+        for instance_id in range(1, instance_count + 1):
+            problem_instance = generator.instance(instance_id - 1)
             instances.append(problem_instance)
 
             instances_text += f"Instance {instance_id}:\n"
-            for job in jobs:
-                instances_text += f"  Job {job.job_id}: Processing Time {job.processing_time}, Dependency {job.dependency}\n"
-            for resource in resources:
+            for job in problem_instance.jobs:
+                instances_text += f"  Job {job.job_id}: Processing Time {job.processing_time}, Dependency {job.describe_dependencies()}\n"
+            for resource in problem_instance.resources:
                 instances_text += f"  Resource {resource.resource_id}: Capacity {resource.capacity}\n"
             instances_text += "\n"
 
@@ -56,13 +82,15 @@ class AlgorithmComparisonWindow:
         for instance in instances:
             evaluator = SchedulerEvaluator(instance)
             evaluator.run_algorithms()
-            comparison_results, avg_backtracking_time, avg_genetic_time = evaluator.evaluate_performance()
+            comparisons, avg_backtracking_time, avg_genetic_time = evaluator.evaluate_performance()
 
-            for result in comparison_results:
-                if result == 0:
+            for comparison in comparisons:
+                if comparison.winner == "backtracking":
                     total_backtracking += 1
-                elif result == 1:
+                elif comparison.winner == "genetic":
                     total_genetic += 1
+                if comparison.gap is not None:
+                    gaps.append(comparison.gap)
 
             total_backtracking_time += avg_backtracking_time
             total_genetic_time += avg_genetic_time
@@ -80,6 +108,8 @@ class AlgorithmComparisonWindow:
 
         result_label_text += f"\nAvg Backtracking Time: {avg_backtracking_time:.6f} seconds"
         result_label_text += f"\nAvg Genetic Time: {avg_genetic_time:.6f} seconds"
+        if gaps:
+            result_label_text += f"\nAvg Genetic Makespan Gap: {sum(gaps) / len(gaps):.1%}"
 
         self.result_label.config(text=result_label_text)
         self.instances_text.delete(1.0, tk.END)
@@ -22,7 +22,7 @@ class MainWindow:
         self.job_time_entry = tk.Entry(root)
         self.job_time_entry.grid(row=0, column=1)
 
-        self.dependency_label = tk.Label(root, text="Dependency:")
+        self.dependency_label = tk.Label(root, text="Dependencies:")
         self.dependency_label.grid(row=0, column=2)
         self.dependency_entry = tk.Entry(root)
         self.dependency_entry.grid(row=0, column=3)
@@ -85,16 +85,16 @@ class MainWindow:
                 return
             
             dependency_text = self.dependency_entry.get().strip()
-            dependency = None
-            if dependency_text:
-                dependency = int(dependency_text)
+            dependencies = [int(part) for part in dependency_text.split(",") if part.strip()]
+            for dependency in dependencies:
                 if dependency <= 0 or dependency >= self.job_id_counter:
                     messagebox.showerror("Invalid Input", f"Dependency must be between 1 and {self.job_id_counter - 1}.")
                     return
 
-            job = Job(self.job_id_counter, job_time, dependency)
+            job = Job(self.job_id_counter, job_time, predecessors=dependencies)
             self.jobs.append(job)
-            self.jobs_listbox.insert(tk.END, f"Job {self.job_id_counter}: Time={job_time}, Dependency={dependency}")
+            self.jobs_listbox.insert(tk.END, f"Job {self.job_id_counter}: Time={job_time}, "
+                                             f"Dependency={', '.join(map(str, sorted(job.predecessors))) or None}")
             self.job_id_counter += 1
 
             self.job_time_entry.delete(0, tk.END)
@@ -138,11 +138,7 @@ class MainWindow:
             problem_instance = JobSchedulingProblem(self.jobs, self.resources)
             algorithm = algorithm_class(problem_instance)
 
-            if algorithm_class == GeneticAlgorithm:
-                algorithm.initialize_population()
-                algorithm.evolve()
-            else:
-                algorithm.solve()
+            algorithm.solve()
 
             result_root = tk.Tk()
             result_window = ResultWindow(result_root, algorithm, problem_instance)
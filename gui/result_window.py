@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from utils.schedule_decoder import ScheduleDecoder
 
 class ResultWindow:
     def __init__(self, master, algorithm, problem_instance):
@@ -46,8 +47,8 @@ class ResultWindow:
         
         result_text += "Jobs:\n"
         for job in self.problem_instance.jobs:
-            dependency_str = f"Job {job.dependency}" if job.dependency else "None"
-            result_text += f"  Job {job.job_id}: Processing Time = {job.processing_time}, Dependency = {dependency_str}\n"
+            result_text += (f"  Job {job.job_id}: Processing Time = {job.processing_time}, "
+                            f"Dependency = {job.describe_dependencies()}\n")
         
         result_text += "\nResources:\n"
         for resource in self.problem_instance.resources:
@@ -58,12 +59,9 @@ class ResultWindow:
         result_text += "=" * 60 + "\n\n"
         
         if self.algorithm:
-            if hasattr(self.algorithm, 'evolve'):
-                best_schedule = self.algorithm.best_schedule
-            else:
-                best_schedule = self.algorithm.best_schedule if self.algorithm.best_schedule else self.algorithm.solve()
+            result = self.algorithm.result if self.algorithm.result is not None else self.algorithm.run()
             
-            result_text += self.format_schedule(best_schedule)
+            result_text += self.format_schedule(list(result.schedule) if result.found else None)
         else:
             result_text += "No algorithm instance provided.\n"
         
@@ -76,31 +74,19 @@ class ResultWindow:
         
         schedule_text = "Optimal Schedule:\n\n"
         
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-        job_start_times = {job.job_id: 0 for job in self.problem_instance.jobs}
+        decoded = ScheduleDecoder(self.problem_instance).decode(schedule)
+        resource_occupancy = decoded.resource_end
+        total_makespan = decoded.makespan
         
-        total_makespan = 0
-        
-        for assignment in schedule:
-            job = assignment[0]
-            resource = assignment[1]
-            
-            dependency_start_time = 0
-            if job.dependency is not None:
-                dependency_start_time = job_start_times.get(job.dependency, 0)
-            
-            start_time = max(resource_occupancy[resource.resource_id], dependency_start_time)
-            end_time = start_time + job.processing_time
+        for job, resource in decoded.assignments:
+            start_time = decoded.start_times[job.job_id]
+            end_time = decoded.end_times[job.job_id]
             
             schedule_text += f"Job {job.job_id} → Resource {resource.resource_id}\n"
             schedule_text += f"  Start Time: {start_time}, End Time: {end_time}, Duration: {job.processing_time}\n"
-            if job.dependency:
-                schedule_text += f"  Dependency: Job {job.dependency}\n"
+            if job.predecessors:
+                schedule_text += f"  Dependency: {job.describe_dependencies()}\n"
             schedule_text += "\n"
-            
-            resource_occupancy[resource.resource_id] = end_time
-            job_start_times[job.job_id] = end_time
-            total_makespan = max(total_makespan, end_time)
         
         schedule_text += f"PERFORMANCE METRICS:\n"
         schedule_text += f"Total Makespan: {total_makespan}\n\n"
@@ -15,55 +15,85 @@ from models.job import Job
 from models.job_scheduling_problem import JobSchedulingProblem
 from algorithms.backtracking_algorithm import BacktrackingAlgorithm
 from algorithms.genetic_algorithm import GeneticAlgorithm
-from utils.random_generator import RandomGenerator
+from utils.batch_evaluator import BatchEvaluator
+from utils.instance_generator import DAG_SHAPES, DURATIONS, InstanceGenerator
 from utils.scheduler_evaluator import SchedulerEvaluator
 
 
-def run_cli_comparison():
-    """Run algorithm comparison via command line interface."""
+def run_cli_comparison(instance_count=5, workers=None, timeout=None, generator=None):
+    """
+    Run algorithm comparison via command line interface.
+
+    Args:
+        instance_count: Number of random instances to compare on
+        workers: Number of worker processes, None for one per CPU and 1 to run serially
+        timeout: Seconds each solver may spend on an instance, None for no limit
+        generator: InstanceGenerator of the instances, 5 jobs on 3 resources by default
+    """
+    generator = generator or InstanceGenerator()
     print("Job Scheduling Problem Solver - Algorithm Comparison")
     print("=" * 60)
+    print(f"{instance_count} instances of {generator.jobs} jobs on {generator.resources} resources "
+          f"(seed {generator.seed})")
     
     instances = []
     total_backtracking = 0
     total_genetic = 0
+    # Listing every job stops being useful once the batch grows.
+    show_instances = instance_count <= 10
     
-    for instance_id in range(1, 6):
-        print(f"\nGenerating Instance {instance_id}...")
-        jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 6)]
-        resources = [RandomGenerator.generate_random_resource(resource_id) for resource_id in range(1, 4)]
-        
-        problem_instance = JobSchedulingProblem(jobs, resources)
+    for instance_id in range(1, instance_count + 1):
+        problem_instance = generator.instance(instance_id - 1)
+        jobs, resources = problem_instance.jobs, problem_instance.resources
         instances.append(problem_instance)
         
+        if not show_instances:
+            continue
+        print(f"\nGenerating Instance {instance_id}...")
         print("Jobs:")
         for job in jobs:
-            dependency_str = f"Job {job.dependency}" if job.dependency else "None"
-            print(f"  Job {job.job_id}: Processing Time {job.processing_time}, Dependency {dependency_str}")
+            print(f"  Job {job.job_id}: Processing Time {job.processing_time}, Dependency {job.describe_dependencies()}")
         
         print("Resources:")
         for resource in resources:
             print(f"  Resource {resource.resource_id}: Capacity {resource.capacity}")
     
     print(f"\n{'='*60}")
-    print("Running Algorithms...")
+    print(f"Running Algorithms on {instance_count} instances...")
     print("=" * 60)
     
-    for i, instance in enumerate(instances, 1):
-        print(f"\nEvaluating Instance {i}...")
-        evaluator = SchedulerEvaluator(instance)
-        evaluator.run_algorithms()
-        comparison_results, avg_backtracking_time, avg_genetic_time = evaluator.evaluate_performance()
+    batch = BatchEvaluator(instances, workers=workers, timeout=timeout, parallel=workers != 1)
+    pending = {}
+    for batch_result in batch.results():
+        if batch_result.error:
+            print(f"\nInstance {batch_result.instance_index + 1}: {batch_result.label} failed: {batch_result.error}")
+            continue
+        results = pending.setdefault(batch_result.instance_index, {})
+        results[batch_result.label] = batch_result.result
+        if len(results) < 2:
+            continue
+        del pending[batch_result.instance_index]
+
+        # Results arrive as each instance finishes, not in instance order.
+        print(f"\nEvaluating Instance {batch_result.instance_index + 1}...")
+        evaluator = SchedulerEvaluator(instances[batch_result.instance_index])
+        evaluator.add_results(results["Backtracking"], results["Genetic"])
+        comparisons, avg_backtracking_time, avg_genetic_time = evaluator.evaluate_performance()
         
-        for result in comparison_results:
-            if result == 0:
+        for comparison in comparisons:
+            if comparison.winner == "backtracking":
                 print("  → Backtracking Algorithm found better solution")
                 total_backtracking += 1
-            elif result == 1:
+            elif comparison.winner == "genetic":
                 print("  → Genetic Algorithm found better solution")
                 total_genetic += 1
-            elif result == 2:
+            elif comparison.winner == "tie":
                 print("  → Both algorithms found equivalent solutions")
+            else:
+                print("  → Neither algorithm found a valid solution")
+            if comparison.gap is not None:
+                print(f"  Makespan: Backtracking {comparison.backtracking_makespan}, "
+                      f"Genetic {comparison.genetic_makespan} (gap {comparison.gap:.1%})")
         
         print(f"  Avg Backtracking Time: {avg_backtracking_time:.6f} seconds")
         print(f"  Avg Genetic Time: {avg_genetic_time:.6f} seconds")
@@ -99,6 +129,10 @@ def main():
 Examples:
   python main.py              # Run GUI version
   python main.py --cli         # Run CLI comparison
+  python main.py --cli --instances 1000 --timeout 2
+                               # Compare on 1000 instances in parallel
+  python main.py --cli --jobs 12 --resources 4 --dag layered --tightness 0.8 --seed 7
+                               # Compare on a reproducible family of larger instances
   python main.py --gui         # Explicitly run GUI version
         """
     )
@@ -115,11 +149,44 @@ Examples:
         help='Run graphical user interface (default)'
     )
     
+    parser.add_argument(
+        '--instances',
+        type=int,
+        default=5,
+        help='Number of random instances to compare in CLI mode (default: 5)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for CLI mode (default: one per CPU; 1 runs serially)'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Seconds each algorithm may spend on an instance in CLI mode (default: no limit)'
+    )
+    
+    parser.add_argument('--jobs', type=int, default=5, help='Jobs per instance in CLI mode (default: 5)')
+    parser.add_argument('--resources', type=int, default=3, help='Resources per instance in CLI mode (default: 3)')
+    parser.add_argument('--dag', choices=DAG_SHAPES, default='chain',
+                        help='Dependency shape of the instances (default: chain)')
+    parser.add_argument('--durations', choices=DURATIONS, default='uniform',
+                        help='Processing time distribution of the instances (default: uniform)')
+    parser.add_argument('--tightness', type=float, default=None,
+                        help='Share of the total capacity the jobs use (default: random capacities of 3-20)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the instance family (default: random)')
+    
     args = parser.parse_args()
     
     try:
         if args.cli:
-            run_cli_comparison()
+            generator = InstanceGenerator(jobs=args.jobs, resources=args.resources, durations=args.durations,
+                                          dag=args.dag, tightness=args.tightness, seed=args.seed)
+            run_cli_comparison(args.instances, args.workers, args.timeout, generator)
         else:
             run_gui()
     except KeyboardInterrupt:
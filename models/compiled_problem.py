@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class CompiledProblem:
+    """
+    Frozen, array-backed view of a JobSchedulingProblem.
+
+    Jobs and resources are numbered by their position in the problem's lists.
+    Every per-job and per-resource value is held in a contiguous, read-only
+    NumPy column, so solvers can work on integer indices instead of Job and
+    Resource objects.
+
+    Attributes:
+        job_ids (tuple): Job id at each job index
+        resource_ids (tuple): Resource id at each resource index
+        job_index (dict): Job id to index of its first occurrence
+        resource_index (dict): Resource id to index of its first occurrence
+        processing_times (np.ndarray): Processing time of each job
+        predecessor_offsets (np.ndarray): Job i's predecessors are
+            predecessor_indices[predecessor_offsets[i]:predecessor_offsets[i + 1]]
+        predecessor_indices (np.ndarray): Predecessor indices of every job, concatenated
+        capacities (np.ndarray): Capacity of each resource
+        order (np.ndarray): Job indices in the order ScheduleDecoder processes them
+        missing_dependencies (int): Number of jobs with a predecessor that is not in the problem
+        total_work (int): Sum of all processing times
+        dag (DagIndex): Precedence graph the columns were built from
+    """
+
+    __slots__ = ('job_ids', 'resource_ids', 'job_index', 'resource_index', 'processing_times',
+                 'predecessor_offsets', 'predecessor_indices', 'capacities', 'order', 'missing_dependencies',
+                 'total_work', 'dag')
+
+    def __init__(self, jobs, resources, dag):
+        """
+        Compile lists of jobs and resources.
+
+        Args:
+            jobs: Jobs of the problem, in problem order
+            resources: Resources of the problem, in problem order
+            dag: DagIndex of the jobs
+        """
+        resource_index = {}
+        for index, resource in enumerate(resources):
+            resource_index.setdefault(resource.resource_id, index)
+
+        predecessor_offsets = np.zeros(len(jobs) + 1, dtype=np.int64)
+        np.cumsum([len(predecessors) for predecessors in dag.predecessors], out=predecessor_offsets[1:])
+        predecessor_indices = np.fromiter((predecessor for predecessors in dag.predecessors
+                                           for predecessor in predecessors), dtype=np.int64, count=dag.edge_count)
+
+        processing_times = np.fromiter((job.processing_time for job in jobs), dtype=np.int64, count=len(jobs))
+        capacities = np.fromiter((resource.capacity for resource in resources), dtype=np.int64,
+                                 count=len(resources))
+        order = np.array(dag.order, dtype=np.int64)
+
+        for column in (processing_times, predecessor_offsets, predecessor_indices, capacities, order):
+            column.flags.writeable = False
+
+        values = {
+            'job_ids': tuple(job.job_id for job in jobs),
+            'resource_ids': tuple(resource.resource_id for resource in resources),
+            'job_index': dag.job_index,
+            'resource_index': resource_index,
+            'processing_times': processing_times,
+            'predecessor_offsets': predecessor_offsets,
+            'predecessor_indices': predecessor_indices,
+            'capacities': capacities,
+            'order': order,
+            'missing_dependencies': len(dag.missing),
+            'total_work': int(processing_times.sum()),
+            'dag': dag,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CompiledProblem is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("CompiledProblem is immutable")
+
+    @property
+    def job_count(self) -> int:
+        """Return the number of jobs."""
+        return len(self.job_ids)
+
+    @property
+    def resource_count(self) -> int:
+        """Return the number of resources."""
+        return len(self.resource_ids)
+
+    def predecessors_of(self, index) -> np.ndarray:
+        """Return the predecessor indices of the job at an index."""
+        return self.predecessor_indices[self.predecessor_offsets[index]:self.predecessor_offsets[index + 1]]
+
+    def nbytes(self) -> int:
+        """Return the memory held by the NumPy columns, in bytes."""
+        return sum(column.nbytes for column in
+                   (self.processing_times, self.predecessor_offsets, self.predecessor_indices,
+                    self.capacities, self.order))
\ No newline at end of file
@@ -0,0 +1,127 @@
+import heapq
+
+
+class DagIndex:
+    """
+    Precedence graph of a list of jobs, built once in O(V + E).
+
+    Jobs are numbered by their position in the list. An edge runs from every
+    predecessor to the job that waits for it.
+
+    Attributes:
+        job_index (dict): Job id to index of its first occurrence
+        predecessors (list): Sorted tuple of predecessor indices for each job
+        successors (list): List of successor indices for each job
+        missing (dict): Job index to the tuple of its predecessor ids that are not in the list
+        order (list): Job indices, predecessors first. Jobs keep their list order
+            wherever it is already topological; otherwise the earliest ready job
+            comes first. Jobs on or behind a cycle are appended in list order.
+        cyclic (list): Indices of the jobs that are on or behind a cycle
+        earliest_start (list): Earliest start of each job on unlimited resources
+        earliest_finish (list): Earliest finish of each job on unlimited resources
+        tail (list): Longest chain of work from the start of each job to the end of the graph
+        critical_path_length (int): Length of the longest chain of dependent jobs
+        edge_count (int): Number of precedence edges inside the list
+    """
+
+    def __init__(self, jobs):
+        """
+        Build the index.
+
+        Args:
+            jobs: Jobs in problem (or schedule) order
+        """
+        job_index = {}
+        for index, job in enumerate(jobs):
+            job_index.setdefault(job.job_id, index)
+        self.job_index = job_index
+
+        self.predecessors = []
+        self.successors = [[] for _ in jobs]
+        self.missing = {}
+        ordered = True
+        for index, job in enumerate(jobs):
+            found = set()
+            missing = []
+            for predecessor_id in job.predecessors:
+                predecessor = job_index.get(predecessor_id)
+                if predecessor is None:
+                    missing.append(predecessor_id)
+                elif predecessor != index:
+                    found.add(predecessor)
+                    if predecessor > index:
+                        ordered = False
+            predecessors = tuple(sorted(found))
+            self.predecessors.append(predecessors)
+            for predecessor in predecessors:
+                self.successors[predecessor].append(index)
+            if missing:
+                self.missing[index] = tuple(sorted(missing))
+        self.edge_count = sum(len(predecessors) for predecessors in self.predecessors)
+
+        self.order = list(range(len(jobs))) if ordered else self.topological_order()
+        if len(self.order) < len(jobs):
+            seen = set(self.order)
+            self.cyclic = [index for index in range(len(jobs)) if index not in seen]
+            self.order.extend(self.cyclic)
+        else:
+            self.cyclic = []
+
+        self.earliest_start = [0] * len(jobs)
+        self.earliest_finish = [0] * len(jobs)
+        for index in self.order:
+            start = 0
+            for predecessor in self.predecessors[index]:
+                if self.earliest_finish[predecessor] > start:
+                    start = self.earliest_finish[predecessor]
+            self.earliest_start[index] = start
+            self.earliest_finish[index] = start + jobs[index].processing_time
+
+        self.tail = [0] * len(jobs)
+        for index in reversed(self.order):
+            longest_successor = 0
+            for successor in self.successors[index]:
+                if self.tail[successor] > longest_successor:
+                    longest_successor = self.tail[successor]
+            self.tail[index] = jobs[index].processing_time + longest_successor
+
+        self.critical_path_length = max(self.earliest_finish, default=0)
+
+    def topological_order(self):
+        """Return the jobs that can be ordered, always taking the earliest ready job first."""
+        waiting = [len(predecessors) for predecessors in self.predecessors]
+        ready = [index for index, count in enumerate(waiting) if not count]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            index = heapq.heappop(ready)
+            order.append(index)
+            for successor in self.successors[index]:
+                waiting[successor] -= 1
+                if not waiting[successor]:
+                    heapq.heappush(ready, successor)
+        return order
+
+    @property
+    def has_cycle(self) -> bool:
+        """Return True if some jobs can never start because of a dependency cycle."""
+        return bool(self.cyclic)
+
+    def find_cycle(self):
+        """
+        Return the indices of one dependency cycle, in precedence order, or None.
+
+        Every job left over by the topological sort still waits for another
+        left-over job, so following those predecessors must revisit a job.
+        """
+        if not self.cyclic:
+            return None
+        blocked = set(self.cyclic)
+        path = []
+        position = {}
+        index = self.cyclic[0]
+        while index not in position:
+            position[index] = len(path)
+            path.append(index)
+            index = next(predecessor for predecessor in self.predecessors[index] if predecessor in blocked)
+        return list(reversed(path[position[index]:]))
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterable, Optional
 
 class Job:
     """
@@ -7,10 +7,14 @@ class Job:
     Attributes:
         job_id (int): Unique identifier for the job
         processing_time (int): Time required to complete the job
-        dependency (Optional[int]): ID of job that must complete before this job can start
+        dependency (Optional[int]): The single dependency passed in, or the only predecessor
+        predecessors (frozenset): IDs of every job that must complete before this job can start
     """
     
-    def __init__(self, job_id: int, processing_time: int, dependency: Optional[int] = None):
+    __slots__ = ('job_id', 'processing_time', 'dependency', 'predecessors')
+
+    def __init__(self, job_id: int, processing_time: int, dependency: Optional[int] = None,
+                 predecessors: Optional[Iterable[int]] = None):
         """
         Initialize a Job instance.
         
@@ -18,24 +22,40 @@ class Job:
             job_id: Unique identifier for the job
             processing_time: Time required to complete the job (must be positive)
             dependency: ID of job that must complete before this job can start
+            predecessors: IDs of further jobs that must complete before this job can start
             
         Raises:
-            ValueError: If processing_time is not positive or if job_id equals dependency
+            ValueError: If processing_time is not positive or if the job depends on itself
         """
         if processing_time <= 0:
             raise ValueError("Processing time must be positive")
-        if dependency is not None and dependency == job_id:
+
+        predecessor_ids = frozenset(predecessors or ())
+        if dependency is not None:
+            predecessor_ids |= {dependency}
+        if job_id in predecessor_ids:
             raise ValueError("Job cannot depend on itself")
+        if dependency is None and len(predecessor_ids) == 1:
+            dependency = next(iter(predecessor_ids))
             
         self.job_id = job_id
         self.processing_time = processing_time
         self.dependency = dependency
+        self.predecessors = predecessor_ids
+
+    def describe_dependencies(self) -> str:
+        """Return the predecessors as readable text, e.g. "Job 1, Job 4", or "None"."""
+        if not self.predecessors:
+            return "None"
+        return ", ".join(f"Job {predecessor}" for predecessor in sorted(self.predecessors))
 
     def __str__(self) -> str:
         """Return string representation of the job."""
-        dependency_str = f"Job {self.dependency}" if self.dependency is not None else "None"
-        return f"Job {self.job_id} (Processing Time: {self.processing_time}, Dependency: {dependency_str})"
+        return f"Job {self.job_id} (Processing Time: {self.processing_time}, Dependency: {self.describe_dependencies()})"
     
     def __repr__(self) -> str:
         """Return detailed string representation for debugging."""
+        if len(self.predecessors) > 1:
+            return (f"Job(job_id={self.job_id}, processing_time={self.processing_time}, "
+                    f"predecessors={sorted(self.predecessors)})")
         return f"Job(job_id={self.job_id}, processing_time={self.processing_time}, dependency={self.dependency})"
\ No newline at end of file
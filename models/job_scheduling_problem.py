@@ -1,13 +1,82 @@
+from models.compiled_problem import CompiledProblem
+from models.dag_index import DagIndex
+from models.problem_bounds import ProblemBounds
+
+
 class JobSchedulingProblem:
     def __init__(self, jobs, resources):
+        self._compiled = None
+        self._dag = None
+        self._bounds = None
         self.jobs = jobs
         self.resources = resources
 
+    @property
+    def jobs(self):
+        return self._jobs
+
+    @jobs.setter
+    def jobs(self, jobs):
+        self._jobs = jobs
+        self._compiled = None
+        self._dag = None
+        self._bounds = None
+
+    @property
+    def resources(self):
+        return self._resources
+
+    @resources.setter
+    def resources(self, resources):
+        self._resources = resources
+        self._compiled = None
+        self._bounds = None
+
+    def compile(self):
+        """
+        Return the array-backed CompiledProblem view of this problem.
+
+        The view is built once and reused until jobs or resources are
+        reassigned. Lists changed in place are not detected; reassign them
+        after editing a problem that has already been compiled.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledProblem(self._jobs, self._resources, self.dag())
+        return self._compiled
+
+    def dag(self):
+        """
+        Return the DagIndex of the job precedences.
+
+        Like compile(), the index is built once and reused until jobs are reassigned.
+        """
+        if self._dag is None:
+            self._dag = DagIndex(self._jobs)
+        return self._dag
+
+    def bounds(self):
+        """
+        Return the cached ProblemBounds: makespan lower bounds and infeasibility proofs.
+
+        Like compile(), the bounds are computed once and reused until jobs or
+        resources are reassigned.
+        """
+        if self._bounds is None:
+            self._bounds = ProblemBounds(self.compile())
+        return self._bounds
+
+    def makespan_lower_bound(self) -> int:
+        """Return a makespan no valid schedule can beat."""
+        return self.bounds().makespan
+
+    def optimality_gap(self, makespan) -> float:
+        """Return the relative gap between a makespan and the lower bound."""
+        return self.bounds().gap(makespan)
+
     def display_problem(self):
         print("Jobs:")
         for job in self.jobs:
-            dependencies = job.dependency if job.dependency is not None else "None"
-            print(f"Job {job.job_id} (Processing Time: {job.processing_time}, Dependency: {dependencies})")
+            print(f"Job {job.job_id} (Processing Time: {job.processing_time}, Dependency: {job.describe_dependencies()})")
 
         print("\nResources:")
         for resource in self.resources:
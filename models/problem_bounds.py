@@ -0,0 +1,63 @@
+class ProblemBounds:
+    """
+    Lower bounds on the makespan of a problem and proofs that it has no valid schedule.
+
+    Attributes:
+        critical_path (int): Length of the longest chain of dependent jobs
+        balanced_work (int): Total work spread evenly over every resource, rounded up
+        largest_job (int): Longest single processing time
+        makespan (int): Best of the bounds above; no valid schedule finishes earlier
+        infeasibility (Optional[str]): Why no valid schedule exists, None if no proof was found
+    """
+
+    def __init__(self, compiled):
+        """
+        Compute the bounds of a compiled problem.
+
+        Args:
+            compiled: CompiledProblem to bound
+        """
+        dag = compiled.dag
+        job_count = compiled.job_count
+        resource_count = compiled.resource_count
+        largest_capacity = int(compiled.capacities.max()) if resource_count else 0
+
+        self.critical_path = dag.critical_path_length
+        self.largest_job = int(compiled.processing_times.max()) if job_count else 0
+        self.balanced_work = -(-compiled.total_work // resource_count) if resource_count else 0
+        self.makespan = max(self.critical_path, self.largest_job, self.balanced_work)
+
+        self.infeasibility = None
+        if job_count and not resource_count:
+            self.infeasibility = "there are jobs but no resources"
+        elif dag.missing:
+            index, missing = next(iter(dag.missing.items()))
+            self.infeasibility = f"job {compiled.job_ids[index]} depends on unknown job {missing[0]}"
+        elif dag.has_cycle:
+            cycle = " -> ".join(str(compiled.job_ids[index]) for index in dag.find_cycle())
+            self.infeasibility = f"dependency cycle {cycle}"
+        elif self.largest_job > largest_capacity:
+            index = int(compiled.processing_times.argmax())
+            self.infeasibility = (f"job {compiled.job_ids[index]} needs {self.largest_job} but the largest "
+                                  f"capacity is {largest_capacity}")
+        elif compiled.total_work > int(compiled.capacities.sum()):
+            self.infeasibility = (f"total processing time {compiled.total_work} exceeds total capacity "
+                                  f"{int(compiled.capacities.sum())}")
+
+    @property
+    def infeasible(self) -> bool:
+        """Return True if the problem provably has no valid schedule."""
+        return self.infeasibility is not None
+
+    def gap(self, makespan) -> float:
+        """
+        Return the relative optimality gap of a makespan, (makespan - bound) / makespan.
+
+        The gap is 0 for a makespan that meets the lower bound, which proves it
+        optimal, and inf when no makespan is given.
+        """
+        if makespan is None or makespan == float('inf'):
+            return float('inf')
+        if makespan <= 0:
+            return 0.0
+        return max(makespan - self.makespan, 0) / makespan
\ No newline at end of file
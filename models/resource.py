@@ -7,6 +7,8 @@ class Resource:
         capacity (int): Maximum total processing time this resource can handle
     """
     
+    __slots__ = ('resource_id', 'capacity')
+
     def __init__(self, resource_id: int, capacity: int):
         """
         Initialize a Resource instance.
@@ -0,0 +1,99 @@
+from types import MappingProxyType
+from utils.schedule_decoder import ScheduleDecoder
+
+
+class ScheduleResult:
+    """
+    Immutable outcome of a solver run.
+
+    Everything a caller needs to report a run is computed once, when the
+    result is built; rendering it as text is left to render(), which only
+    runs when asked for.
+
+    Attributes:
+        solver (str): Name of the solver that produced the result
+        schedule (tuple): (job, resource) pairs as the solver returned them, empty if none was found
+        assignments (tuple): (job, resource) pairs in processing order
+        start_times (Mapping): Start time of each job, keyed by job_id
+        end_times (Mapping): End time of each job, keyed by job_id
+        makespan (Optional[int]): Latest end time, None if no schedule was found
+        feasible (bool): True if a schedule was found and it respects every constraint
+        resource_load (Mapping): Total processing time on each resource, keyed by resource_id
+        utilization (Mapping): Share of the makespan each resource is busy, keyed by resource_id
+        stats (Mapping): Solver statistics such as elapsed seconds, optimality gap and search effort
+    """
+
+    __slots__ = ('solver', 'schedule', 'assignments', 'start_times', 'end_times', 'makespan', 'feasible',
+                 'resource_load', 'utilization', 'stats')
+
+    def __init__(self, problem_instance, schedule, solver, **stats):
+        """
+        Build the result of a run.
+
+        Args:
+            problem_instance: Problem the schedule belongs to
+            schedule: List of (job, resource) assignments, None if no schedule was found
+            solver: Name of the solver
+            **stats: Solver statistics to keep with the result
+        """
+        values = {
+            'solver': solver,
+            'schedule': tuple(schedule or ()),
+            'assignments': (),
+            'start_times': MappingProxyType({}),
+            'end_times': MappingProxyType({}),
+            'makespan': None,
+            'feasible': False,
+            'resource_load': MappingProxyType({}),
+            'utilization': MappingProxyType({}),
+            'stats': MappingProxyType(dict(stats)),
+        }
+        if schedule:
+            decoded = ScheduleDecoder(problem_instance).decode(schedule)
+            makespan = decoded.makespan
+            values.update({
+                'assignments': tuple(decoded.assignments),
+                'start_times': MappingProxyType(decoded.start_times),
+                'end_times': MappingProxyType(decoded.end_times),
+                'makespan': makespan,
+                'feasible': decoded.feasible,
+                'resource_load': MappingProxyType(decoded.resource_load),
+                'utilization': MappingProxyType({resource_id: load / makespan if makespan else 0.0
+                                                 for resource_id, load in decoded.resource_load.items()}),
+            })
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScheduleResult is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ScheduleResult is immutable")
+
+    def __repr__(self):
+        return f"ScheduleResult(solver={self.solver!r}, makespan={self.makespan}, feasible={self.feasible})"
+
+    @property
+    def found(self) -> bool:
+        """Return True if the solver returned a schedule."""
+        return bool(self.schedule)
+
+    def render(self, title=None) -> str:
+        """
+        Return the schedule as text, one line per job in processing order.
+
+        Args:
+            title: First line, "Schedule (<solver>):" by default
+
+        Returns:
+            str: The rendered schedule, or why none was found
+        """
+        if not self.found:
+            reason = self.stats.get('infeasibility')
+            return f"No valid schedule found: {reason}." if reason else "No valid schedule found."
+
+        lines = [title or f"Schedule ({self.solver}):"]
+        for job, resource in self.assignments:
+            lines.append(f"Job {job.job_id} scheduled on Resource {resource.resource_id} "
+                         f"Start Time: {self.start_times[job.job_id]}, End Time: {self.end_times[job.job_id]}")
+        return "\n".join(lines)
\ No newline at end of file
@@ -6,17 +6,47 @@ This module contains tests for the core functionality of the scheduling algorith
 """
 
 import unittest
+import random
+import math
+import contextlib
+import io
 import sys
 import os
+import csv
+import json
+import tempfile
+import threading
+import numpy as np
+import types
+from unittest import mock
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from models.job import Job
 from models.resource import Resource
 from models.job_scheduling_problem import JobSchedulingProblem
+from models.dag_index import DagIndex
+from models.schedule_result import ScheduleResult
+from algorithms.anytime import CancellationToken
 from algorithms.backtracking_algorithm import BacktrackingAlgorithm
+from algorithms.exact_algorithm import ExactAlgorithm, milp
 from algorithms.genetic_algorithm import GeneticAlgorithm
+from algorithms.island_genetic_algorithm import IslandGeneticAlgorithm
+from algorithms.search_state import SearchState
+from algorithms.presolve import presolve
+from algorithms.local_search import STRATEGIES, IncrementalSchedule, LocalSearch, polish
+from algorithms.list_scheduling import HEURISTICS, ListScheduler, best_fit_schedule, earliest_finish_schedule
+from algorithms.constraint_handling import penalized_makespan, repair_assignment
+from algorithms.fitness_cache import FitnessCache
+from algorithms.selection import truncation_selection, tournament_selection, roulette_selection
+from algorithms.vectorized_fitness import PopulationEvaluator
+from benchmarks.suite import find_regressions, main as run_benchmark_suite
+from utils.batch_evaluator import BatchEvaluator, SolverConfig
+from utils.instance_generator import DAG_SHAPES, DURATIONS, InstanceGenerator
+from utils.instrumentation import export_csv, export_json, profile_solver, summarize
 from utils.random_generator import RandomGenerator
+from utils.schedule_decoder import ScheduleDecoder
+from utils.scheduler_evaluator import ComparisonMetrics, SchedulerEvaluator
 
 
 class TestJob(unittest.TestCase):
@@ -34,6 +64,17 @@ class TestJob(unittest.TestCase):
         job = Job(2, 3, 1)
         self.assertEqual(job.dependency, 1)
     
+    def test_job_with_multiple_predecessors(self):
+        """Test job creation with several predecessors."""
+        job = Job(4, 3, 1, predecessors=[2, 3])
+        self.assertEqual(job.predecessors, frozenset({1, 2, 3}))
+        self.assertEqual(job.dependency, 1)
+        self.assertEqual(job.describe_dependencies(), "Job 1, Job 2, Job 3")
+
+        self.assertEqual(Job(2, 3, predecessors=[1]).dependency, 1)
+        with self.assertRaises(ValueError):
+            Job(2, 3, predecessors=[1, 2])
+
     def test_job_invalid_processing_time(self):
         """Test that invalid processing time raises ValueError."""
         with self.assertRaises(ValueError):
@@ -87,6 +128,51 @@ class TestJobSchedulingProblem(unittest.TestCase):
         self.assertEqual(len(self.problem.jobs), 3)
         self.assertEqual(len(self.problem.resources), 2)
 
+    def test_compiled_view(self):
+        """Test the array-backed compiled view and its caching."""
+        compiled = self.problem.compile()
+        self.assertIs(self.problem.compile(), compiled)
+        self.assertEqual(compiled.processing_times.tolist(), [3, 2, 4])
+        self.assertEqual([compiled.predecessors_of(index).tolist() for index in range(3)], [[], [0], []])
+        self.assertEqual(compiled.capacities.tolist(), [10, 8])
+        self.assertEqual(compiled.resource_index, {1: 0, 2: 1})
+        self.assertEqual(compiled.total_work, 9)
+
+        with self.assertRaises(AttributeError):
+            compiled.total_work = 0
+        with self.assertRaises(ValueError):
+            compiled.capacities[0] = 1
+
+        self.problem.resources = self.resources[:1]
+        self.assertEqual(self.problem.compile().resource_count, 1)
+
+    def test_lower_bounds(self):
+        """Test the critical-path, balanced-work and largest-job bounds."""
+        bounds = self.problem.bounds()
+        self.assertEqual((bounds.critical_path, bounds.balanced_work, bounds.largest_job), (5, 5, 4))
+        self.assertEqual(self.problem.makespan_lower_bound(), 5)
+        self.assertFalse(bounds.infeasible)
+        self.assertEqual(self.problem.optimality_gap(5), 0.0)
+        self.assertAlmostEqual(self.problem.optimality_gap(10), 0.5)
+
+    def test_infeasibility_proofs(self):
+        """Test that capacity, missing-dependency and cycle proofs are found."""
+        oversized = JobSchedulingProblem([Job(1, 9)], [Resource(1, 5), Resource(2, 8)])
+        overloaded = JobSchedulingProblem([Job(1, 5), Job(2, 5)], [Resource(1, 6), Resource(2, 3)])
+        missing = JobSchedulingProblem([Job(1, 2, 7)], [Resource(1, 5)])
+        cyclic = JobSchedulingProblem([Job(1, 2, 2), Job(2, 2, 1)], [Resource(1, 5)])
+
+        self.assertIn("largest capacity", oversized.bounds().infeasibility)
+        self.assertIn("exceeds total capacity", overloaded.bounds().infeasibility)
+        self.assertIn("unknown job 7", missing.bounds().infeasibility)
+        self.assertIn("cycle", cyclic.bounds().infeasibility)
+        self.assertIsNone(self.problem.bounds().infeasibility)
+
+    def test_models_have_no_instance_dict(self):
+        """Test that jobs and resources use __slots__."""
+        self.assertFalse(hasattr(self.jobs[0], '__dict__'))
+        self.assertFalse(hasattr(self.resources[0], '__dict__'))
+
 
 class TestBacktrackingAlgorithm(unittest.TestCase):
     """Test cases for the BacktrackingAlgorithm class."""
@@ -118,6 +204,19 @@ class TestBacktrackingAlgorithm(unittest.TestCase):
             (self.jobs[1], self.resources[0]),
         ]
         self.assertFalse(self.algorithm.is_valid_schedule(invalid_schedule))
+
+    def test_time_limit(self):
+        """Test that the search stops at its deadline and reports the gap of its incumbent."""
+        algorithm = BacktrackingAlgorithm(self.problem, time_limit=0)
+        algorithm.BOUND_SYNC_INTERVAL = 1
+        self.assertIsNone(algorithm.solve())
+        self.assertEqual(algorithm.interrupted, "time_limit")
+
+        algorithm = BacktrackingAlgorithm(self.problem, time_limit=60)
+        algorithm.solve()
+        self.assertIsNone(algorithm.interrupted)
+        self.assertTrue(algorithm.proven_optimal)
+        self.assertEqual(algorithm.optimality_gap, 0.0)
     
     def test_solve_simple_problem(self):
         """Test solving a simple problem."""
@@ -125,6 +224,144 @@ class TestBacktrackingAlgorithm(unittest.TestCase):
         self.assertIsNotNone(solution)
         self.assertTrue(self.algorithm.is_valid_schedule(solution))
 
+    def test_branch_and_bound_matches_exhaustive_search(self):
+        """Test that branch-and-bound finds the same optimal makespan with fewer nodes."""
+        random.seed(7)
+        for _ in range(10):
+            jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 7)]
+            resources = [RandomGenerator.generate_random_resource(resource_id) for resource_id in range(1, 4)]
+            problem = JobSchedulingProblem(jobs, resources)
+
+            exhaustive = BacktrackingAlgorithm(problem, branch_and_bound=False)
+            branch_and_bound = BacktrackingAlgorithm(problem)
+            exhaustive.solve()
+            branch_and_bound.solve()
+
+            self.assertEqual(exhaustive.best_makespan, branch_and_bound.best_makespan)
+            self.assertLessEqual(branch_and_bound.nodes_expanded, exhaustive.nodes_expanded)
+            if branch_and_bound.best_schedule is not None:
+                self.assertTrue(branch_and_bound.is_valid_schedule(branch_and_bound.best_schedule))
+
+    def test_fan_in_dependencies_match_exhaustive_search(self):
+        """Test that branch-and-bound handles jobs with several predecessors."""
+        random.seed(12)
+        for _ in range(10):
+            jobs = []
+            for job_id in range(1, 7):
+                others = [other for other in range(1, 7) if other != job_id]
+                predecessors = random.sample(others, random.randint(0, 2))
+                jobs.append(Job(job_id, random.randint(1, 5), predecessors=predecessors))
+            resources = [Resource(resource_id, random.randint(8, 20)) for resource_id in range(1, 4)]
+            problem = JobSchedulingProblem(jobs, resources)
+
+            exhaustive = BacktrackingAlgorithm(problem, branch_and_bound=False)
+            branch_and_bound = BacktrackingAlgorithm(problem)
+            exhaustive.solve()
+            branch_and_bound.solve()
+
+            self.assertEqual(exhaustive.best_makespan, branch_and_bound.best_makespan)
+            if problem.dag().has_cycle:
+                self.assertIsNone(branch_and_bound.best_schedule)
+            elif branch_and_bound.best_schedule is not None:
+                decoded = ScheduleDecoder(problem).decode(branch_and_bound.best_schedule)
+                self.assertTrue(decoded.feasible)
+                self.assertEqual(decoded.makespan, branch_and_bound.best_makespan)
+
+    def test_provably_infeasible_instance_returns_immediately(self):
+        """Test that a capacity proof skips the search entirely."""
+        jobs = [Job(job_id, 5) for job_id in range(1, 13)]
+        resources = [Resource(resource_id, 10) for resource_id in range(1, 5)]
+        algorithm = BacktrackingAlgorithm(JobSchedulingProblem(jobs, resources), branch_and_bound=False)
+
+        self.assertIsNone(algorithm.solve())
+        self.assertEqual(algorithm.nodes_expanded, 0)
+
+    def test_search_stops_at_problem_lower_bound(self):
+        """Test that the search stops once the incumbent meets the problem's lower bound."""
+        jobs = [Job(job_id, 2) for job_id in range(1, 9)]
+        resources = [Resource(resource_id, 8) for resource_id in range(1, 5)]
+        algorithm = BacktrackingAlgorithm(JobSchedulingProblem(jobs, resources), symmetry_breaking=False)
+        algorithm.solve()
+
+        self.assertEqual(algorithm.best_makespan, 4)
+        self.assertEqual(algorithm.optimality_gap, 0.0)
+        self.assertLess(algorithm.nodes_expanded, 50)
+
+    def test_symmetry_breaking_keeps_optimal_makespan(self):
+        """Test that symmetry breaking prunes equivalent assignments without changing the optimum."""
+        random.seed(3)
+        for _ in range(10):
+            jobs = [Job(job_id, random.choice([2, 3, 3]), None) for job_id in range(1, 7)]
+            jobs.append(Job(7, 4, 6))
+            resources = [Resource(resource_id, 12) for resource_id in range(1, 4)] + [Resource(4, 8)]
+            problem = JobSchedulingProblem(jobs, resources)
+
+            plain = BacktrackingAlgorithm(problem, symmetry_breaking=False)
+            symmetric = BacktrackingAlgorithm(problem)
+            plain.solve()
+            symmetric.solve()
+
+            self.assertEqual(plain.best_makespan, symmetric.best_makespan)
+            self.assertLess(symmetric.nodes_expanded, plain.nodes_expanded)
+
+    def test_parallel_search_matches_serial_search(self):
+        """Test that the process-pool search finds the same optimal makespan."""
+        random.seed(5)
+        jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 9)]
+        resources = [Resource(resource_id, 30) for resource_id in range(1, 4)]
+        problem = JobSchedulingProblem(jobs, resources)
+
+        serial = BacktrackingAlgorithm(problem)
+        parallel = BacktrackingAlgorithm(problem, workers=2)
+        serial.solve()
+        solution = parallel.solve()
+
+        self.assertEqual(serial.best_makespan, parallel.best_makespan)
+        self.assertTrue(parallel.is_valid_schedule(solution))
+
+
+class TestSearchState(unittest.TestCase):
+    """Test cases for the SearchState class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.jobs = [
+            Job(1, 3, None),
+            Job(2, 2, 1),
+            Job(3, 4, None)
+        ]
+        self.resources = [
+            Resource(1, 5),
+            Resource(2, 10)
+        ]
+        self.state = SearchState(self.jobs, self.resources)
+
+    def test_push_tracks_times_and_capacity(self):
+        """Test that pushing assignments updates end times, makespan and validity."""
+        self.state.push(1)
+        self.state.push(0)
+        self.assertEqual(self.state.job_end, [3, 5, 0])
+        self.assertEqual(self.state.makespan, 5)
+        self.assertTrue(self.state.is_valid())
+
+        self.state.push(0)
+        self.assertTrue(self.state.is_complete())
+        self.assertFalse(self.state.is_valid())
+        self.assertEqual(self.state.makespan, 9)
+
+    def test_pop_restores_previous_state(self):
+        """Test that popping an assignment undoes it exactly."""
+        self.state.push(0)
+        snapshot = (list(self.state.resource_load), list(self.state.resource_end),
+                    self.state.makespan, self.state.committed_time)
+
+        self.state.push(0)
+        self.state.pop()
+
+        self.assertEqual(snapshot, (self.state.resource_load, self.state.resource_end,
+                                    self.state.makespan, self.state.committed_time))
+        self.assertEqual(self.state.schedule, [(self.jobs[0], self.resources[0])])
+
 
 class TestGeneticAlgorithm(unittest.TestCase):
     """Test cases for the GeneticAlgorithm class."""
@@ -153,7 +390,9 @@ class TestGeneticAlgorithm(unittest.TestCase):
         self.assertEqual(sorted(job_ids), sorted(expected_ids))
     
     def test_population_initialization(self):
-        """Test population initialization."""
+        """Test population initialization, which replaces rather than extends the population."""
+        self.algorithm.initialize_population()
+        self.assertEqual(len(self.algorithm.population), self.algorithm.population_size)
         self.algorithm.initialize_population()
         self.assertEqual(len(self.algorithm.population), self.algorithm.population_size)
     
@@ -164,6 +403,253 @@ class TestGeneticAlgorithm(unittest.TestCase):
         self.assertIsInstance(fitness, (int, float))
         self.assertGreaterEqual(fitness, 0)
 
+    def test_population_fitness_is_cached(self):
+        """Test that repeated chromosomes are served from the fitness cache, keyed on their row bytes."""
+        chromosome = self.algorithm.random_chromosome()
+        values = self.algorithm.evaluate_population(self.algorithm.stack([chromosome, chromosome.copy(), chromosome]))
+
+        schedule = self.algorithm.decode_chromosome(chromosome)
+        self.assertEqual(values, [self.algorithm.fitness(schedule)] * 3)
+        self.assertEqual(self.algorithm.fitness_cache.hits, 0)
+        self.algorithm.evaluate_population(self.algorithm.encode([schedule]))
+        self.assertEqual(self.algorithm.fitness_cache.hits, 1)
+
+    def test_early_stopping(self):
+        """Test that the GA stops on a stall, at the lower bound and on a target makespan."""
+        self.assertEqual(self.algorithm.makespan_lower_bound(), 5)
+
+        stalled = GeneticAlgorithm(self.problem, population_size=10, generations=500, seed=1,
+                                   stall_generations=3, stop_at_lower_bound=False)
+        stalled.evolve()
+        self.assertEqual(stalled.stop_reason, "stall")
+        self.assertLess(stalled.generations_run, 500)
+
+        bounded = GeneticAlgorithm(self.problem, population_size=10, generations=500, seed=1)
+        bounded.evolve()
+        self.assertEqual(bounded.stop_reason, "lower_bound")
+        self.assertEqual(bounded.best_fitness, 5)
+
+        targeted = GeneticAlgorithm(self.problem, population_size=10, generations=500, seed=1,
+                                    target_makespan=100, stop_at_lower_bound=False)
+        targeted.evolve()
+        self.assertEqual(targeted.stop_reason, "target_makespan")
+        self.assertEqual(targeted.generations_run, 0)
+        self.assertGreaterEqual(targeted.optimality_gap, 0.0)
+
+    def test_provably_infeasible_instance_skips_evolution(self):
+        """Test that the GA does not evolve a population for a provably infeasible instance."""
+        problem = JobSchedulingProblem([Job(1, 20)], self.resources)
+        algorithm = GeneticAlgorithm(problem, population_size=10, generations=50)
+
+        self.assertIsNone(algorithm.evolve())
+        self.assertEqual(algorithm.stop_reason, "infeasible")
+        self.assertEqual(algorithm.population.shape, (0, 1))
+
+
+class TestIslandGeneticAlgorithm(unittest.TestCase):
+    """Test cases for the IslandGeneticAlgorithm class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(2)
+        jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 16)]
+        resources = [Resource(resource_id, 60) for resource_id in range(1, 4)]
+        self.problem = JobSchedulingProblem(jobs, resources)
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that worker processes and in-process runs give the same result for a seed."""
+        parallel = IslandGeneticAlgorithm(self.problem, islands=3, generations=12, migration_interval=4,
+                                          seed=9, population_size=10)
+        serial = IslandGeneticAlgorithm(self.problem, islands=3, generations=12, migration_interval=4,
+                                        seed=9, parallel=False, population_size=10)
+        solution = parallel.evolve()
+        serial.evolve()
+
+        self.assertEqual(parallel.best_fitness, serial.best_fitness)
+        self.assertEqual(parallel.island_best_fitness, serial.island_best_fitness)
+        self.assertEqual(parallel.best_fitness, min(parallel.island_best_fitness))
+        self.assertEqual(GeneticAlgorithm(self.problem).fitness(solution), parallel.best_fitness)
+
+        # Stall counters and local search states must survive islands moving between workers.
+        problem = InstanceGenerator(jobs=40, resources=5, dag="layered", tightness=0.5, seed=7).instance()
+        for island_options in (dict(stall_generations=3),
+                               dict(stall_generations=5, local_search="annealing", local_search_iterations=5)):
+            options = dict(islands=4, generations=40, migration_interval=5, seed=7, population_size=10,
+                           stop_at_lower_bound=False, **island_options)
+            serial = IslandGeneticAlgorithm(problem, parallel=False, **options)
+            parallel = IslandGeneticAlgorithm(problem, workers=2, **options)
+            serial.evolve()
+            parallel.evolve()
+
+            self.assertEqual(parallel.best_schedule, serial.best_schedule)
+            self.assertEqual(parallel.island_best_fitness, serial.island_best_fitness)
+            self.assertEqual(parallel.generations_run, serial.generations_run)
+
+    def test_ring_migration_replaces_worst_individuals(self):
+        """Test that the best individual of each island replaces the worst of the next one."""
+        algorithm = IslandGeneticAlgorithm(self.problem, islands=2, migrants=1, parallel=False)
+        chromosomes = [np.array([[0], [1]]), np.array([[2], [3]])]
+        fitness_values = [[5, 9], [7, 3]]
+
+        algorithm.migrate(chromosomes, fitness_values)
+
+        self.assertEqual([population.tolist() for population in chromosomes], [[[0], [3]], [[0], [3]]])
+        self.assertEqual(fitness_values, [[5, 3], [5, 3]])
+
+    def test_anytime_interface(self):
+        """Test that the island model honors its time limit, reports improvements and builds a result."""
+        improvements = []
+        algorithm = IslandGeneticAlgorithm(self.problem, islands=2, generations=100000, seed=3, parallel=False,
+                                           time_limit=0.2, on_improvement=lambda schedule, makespan, elapsed:
+                                           improvements.append(makespan),
+                                           population_size=10, stop_at_lower_bound=False)
+        result = algorithm.run()
+
+        self.assertEqual(algorithm.interrupted, "time_limit")
+        self.assertEqual(result.stats['stop_reason'], "time_limit")
+        self.assertLess(result.stats['elapsed'], 2.0)
+        self.assertTrue(result.feasible)
+        self.assertEqual(result.makespan, algorithm.best_fitness)
+        self.assertEqual(improvements, sorted(improvements, reverse=True))
+        self.assertEqual(improvements[-1], result.makespan)
+
+    def test_never_returns_an_invalid_schedule(self):
+        """Test that penalized bests are not returned and instances without jobs are solved trivially."""
+        problem = JobSchedulingProblem([Job(1, 4), Job(2, 4), Job(3, 4)], [Resource(1, 6), Resource(2, 6)])
+        for constraint_handling in ("reject", "penalty"):
+            algorithm = IslandGeneticAlgorithm(problem, islands=2, generations=10, seed=1, parallel=False,
+                                               population_size=10, presolve=False,
+                                               constraint_handling=constraint_handling)
+            self.assertIsNone(algorithm.solve())
+            self.assertIsNone(algorithm.best_fitness)
+            self.assertFalse(algorithm.result.found)
+
+        empty = JobSchedulingProblem([], [Resource(1, 5)])
+        for algorithm in (IslandGeneticAlgorithm(empty, parallel=False),
+                          GeneticAlgorithm(empty, stop_at_lower_bound=False)):
+            self.assertEqual(algorithm.solve(), [])
+            self.assertTrue(algorithm.proven_optimal)
+
+
+class TestSelection(unittest.TestCase):
+    """Test cases for the parent selection strategies."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.fitness_values = [7, 3, float('inf'), 3, 5, 9]
+        self.rng = random.Random(4)
+
+    def test_truncation_matches_sorted_order(self):
+        """Test that truncation selection picks the same parents as a stable sort."""
+        ranked = sorted(range(len(self.fitness_values)), key=lambda index: self.fitness_values[index])
+        for count in range(len(self.fitness_values) + 1):
+            self.assertEqual(truncation_selection(self.fitness_values, count, self.rng), ranked[:count])
+
+    def test_tournament_and_roulette_prefer_valid_individuals(self):
+        """Test that tournament and roulette selection return indices and avoid invalid individuals."""
+        tournament = tournament_selection(self.fitness_values, 50, self.rng, tournament_size=30)
+        self.assertLessEqual(set(tournament), {1, 3})
+
+        roulette = roulette_selection(self.fitness_values, 200, self.rng)
+        self.assertEqual(len(roulette), 200)
+        self.assertNotIn(2, roulette)
+
+    def test_genetic_algorithm_selection_parameter(self):
+        """Test that the GA accepts a selection strategy and times every selection."""
+        problem = JobSchedulingProblem([Job(1, 3, None), Job(2, 2, 1)], [Resource(1, 10), Resource(2, 10)])
+        algorithm = GeneticAlgorithm(problem, population_size=10, generations=4, seed=3,
+                                     selection="tournament", stop_at_lower_bound=False)
+        algorithm.evolve()
+        self.assertEqual(len(algorithm.selection_times), 4)
+
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(problem, selection="unknown")
+
+
+class TestFitnessCache(unittest.TestCase):
+    """Test cases for the FitnessCache class."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction and hit/miss counting."""
+        cache = FitnessCache(max_size=2)
+        cache.put((0, 1), 5)
+        cache.put((1, 1), 7)
+        self.assertEqual(cache.get((0, 1)), 5)
+
+        cache.put((1, 0), 9)
+        self.assertNotIn((1, 1), cache)
+        self.assertIsNone(cache.get((1, 1)))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 2)
+
+    def test_zero_size_disables_caching(self):
+        """Test that a zero-sized cache never stores values."""
+        cache = FitnessCache(max_size=0)
+        cache.put((0,), 1)
+        self.assertIsNone(cache.get((0,)))
+
+
+class TestPopulationEvaluator(unittest.TestCase):
+    """Test cases for the PopulationEvaluator class."""
+
+    def test_matches_scalar_fitness(self):
+        """Test that batched fitness matches GeneticAlgorithm.fitness exactly."""
+        random.seed(11)
+        for _ in range(20):
+            jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 13)]
+            resources = [Resource(resource_id, random.randint(10, 40)) for resource_id in range(1, 4)]
+            problem = JobSchedulingProblem(jobs, resources)
+            algorithm = GeneticAlgorithm(problem)
+            evaluator = PopulationEvaluator(problem)
+
+            population = [algorithm.generate_random_schedule() for _ in range(30)]
+            expected = [algorithm.fitness(schedule) for schedule in population]
+            actual = evaluator.evaluate(evaluator.encode(population)).tolist()
+            self.assertEqual(expected, actual)
+
+    def test_matches_scalar_fitness_with_fan_in(self):
+        """Test that batched fitness takes the latest of several predecessors."""
+        random.seed(13)
+        jobs = [Job(job_id, random.randint(1, 8), predecessors=random.sample(range(1, job_id), min(job_id - 1, 3)))
+                for job_id in range(1, 15)]
+        jobs.reverse()
+        resources = [Resource(resource_id, 40) for resource_id in range(1, 5)]
+        problem = JobSchedulingProblem(jobs, resources)
+        algorithm = GeneticAlgorithm(problem)
+        evaluator = PopulationEvaluator(problem)
+
+        population = [algorithm.generate_random_schedule() for _ in range(30)]
+        expected = [algorithm.fitness(schedule) for schedule in population]
+        self.assertEqual(evaluator.evaluate(evaluator.encode(population)).tolist(), expected)
+
+    def test_encode_decode_round_trip(self):
+        """Test that decoding an encoded schedule returns the same assignments."""
+        jobs = [Job(1, 3, None), Job(2, 2, 1)]
+        resources = [Resource(1, 10), Resource(2, 10)]
+        evaluator = PopulationEvaluator(JobSchedulingProblem(jobs, resources))
+        schedule = [(jobs[0], resources[1]), (jobs[1], resources[0])]
+
+        matrix = evaluator.encode([schedule])
+        self.assertEqual(matrix.tolist(), [[1, 0]])
+        self.assertEqual(evaluator.decode(matrix[0]), schedule)
+
+    def test_genetic_algorithm_modes_agree(self):
+        """Test that seeded runs give the same int fitness values with and without batched scoring."""
+        random.seed(17)
+        jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 13)]
+        problem = JobSchedulingProblem(jobs, [Resource(resource_id, 30) for resource_id in range(1, 4)])
+        for constraint_handling in ("reject", "penalty"):
+            runs = [GeneticAlgorithm(problem, generations=20, seed=5, vectorized=vectorized,
+                                     constraint_handling=constraint_handling) for vectorized in (False, True)]
+            for algorithm in runs:
+                algorithm.solve()
+            scalar, vectorized = runs
+            self.assertEqual(scalar.best_fitness, vectorized.best_fitness)
+            self.assertIs(type(vectorized.best_fitness), int)
+            self.assertEqual(scalar.fitness_values, vectorized.fitness_values)
+            self.assertEqual([type(value) for value in scalar.fitness_values],
+                             [type(value) for value in vectorized.fitness_values])
+
 
 class TestRandomGenerator(unittest.TestCase):
     """Test cases for the RandomGenerator class."""
@@ -183,6 +669,780 @@ class TestRandomGenerator(unittest.TestCase):
         self.assertLessEqual(resource.capacity, 20)
 
 
+class TestInstanceGenerator(unittest.TestCase):
+    """Test cases for the seeded instance generator."""
+
+    def test_reproducible_families(self):
+        """Test that an instance depends only on the family seed and its index."""
+        def describe(problem):
+            return ([(job.job_id, job.processing_time, job.predecessors) for job in problem.jobs],
+                    [resource.capacity for resource in problem.resources])
+
+        generator = InstanceGenerator(jobs=30, resources=4, dag="fan_in", seed=11)
+        family = generator.family(3)
+        self.assertEqual(describe(family[2]), describe(InstanceGenerator(jobs=30, resources=4, dag="fan_in",
+                                                                         seed=11).instance(2)))
+        self.assertEqual(describe(generator.family(1, start=1)[0]), describe(family[1]))
+        self.assertNotEqual(describe(family[0]), describe(family[1]))
+        self.assertIsNotNone(InstanceGenerator().seed)
+
+    def test_shapes_and_distributions(self):
+        """Test sizes, duration ranges and that every DAG shape only points back to earlier jobs."""
+        for dag in DAG_SHAPES:
+            for durations in DURATIONS:
+                problem = InstanceGenerator(jobs=200, resources=5, dag=dag, durations=durations, min_duration=2,
+                                            max_duration=30, seed=3).instance()
+                self.assertEqual([job.job_id for job in problem.jobs], list(range(1, 201)))
+                self.assertEqual(len(problem.resources), 5)
+                self.assertTrue(all(2 <= job.processing_time <= 30 for job in problem.jobs))
+                self.assertTrue(all(predecessor < job.job_id for job in problem.jobs for predecessor in job.predecessors))
+                self.assertFalse(problem.dag().has_cycle)
+
+        chains = InstanceGenerator(jobs=50, dag="chain", chains=2, dependency_probability=1.0, seed=1).instance()
+        self.assertEqual([job.dependency for job in chains.jobs[:4]], [None, None, 1, 2])
+        layered = InstanceGenerator(jobs=100, dag="layered", layers=4, max_fan_in=2, seed=1).instance()
+        for job in layered.jobs:
+            layer = (job.job_id - 1) // 25
+            self.assertEqual(len(job.predecessors) > 0, layer > 0)
+            self.assertTrue(all((predecessor - 1) // 25 == layer - 1 for predecessor in job.predecessors))
+            self.assertLessEqual(len(job.predecessors), 2)
+        self.assertFalse(any(job.predecessors for job in InstanceGenerator(jobs=20, dag="independent").instance().jobs))
+
+    def test_tightness(self):
+        """Test that capacities follow the requested tightness, or the legacy range without one."""
+        problem = InstanceGenerator(jobs=500, resources=8, tightness=0.8, capacity_spread=0.3, seed=2).instance()
+        total_work = sum(job.processing_time for job in problem.jobs)
+        total_capacity = sum(resource.capacity for resource in problem.resources)
+        self.assertAlmostEqual(total_work / total_capacity, 0.8, places=2)
+        self.assertGreater(len({resource.capacity for resource in problem.resources}), 1)
+
+        loose = InstanceGenerator(jobs=5, resources=50, seed=2).instance()
+        self.assertTrue(all(3 <= resource.capacity <= 20 for resource in loose.resources))
+
+        with self.assertRaises(ValueError):
+            InstanceGenerator(dag="tree")
+        with self.assertRaises(ValueError):
+            InstanceGenerator(durations="normal")
+        with self.assertRaises(ValueError):
+            InstanceGenerator(tightness=0)
+
+
+class TestScheduleDecoder(unittest.TestCase):
+    """Test cases for the ScheduleDecoder class."""
+
+    def test_decode_times_and_feasibility(self):
+        """Test start/end times, makespan and capacity feasibility."""
+        jobs = [Job(1, 3, None), Job(2, 2, 1), Job(3, 4, None)]
+        resources = [Resource(1, 5), Resource(2, 10)]
+        decoder = ScheduleDecoder(JobSchedulingProblem(jobs, resources))
+
+        decoded = decoder.decode([(jobs[0], resources[0]), (jobs[1], resources[1]), (jobs[2], resources[1])])
+        self.assertEqual(decoded.start_times, {1: 0, 2: 3, 3: 5})
+        self.assertEqual(decoded.end_times, {1: 3, 2: 5, 3: 9})
+        self.assertEqual(decoded.makespan, 9)
+        self.assertTrue(decoded.feasible)
+
+        overloaded = decoder.decode([(jobs[0], resources[0]), (jobs[1], resources[0]), (jobs[2], resources[0])])
+        self.assertFalse(overloaded.feasible)
+
+    def test_dependencies_are_timed_first(self):
+        """Test that a dependency listed after its dependent is still timed first."""
+        jobs = [Job(1, 2, 2), Job(2, 3, None)]
+        resources = [Resource(1, 10), Resource(2, 10)]
+        decoded = ScheduleDecoder(JobSchedulingProblem(jobs, resources)).decode(
+            [(jobs[0], resources[0]), (jobs[1], resources[1])])
+
+        self.assertEqual([job.job_id for job, _ in decoded.assignments], [2, 1])
+        self.assertEqual(decoded.start_times[1], 3)
+
+    def test_fan_in_and_cycles(self):
+        """Test that a job waits for all its predecessors and that cycles are infeasible."""
+        jobs = [Job(1, 2), Job(2, 5), Job(3, 1, predecessors=[1, 2])]
+        resources = [Resource(1, 10), Resource(2, 10)]
+        decoded = ScheduleDecoder(JobSchedulingProblem(jobs, resources)).decode(
+            [(jobs[0], resources[0]), (jobs[1], resources[1]), (jobs[2], resources[0])])
+        self.assertEqual(decoded.start_times[3], 5)
+        self.assertTrue(decoded.feasible)
+
+        cyclic = [Job(1, 2, 2), Job(2, 2, 1)]
+        decoded = ScheduleDecoder(JobSchedulingProblem(cyclic, resources)).decode(
+            [(cyclic[0], resources[0]), (cyclic[1], resources[1])])
+        self.assertFalse(decoded.feasible)
+
+    def test_long_dependency_chain(self):
+        """Test that long dependency chains decode without recursion."""
+        jobs = [Job(job_id, 1, job_id - 1 if job_id > 1 else None) for job_id in range(1, 5001)]
+        resources = [Resource(1, 5000)]
+        problem = JobSchedulingProblem(jobs, resources)
+        algorithm = GeneticAlgorithm(problem)
+
+        self.assertEqual(algorithm.calculate_makespan([(job, resources[0]) for job in jobs]), 5000)
+
+
+class TestPresolve(unittest.TestCase):
+    """Test cases for the presolve stage."""
+
+    def test_forced_removed_and_clamped_resources(self):
+        """Test forced assignments, useless resource removal and capacity clamping."""
+        jobs = [Job(1, 9), Job(2, 3), Job(3, 2, 2)]
+        resources = [Resource(1, 2), Resource(2, 10), Resource(3, 100), Resource(4, 1)]
+        result = presolve(JobSchedulingProblem(jobs, resources))
+
+        self.assertFalse(result.infeasible)
+        self.assertEqual(result.removed_resources, [resources[3]])
+        self.assertEqual([resource.resource_id for resource in result.domains[0]], [2, 3])
+        self.assertEqual([resource.capacity for resource in result.problem.resources], [2, 10, 14])
+        self.assertEqual(result.clamped_resources, [resources[2]])
+        self.assertAlmostEqual(result.search_space_before, math.log10(64))
+        self.assertAlmostEqual(result.search_space_after, math.log10(12))
+        self.assertAlmostEqual(result.reduction(), math.log10(64 / 12))
+
+        reduced_schedule = [(job, result.problem.resources[2]) for job in jobs]
+        self.assertEqual(result.restore(reduced_schedule), [(job, resources[2]) for job in jobs])
+
+    def test_forced_assignments_prove_infeasibility(self):
+        """Test that jobs forced onto the same resource can prove an instance infeasible."""
+        jobs = [Job(1, 6), Job(2, 6), Job(3, 1)]
+        resources = [Resource(1, 8), Resource(2, 5)]
+        result = presolve(JobSchedulingProblem(jobs, resources))
+
+        self.assertTrue(result.infeasible)
+        self.assertEqual(result.search_space_after, -math.inf)
+        self.assertEqual(result.reduction(), math.inf)
+        self.assertIsNone(BacktrackingAlgorithm(JobSchedulingProblem(jobs, resources)).solve())
+
+    def test_solvers_agree_with_and_without_presolve(self):
+        """Test that presolve never changes the optimal makespan."""
+        random.seed(14)
+        for _ in range(20):
+            jobs = [RandomGenerator.generate_random_job(job_id) for job_id in range(1, 7)]
+            resources = [Resource(resource_id, random.randint(1, 25)) for resource_id in range(1, 5)]
+            problem = JobSchedulingProblem(jobs, resources)
+
+            reduced = BacktrackingAlgorithm(problem)
+            plain = BacktrackingAlgorithm(problem, presolve=False)
+            reduced.solve()
+            plain.solve()
+
+            self.assertEqual(reduced.best_makespan, plain.best_makespan)
+            if reduced.best_schedule is not None:
+                self.assertTrue(reduced.is_valid_schedule(reduced.best_schedule))
+                self.assertTrue(all(resource in resources for _, resource in reduced.best_schedule))
+
+    def test_genetic_algorithm_uses_domains(self):
+        """Test that GA genes only take resources their job fits on."""
+        jobs = [Job(1, 9), Job(2, 3), Job(3, 1)]
+        resources = [Resource(1, 4), Resource(2, 10)]
+        algorithm = GeneticAlgorithm(JobSchedulingProblem(jobs, resources), seed=2)
+
+        schedule = algorithm.generate_random_schedule()
+        self.assertEqual(schedule[0][1], resources[1])
+        chromosome = algorithm.random_chromosome()
+        for _ in range(20):
+            self.assertEqual(algorithm.mutate(chromosome)[0], 1)
+
+
+class TestLocalSearch(unittest.TestCase):
+    """Test cases for the local search post-optimizer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(15)
+        self.jobs = [Job(job_id, random.randint(1, 9), predecessors=random.sample(range(1, job_id), min(job_id - 1, 2)))
+                     for job_id in range(1, 11)]
+        random.shuffle(self.jobs)
+        self.resources = [Resource(resource_id, random.randint(15, 30)) for resource_id in range(1, 4)]
+        self.problem = JobSchedulingProblem(self.jobs, self.resources)
+        self.schedule = [(job, random.choice(self.resources)) for job in self.jobs]
+
+    def test_incremental_scores_match_full_decoding(self):
+        """Test that move and swap deltas match a full decode, and that applying them retimes like a rebuild."""
+        decoder = ScheduleDecoder(self.problem)
+        state = IncrementalSchedule(self.problem, self.schedule)
+        for _ in range(50):
+            # A dict drops a second change to the same job.
+            changes = list(dict([(random.randrange(10), random.randrange(3)),
+                                 (random.randrange(10), random.randrange(3))]).items())
+            end_times = list(state.end_times)
+            score = state.evaluate(changes)
+            self.assertEqual(state.end_times, end_times)
+
+            changed = state.schedule()
+            for index, resource_index in changes:
+                changed[index] = (changed[index][0], self.resources[resource_index])
+            decoded = decoder.decode(changed)
+            overload = sum(max(decoded.resource_load[resource.resource_id] - resource.capacity, 0)
+                           for resource in self.resources)
+            self.assertEqual(score, (overload, decoded.makespan, sum(decoded.resource_end.values())))
+            state.apply(changes)
+
+            rebuilt = IncrementalSchedule(self.problem, state.schedule())
+            self.assertEqual(state.score, score)
+            self.assertEqual((state.end_times, state.timeline_positions, state.timeline_ends, state.prefix_makespan),
+                             (rebuilt.end_times, rebuilt.timeline_positions, rebuilt.timeline_ends,
+                              rebuilt.prefix_makespan))
+
+    def test_strategies_never_worsen_a_schedule(self):
+        """Test that every strategy keeps the job order and returns a schedule at least as good."""
+        start = IncrementalSchedule(self.problem, self.schedule).score
+        for strategy in STRATEGIES:
+            search = LocalSearch(self.problem, strategy=strategy, max_iterations=30, seed=1)
+            improved = search.improve(self.schedule)
+            self.assertEqual([job for job, _ in improved], self.jobs)
+            self.assertLessEqual(IncrementalSchedule(self.problem, improved).score, start)
+        self.assertIsNone(polish(self.problem, None))
+
+    def test_genetic_algorithm_memetic_step(self):
+        """Test that the memetic GA finds a schedule at least as good as the plain GA."""
+        plain = GeneticAlgorithm(self.problem, population_size=10, generations=5, seed=4)
+        memetic = GeneticAlgorithm(self.problem, population_size=10, generations=5, seed=4, local_search="steepest")
+        plain.evolve()
+        memetic.evolve()
+        self.assertLessEqual(memetic.best_fitness, plain.best_fitness)
+
+
+class TestListScheduling(unittest.TestCase):
+    """Test cases for the list-scheduling heuristics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(16)
+        self.jobs = [Job(job_id, random.randint(1, 9), predecessors=random.sample(range(1, job_id), min(job_id - 1, 2)))
+                     for job_id in range(1, 21)]
+        random.shuffle(self.jobs)
+        self.resources = [Resource(resource_id, 40) for resource_id in range(1, 5)]
+        self.problem = JobSchedulingProblem(self.jobs, self.resources)
+
+    def test_heuristics_build_valid_schedules(self):
+        """Test that every heuristic returns a valid schedule in problem job order."""
+        decoder = ScheduleDecoder(self.problem)
+        for name, heuristic in HEURISTICS.items():
+            schedule = heuristic(self.problem)
+            self.assertEqual([job for job, _ in schedule], self.jobs, name)
+            self.assertTrue(decoder.decode(schedule).feasible, name)
+
+    def test_earliest_finish_matches_decoder(self):
+        """Test that earliest finish time spreads independent jobs over idle resources."""
+        jobs = [Job(1, 4), Job(2, 3), Job(3, 2, 1), Job(4, 1)]
+        problem = JobSchedulingProblem(jobs, [Resource(1, 10), Resource(2, 10)])
+        schedule = earliest_finish_schedule(problem)
+        self.assertEqual(ScheduleDecoder(problem).decode(schedule).makespan, 6)
+
+    def test_best_fit_respects_tight_capacities(self):
+        """Test that best fit packs a tight instance and gives up when a job fits nowhere."""
+        jobs = [Job(1, 6), Job(2, 4), Job(3, 5), Job(4, 5)]
+        problem = JobSchedulingProblem(jobs, [Resource(1, 10), Resource(2, 10)])
+        self.assertTrue(ScheduleDecoder(problem).decode(best_fit_schedule(problem)).feasible)
+
+        problem = JobSchedulingProblem(jobs, [Resource(1, 9), Resource(2, 11)])
+        self.assertIsNone(best_fit_schedule(problem))
+
+    def test_list_scheduler_solver(self):
+        """Test that the standalone solver keeps the best heuristic and rejects unknown ones."""
+        solver = ListScheduler(self.problem)
+        schedule = solver.solve()
+        makespans = [ScheduleDecoder(self.problem).decode(heuristic(self.problem)).makespan
+                     for heuristic in HEURISTICS.values()]
+        self.assertIsNotNone(schedule)
+        self.assertEqual(solver.best_makespan, min(makespans))
+        self.assertIn(solver.best_heuristic, HEURISTICS)
+        with self.assertRaises(ValueError):
+            ListScheduler(self.problem, heuristic="random")
+
+    def test_genetic_algorithm_seeding(self):
+        """Test that seed_fraction puts heuristic schedules into the initial population."""
+        ga = GeneticAlgorithm(self.problem, population_size=10, generations=0, seed=2, seed_fraction=0.5)
+        ga.initialize_population()
+        self.assertEqual(len(ga.population), 10)
+        for chromosome in ga.population[:len(HEURISTICS)]:
+            self.assertTrue(ga.is_valid_schedule(ga.decode_chromosome(chromosome)))
+
+        ga.evolve()
+        solver = ListScheduler(self.problem)
+        solver.solve()
+        self.assertLessEqual(ga.best_fitness, solver.best_makespan)
+
+
+class TestConstraintHandling(unittest.TestCase):
+    """Test cases for repair, penalty fitness and capacity-aware mutation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.jobs = [Job(1, 6), Job(2, 4), Job(3, 5), Job(4, 5, 1)]
+        self.resources = [Resource(1, 10), Resource(2, 10)]
+        self.problem = JobSchedulingProblem(self.jobs, self.resources)
+
+    def test_repair_moves_jobs_off_overloaded_resources(self):
+        """Test that repair clears an overload and leaves valid assignments alone."""
+        times = [6, 4, 5, 5]
+        domains = [[0, 1]] * 4
+        repaired = repair_assignment([0, 0, 0, 1], times, [10, 10], domains)
+        loads = [sum(time for time, resource in zip(times, repaired) if resource == index) for index in (0, 1)]
+        self.assertEqual(loads, [10, 10])
+
+        valid = [0, 0, 1, 1]
+        self.assertIs(repair_assignment(valid, times, [10, 10], domains), valid)
+        self.assertEqual(repair_assignment([0, 0, 0, 1], times, [10, 10], [[0]] * 4), [0, 0, 0, 1])
+
+    def test_penalty_fitness_ranks_overload(self):
+        """Test that penalized schedules rank by overload, after every valid one, in both evaluators."""
+        ga = GeneticAlgorithm(self.problem, constraint_handling="penalty", vectorized=False)
+        vectorized = GeneticAlgorithm(self.problem, constraint_handling="penalty")
+        population = ga.stack([[0, 0, 1, 1], [0, 1, 1, 0], [0, 0, 0, 1]])
+        schedules = [ga.decode_chromosome(chromosome) for chromosome in population]
+
+        fitness = [ga.fitness(schedule) for schedule in schedules]
+        self.assertEqual(fitness, [11, penalized_makespan(11, 1, 20), penalized_makespan(15, 5, 20)])
+        self.assertLess(fitness[0], fitness[1])
+        self.assertLess(fitness[1], fitness[2])
+        self.assertTrue(ga.is_feasible_fitness(fitness[0]))
+        self.assertFalse(ga.is_feasible_fitness(fitness[1]))
+        self.assertEqual(vectorized.evaluate_population(population), fitness)
+
+    def test_capacity_aware_mutation(self):
+        """Test that capacity-aware mutation only moves a job to a resource with room for it."""
+        problem = JobSchedulingProblem(self.jobs, [Resource(1, 10), Resource(2, 20), Resource(3, 3)])
+        ga = GeneticAlgorithm(problem, seed=3, mutation="capacity_aware", presolve=False)
+        chromosome = ga.stack([[0, 0, 0, 0]])[0]
+        for _ in range(20):
+            mutated = ga.mutate(chromosome)
+            self.assertEqual(sorted(mutated.tolist()), [0, 0, 0, 1])
+        self.assertEqual(chromosome.tolist(), [0, 0, 0, 0])
+
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(self.problem, mutation="swap")
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(self.problem, constraint_handling="ignore")
+
+    def test_repair_mode_finds_a_valid_schedule(self):
+        """Test that repair mode records when the first valid schedule was found."""
+        ga = GeneticAlgorithm(self.problem, population_size=10, generations=5, seed=1,
+                              constraint_handling="repair", mutation="capacity_aware")
+        ga.evolve()
+        self.assertEqual(ga.first_feasible_generation, 0)
+        self.assertGreaterEqual(ga.first_feasible_time, 0)
+        self.assertTrue(ga.is_valid_schedule(ga.best_schedule))
+
+
+class TestExactAlgorithm(unittest.TestCase):
+    """Test cases for the MILP-based exact solver."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(18)
+        self.problems = []
+        for _ in range(10):
+            jobs = [Job(job_id, random.randint(1, 9), predecessors=random.sample(range(1, job_id), min(job_id - 1, 1)))
+                    for job_id in range(1, random.randint(4, 8))]
+            random.shuffle(jobs)
+            resources = [Resource(resource_id, random.randint(8, 25)) for resource_id in range(1, random.randint(2, 4))]
+            self.problems.append(JobSchedulingProblem(jobs, resources))
+
+    def test_matches_branch_and_bound(self):
+        """Test that both backends prove the same optimum as the backtracking search."""
+        for problem in self.problems:
+            expected = BacktrackingAlgorithm(problem)
+            expected.solve()
+            for backend in ("milp", "branch_and_bound"):
+                exact = ExactAlgorithm(problem, backend=backend)
+                schedule = exact.solve()
+                self.assertEqual(exact.best_makespan, expected.best_makespan)
+                if schedule is not None:
+                    self.assertEqual(exact.status, "optimal")
+                    self.assertEqual(exact.optimality_gap, 0.0)
+                    self.assertTrue(expected.is_valid_schedule(schedule))
+
+    def test_time_limit_returns_incumbent(self):
+        """Test that a run without time returns the heuristic incumbent and a proven gap."""
+        random.seed(7)
+        jobs = [Job(job_id, random.randint(1, 10)) for job_id in range(1, 17)]
+        resources = [Resource(resource_id, 30) for resource_id in range(1, 5)]
+        exact = ExactAlgorithm(JobSchedulingProblem(jobs, resources), time_limit=0)
+        self.assertIsNotNone(exact.solve())
+        self.assertEqual(exact.status, "time_limit")
+        self.assertGreaterEqual(exact.optimality_gap, 0.0)
+        self.assertLess(exact.optimality_gap, 1.0)
+
+    def test_infeasible_and_invalid_backend(self):
+        """Test that infeasible problems report why and unknown backends are rejected."""
+        problem = JobSchedulingProblem([Job(1, 5), Job(2, 6)], [Resource(1, 8)])
+        exact = ExactAlgorithm(problem)
+        self.assertIsNone(exact.solve())
+        self.assertEqual(exact.status, "infeasible")
+        self.assertIsNotNone(exact.infeasibility)
+        with self.assertRaises(ValueError):
+            ExactAlgorithm(problem, backend="cplex")
+
+    def test_empty_instances_are_solved_trivially(self):
+        """Test that instances with no jobs get the empty schedule instead of an empty MILP."""
+        for resources in ([Resource(1, 5)], []):
+            for presolve in (True, False):
+                exact = ExactAlgorithm(JobSchedulingProblem([], resources), presolve=presolve)
+                self.assertEqual(exact.solve(), [])
+                self.assertEqual(exact.status, "optimal")
+                self.assertTrue(exact.proven_optimal)
+
+    @unittest.skipIf(milp is None, "scipy.optimize.milp is not installed")
+    def test_milp_statuses(self):
+        """Test that each MILP status is reported as such and only a set time limit counts as one."""
+        problem = JobSchedulingProblem([Job(1, 3), Job(2, 4), Job(3, 5)], [Resource(1, 10), Resource(2, 10)])
+        cases = [(1, None, "iteration_limit"), (1, 60, "time_limit"), (3, None, "unbounded"),
+                 (4, None, "numerical_error"), (2, None, "numerical_error")]
+        for milp_status, time_limit, expected in cases:
+            outcome = types.SimpleNamespace(status=milp_status, x=None, mip_dual_bound=None)
+            with mock.patch("algorithms.exact_algorithm.milp", return_value=outcome):
+                exact = ExactAlgorithm(problem, time_limit=time_limit)
+                # The heuristic incumbent is kept whatever the MILP reports.
+                self.assertIsNotNone(exact.solve())
+            self.assertEqual(exact.status, expected)
+            self.assertEqual(exact.interrupted, "time_limit" if expected == "time_limit" else None)
+
+
+class TestAnytimeSolver(unittest.TestCase):
+    """Test cases for deadlines, cancellation and improvement callbacks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(19)
+        self.jobs = [Job(job_id, random.randint(1, 9)) for job_id in range(1, 15)]
+        self.resources = [Resource(resource_id, 40) for resource_id in range(1, 4)]
+        self.problem = JobSchedulingProblem(self.jobs, self.resources)
+
+    def test_improvements_are_reported_in_order(self):
+        """Test that every solver reports strictly better incumbents and ends with its result."""
+        solvers = [
+            lambda callback: BacktrackingAlgorithm(self.problem, on_improvement=callback),
+            lambda callback: GeneticAlgorithm(self.problem, population_size=10, generations=10, seed=1,
+                                              on_improvement=callback),
+            lambda callback: ExactAlgorithm(self.problem, on_improvement=callback),
+        ]
+        for build in solvers:
+            improvements = []
+            solver = build(lambda schedule, makespan, elapsed: improvements.append((makespan, elapsed)))
+            result = solver.run()
+
+            makespans = [makespan for makespan, _ in improvements]
+            self.assertEqual(makespans, sorted(set(makespans), reverse=True))
+            self.assertEqual(makespans[-1], result.makespan)
+            self.assertEqual([elapsed for _, elapsed in improvements],
+                             sorted(elapsed for _, elapsed in improvements))
+
+    def test_cancellation_returns_best_so_far(self):
+        """Test that cancelling from a callback stops the search with its incumbent, unproven."""
+        token = CancellationToken()
+        algorithm = BacktrackingAlgorithm(self.problem, cancel_token=token,
+                                          on_improvement=lambda schedule, makespan, elapsed: token.cancel())
+        algorithm.BOUND_SYNC_INTERVAL = 1
+        self.assertTrue(algorithm.run().found)
+        self.assertEqual(algorithm.interrupted, "cancelled")
+
+        ga = GeneticAlgorithm(self.problem, population_size=10, generations=50, cancel_token=token)
+        self.assertTrue(ga.run().feasible)
+        self.assertEqual(ga.stop_reason, "cancelled")
+        self.assertEqual(ga.generations_run, 0)
+
+    def test_cancellation_stops_parallel_workers(self):
+        """Test that cancelling a parallel search stops the running subproblems and returns promptly."""
+        problem = InstanceGenerator(jobs=30, resources=5, dag="fan_in", tightness=0.97, capacity_spread=0.5,
+                                    seed=3).instance(0)
+        token = CancellationToken()
+        algorithm = BacktrackingAlgorithm(problem, workers=2, cancel_token=token)
+        timer = threading.Timer(0.5, token.cancel)
+        timer.start()
+        try:
+            result = algorithm.run()
+        finally:
+            timer.cancel()
+        self.assertEqual(algorithm.interrupted, "cancelled")
+        self.assertLess(result.stats['elapsed'], 5.0)
+        self.assertFalse(algorithm.proven_optimal)
+
+    def test_proven_optimal(self):
+        """Test that proofs come from a finished search or from meeting the lower bound."""
+        ga = GeneticAlgorithm(JobSchedulingProblem([Job(1, 3), Job(2, 3)], [Resource(1, 5), Resource(2, 5)]),
+                              population_size=10, generations=20, seed=2)
+        ga.run()
+        self.assertTrue(ga.proven_optimal)
+
+        algorithm = BacktrackingAlgorithm(self.problem, time_limit=0)
+        algorithm.BOUND_SYNC_INTERVAL = 1
+        algorithm.run()
+        self.assertFalse(algorithm.proven_optimal)
+
+
+class TestScheduleResult(unittest.TestCase):
+    """Test cases for structured solver results."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.jobs = [Job(1, 3), Job(2, 2, 1), Job(3, 4)]
+        self.resources = [Resource(1, 15), Resource(2, 10)]
+        self.problem = JobSchedulingProblem(self.jobs, self.resources)
+
+    def test_result_contents(self):
+        """Test times, makespan, utilization and stats of a result, and that it cannot be changed."""
+        schedule = [(self.jobs[0], self.resources[0]), (self.jobs[1], self.resources[0]),
+                    (self.jobs[2], self.resources[1])]
+        result = ScheduleResult(self.problem, schedule, "Manual", elapsed=0.5)
+
+        self.assertTrue(result.found)
+        self.assertTrue(result.feasible)
+        self.assertEqual(result.makespan, 5)
+        self.assertEqual(dict(result.end_times), {1: 3, 2: 5, 3: 4})
+        self.assertEqual(dict(result.utilization), {1: 1.0, 2: 0.8})
+        self.assertEqual(result.stats['elapsed'], 0.5)
+        with self.assertRaises(AttributeError):
+            result.makespan = 1
+        with self.assertRaises(TypeError):
+            result.stats['elapsed'] = 1
+
+        empty = ScheduleResult(self.problem, None, "Manual", infeasibility="no room")
+        self.assertFalse(empty.found)
+        self.assertIsNone(empty.makespan)
+        self.assertEqual(empty.render(), "No valid schedule found: no room.")
+
+    def test_genetic_algorithm_never_returns_an_invalid_schedule(self):
+        """Test that the GA returns None, like its result, when no valid schedule exists."""
+        problem = JobSchedulingProblem([Job(1, 4), Job(2, 4), Job(3, 4)], [Resource(1, 6), Resource(2, 6)])
+        for constraint_handling in ("reject", "penalty"):
+            ga = GeneticAlgorithm(problem, population_size=10, generations=5, seed=1, presolve=False,
+                                  constraint_handling=constraint_handling)
+            self.assertIsNone(ga.solve())
+            self.assertIsNone(ga.best_schedule)
+            self.assertFalse(ga.result.found)
+
+    def test_solvers_are_silent_unless_verbose(self):
+        """Test that solvers print nothing by default and render their result when verbose."""
+        for verbose in (False, True):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                results = [BacktrackingAlgorithm(self.problem, verbose=verbose).run(),
+                           GeneticAlgorithm(self.problem, population_size=10, generations=5, seed=1,
+                                            verbose=verbose).run(),
+                           ExactAlgorithm(self.problem, verbose=verbose).run(),
+                           ListScheduler(self.problem, verbose=verbose).run()]
+            self.assertEqual(bool(output.getvalue()), verbose)
+            self.assertEqual([result.makespan for result in results], [5, 5, 5, 5])
+            self.assertEqual(results[0].stats['proven_optimal'], True)
+
+
+class TestBatchEvaluator(unittest.TestCase):
+    """Test cases for parallel batch evaluation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        rng = random.Random(5)
+        self.instances = []
+        for _ in range(4):
+            jobs = [Job(job_id, rng.randint(1, 6)) for job_id in range(1, 6)]
+            self.instances.append(JobSchedulingProblem(jobs, [Resource(1, 30), Resource(2, 30)]))
+        self.solvers = [SolverConfig("backtracking", "Backtracking"), SolverConfig("list", "List")]
+
+    def test_parallel_matches_serial(self):
+        """Test that a process pool streams every task and agrees with solving each instance directly."""
+        parallel = BatchEvaluator(self.instances, self.solvers, workers=2).evaluate()
+        serial = BatchEvaluator(self.instances, self.solvers, parallel=False).evaluate()
+
+        self.assertEqual([(batch.instance_index, batch.label) for batch in parallel],
+                         [(index, label) for index in range(4) for label in ("Backtracking", "List")])
+        self.assertEqual([batch.result.makespan for batch in parallel], [batch.result.makespan for batch in serial])
+        for batch in parallel[::2]:
+            expected = BacktrackingAlgorithm(self.instances[batch.instance_index]).run()
+            self.assertEqual(batch.result.makespan, expected.makespan)
+            self.assertTrue(batch.result.feasible)
+            # Results are rebuilt on this process's own job objects.
+            first_job = batch.result.assignments[0][0]
+            self.assertTrue(any(job is first_job for job in self.instances[batch.instance_index].jobs))
+
+    def test_timeouts_and_errors(self):
+        """Test that the timeout stops slow solvers and a failing solver is reported, not raised."""
+        solvers = [SolverConfig("genetic", population_size=10, generations=100000, stop_at_lower_bound=False),
+                   SolverConfig("genetic", "broken", selection="unknown")]
+        results = BatchEvaluator(self.instances[:1], solvers, timeout=0.05, parallel=False).evaluate()
+
+        self.assertEqual(results[0].result.stats['interrupted'], "time_limit")
+        self.assertTrue(results[0].result.found)
+        self.assertIsNone(results[1].result)
+        self.assertIn("Selection must be one of", results[1].error)
+
+        with self.assertRaises(ValueError):
+            SolverConfig("unknown")
+        with self.assertRaises(ValueError):
+            BatchEvaluator(self.instances, [SolverConfig("list"), SolverConfig("list")])
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for solver timing and resource instrumentation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        jobs = [Job(1, 3), Job(2, 2, 1), Job(3, 4), Job(4, 1)]
+        self.problem = JobSchedulingProblem(jobs, [Resource(1, 15), Resource(2, 10)])
+
+    def test_summarize(self):
+        """Test the median, p95 and stddev of a set of measurements."""
+        summary = summarize(list(range(1, 21)))
+        self.assertEqual(summary['median'], 10.5)
+        self.assertAlmostEqual(summary['p95'], 19.05)
+        self.assertAlmostEqual(summary['stddev'], 5.9160797831)
+        self.assertEqual(summarize([3]), {'median': 3, 'p95': 3, 'stddev': 0.0})
+
+    def test_profile_solver(self):
+        """Test repeated runs, solver counters, peak memory and JSON and CSV export."""
+        backtracking = profile_solver(lambda: BacktrackingAlgorithm(self.problem), repeats=3, warmup=1)
+        genetic = profile_solver(lambda: GeneticAlgorithm(self.problem, population_size=10, generations=5,
+                                                          stop_at_lower_bound=False, seed=1),
+                                 "GA", repeats=2, warmup=0, trace_memory=False)
+
+        summary = backtracking.summary()
+        self.assertEqual(summary['label'], "Backtracking Algorithm")
+        self.assertEqual(summary['runs'], 3)
+        self.assertEqual(summary['makespan'], 5)
+        self.assertGreater(summary['nodes_expanded'], 0)
+        self.assertGreater(summary['wall_time_median'], 0)
+        self.assertGreater(backtracking.peak_memory, 0)
+        self.assertIsNone(genetic.peak_memory)
+        self.assertEqual(genetic.summary()['generations_run'], 5)
+        self.assertEqual(genetic.runs[0].counters['fitness_evaluations'] + genetic.runs[0].counters['cache_hits'],
+                         10 * 6)
+
+        # Counters cover one run even when the solver, and its cache, are reused.
+        ga = GeneticAlgorithm(self.problem, population_size=10, generations=5, seed=1, stop_at_lower_bound=False)
+        first, second = ga.run(), ga.run()
+        for result in (first, second):
+            self.assertEqual(result.stats['fitness_evaluations'] + result.stats['cache_hits'], 10 * 6)
+        self.assertEqual(ga.fitness_cache.hits, first.stats['cache_hits'] + second.stats['cache_hits'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "profiles.json")
+            csv_path = os.path.join(directory, "profiles.csv")
+            export_json([backtracking, genetic], json_path)
+            export_csv([backtracking, genetic], csv_path)
+            with open(json_path) as file:
+                exported = json.load(file)
+            with open(csv_path, newline="") as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(exported[0]['runs']), 3)
+        self.assertEqual(exported[1]['summary']['label'], "GA")
+        self.assertEqual([row['label'] for row in rows], ["Backtracking Algorithm", "GA"])
+        self.assertEqual(rows[1]['nodes_expanded'], "")
+
+        with self.assertRaises(ValueError):
+            profile_solver(lambda: BacktrackingAlgorithm(self.problem), repeats=0)
+
+    def test_scheduler_evaluator_profiles(self):
+        """Test that the evaluator records a profile per algorithm and its median time."""
+        evaluator = SchedulerEvaluator(self.problem)
+        evaluator.run_algorithms(repeats=3)
+        self.assertEqual([profile.label for profile in evaluator.profiles], ["Backtracking", "Genetic"])
+        self.assertEqual(evaluator.backtracking_results[0][1], evaluator.profiles[0].summary()['wall_time_median'])
+        self.assertEqual(len(evaluator.backtracking_results[0][0]), 4)
+
+
+class TestSchedulerEvaluator(unittest.TestCase):
+    """Test cases for the numeric algorithm comparison."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.jobs = [Job(1, 3), Job(2, 2, 1), Job(3, 4)]
+        self.resources = [Resource(1, 15), Resource(2, 6)]
+        self.problem = JobSchedulingProblem(self.jobs, self.resources)
+        self.optimal = [(self.jobs[0], self.resources[0]), (self.jobs[1], self.resources[0]),
+                        (self.jobs[2], self.resources[1])]
+        self.serial = [(job, self.resources[0]) for job in self.jobs]
+        self.overloaded = [(job, self.resources[1]) for job in self.jobs]
+
+    def test_evaluate_performance(self):
+        """Test winner, gap, speedup and utilization of each recorded pair of runs."""
+        evaluator = SchedulerEvaluator(self.problem)
+        evaluator.backtracking_results = [(self.optimal, 0.5), (self.serial, 0.5), (self.optimal, 0.5), (None, 0.5)]
+        evaluator.genetic_results = [(self.serial, 0.25), (self.optimal, 0.25), (self.optimal, 0.0),
+                                     (self.overloaded, 0.25)]
+        comparisons, avg_backtracking_time, avg_genetic_time = evaluator.evaluate_performance()
+
+        self.assertTrue(all(isinstance(comparison, ComparisonMetrics) for comparison in comparisons))
+        self.assertEqual([comparison.winner for comparison in comparisons], ["backtracking", "genetic", "tie", "none"])
+        self.assertEqual(comparisons[0].backtracking_makespan, 5)
+        self.assertEqual(comparisons[0].genetic_makespan, 9)
+        self.assertAlmostEqual(comparisons[0].gap, 0.8)
+        self.assertEqual(comparisons[0].speedup, 2.0)
+        self.assertAlmostEqual(comparisons[0].backtracking_utilization, 0.9)
+        self.assertEqual(comparisons[0].genetic_utilization, 0.5)
+        self.assertIsNone(comparisons[2].speedup)
+        # An overloaded schedule counts as not found.
+        self.assertIsNone(comparisons[3].genetic_makespan)
+        self.assertIsNone(comparisons[3].gap)
+        self.assertEqual(avg_backtracking_time, 0.5)
+        self.assertEqual(avg_genetic_time, 0.1875)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test cases for the benchmark suite and its regression check."""
+
+    def test_baseline_round_trip(self):
+        """Test that a run saved as a baseline passes against itself and records every sweep point."""
+        arguments = ['--backtracking-jobs', '6', '--genetic-jobs', '6', '--populations', '10',
+                     '--generations', '5', '--instances', '1', '--repeats', '1', '--tightness', '0.5', '--min-time', '10']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(run_benchmark_suite(arguments + ['--save-baseline', path]), 0)
+                self.assertEqual(run_benchmark_suite(arguments + ['--baseline', path]), 0)
+                # Other instances share no key with the baseline, so nothing is compared.
+                self.assertEqual(run_benchmark_suite(arguments + ['--seed', '2', '--baseline', path]), 0)
+            with open(path) as file:
+                baseline = json.load(file)
+
+        family = "dag=layered/tightness=0.5/seed=1/instances=1"
+        self.assertEqual(sorted(baseline), [f"backtracking/jobs=6/resources=3/{family}",
+                                            f"genetic/jobs=6/resources=3/population=10/generations=5/{family}"])
+        self.assertIn("2 point(s) not in the baseline", output.getvalue())
+        row = baseline[f"backtracking/jobs=6/resources=3/{family}"]
+        self.assertEqual((row['quality'], row['found'], row['reference']), (1.0, 1, "optimum"))
+        self.assertGreater(row['peak_memory'], 0)
+
+    def test_find_regressions(self):
+        """Test the time, memory, quality and found thresholds of the regression check."""
+        baseline = {"point": {"wall_time_median": 0.1, "peak_memory": 1000, "quality": 1.0, "found": 3}}
+        same = {"key": "point", "wall_time_median": 0.12, "peak_memory": 1200, "quality": 1.01, "found": 3}
+        worse = {"key": "point", "wall_time_median": 0.2, "peak_memory": 1300, "quality": 1.05, "found": 2}
+        new_point = dict(worse, key="other")
+
+        self.assertEqual(find_regressions([same, new_point], baseline, 0.25, 0.001, 0.02), [])
+        self.assertEqual([metric for _, metric, _, _ in find_regressions([worse], baseline, 0.25, 0.001, 0.02)],
+                         ["wall_time_median", "peak_memory", "quality", "found"])
+        self.assertEqual([metric for _, metric, _, _ in find_regressions([worse], baseline, 0.25, 1.0, 0.02)],
+                         ["peak_memory", "quality", "found"])
+
+
+class TestDagIndex(unittest.TestCase):
+    """Test cases for the DagIndex class."""
+
+    def test_order_and_critical_path(self):
+        """Test topological order, earliest starts and critical path lengths."""
+        jobs = [Job(1, 4, predecessors=[2, 3]), Job(2, 3), Job(3, 1, 2), Job(4, 2)]
+        dag = JobSchedulingProblem(jobs, [Resource(1, 10)]).dag()
+
+        self.assertEqual(dag.order, [1, 2, 0, 3])
+        self.assertEqual(dag.successors[1], [0, 2])
+        self.assertEqual(dag.earliest_start, [4, 0, 3, 0])
+        self.assertEqual(dag.tail, [4, 8, 5, 2])
+        self.assertEqual(dag.critical_path_length, 8)
+        self.assertFalse(dag.has_cycle)
+        self.assertIsNone(dag.find_cycle())
+
+    def test_cycle_and_missing_predecessors(self):
+        """Test that cycles are found and missing predecessors are reported."""
+        jobs = [Job(1, 1, 3), Job(2, 1, 1), Job(3, 1, 2), Job(4, 1, 3), Job(5, 1, 9)]
+        dag = DagIndex(jobs)
+
+        self.assertEqual(dag.cyclic, [0, 1, 2, 3])
+        self.assertEqual(sorted(dag.find_cycle()), [0, 1, 2])
+        self.assertEqual(dag.missing, {4: (9,)})
+        self.assertEqual(dag.order[0], 4)
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete system."""
     
@@ -0,0 +1,192 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from algorithms.backtracking_algorithm import BacktrackingAlgorithm
+from algorithms.exact_algorithm import ExactAlgorithm
+from algorithms.genetic_algorithm import GeneticAlgorithm
+from algorithms.list_scheduling import ListScheduler
+from models.schedule_result import ScheduleResult
+
+SOLVERS = {
+    "backtracking": BacktrackingAlgorithm,
+    "genetic": GeneticAlgorithm,
+    "exact": ExactAlgorithm,
+    "list": ListScheduler,
+}
+
+_worker_instances = None
+
+
+def _init_worker(instances):
+    global _worker_instances
+    _worker_instances = instances
+
+
+def _run_task(task):
+    instance_index, config_index, config, timeout = task
+    return (instance_index, config_index) + config.run(_worker_instances[instance_index], timeout)
+
+
+class SolverConfig:
+    """
+    One solver and the options it runs with in a batch.
+
+    Attributes:
+        solver (str): Key of the solver class in SOLVERS
+        label (str): Name the solver's results are reported under
+        options (dict): Keyword arguments passed to the solver's constructor
+    """
+
+    def __init__(self, solver, label=None, **options):
+        """
+        Initialize a solver configuration.
+
+        Args:
+            solver: Key of the solver class in SOLVERS
+            label: Name to report results under, the solver key by default
+            **options: Keyword arguments for the solver's constructor
+
+        Raises:
+            ValueError: If the solver is unknown
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver must be one of {', '.join(SOLVERS)}")
+        self.solver = solver
+        self.label = label or solver
+        self.options = options
+
+    def __repr__(self):
+        return f"SolverConfig({self.solver!r}, label={self.label!r})"
+
+    def run(self, problem_instance, timeout=None):
+        """
+        Solve one instance and return a picklable summary of the run.
+
+        The timeout becomes the solver's time limit (the tighter of the two
+        when the options already set one), so a slow task stops itself and
+        still returns the best schedule it found.
+
+        Returns:
+            tuple: (solver name, assignment as (job index, resource index) pairs or None, solver stats)
+        """
+        solver = SOLVERS[self.solver](problem_instance, **self.options)
+        if timeout is not None and (solver.time_limit is None or timeout < solver.time_limit):
+            solver.time_limit = timeout
+        result = solver.run()
+
+        job_index = {id(job): index for index, job in enumerate(problem_instance.jobs)}
+        resource_index = {id(resource): index for index, resource in enumerate(problem_instance.resources)}
+        assignment = None
+        if result.found:
+            assignment = [(job_index[id(job)], resource_index[id(resource)]) for job, resource in result.schedule]
+        return result.solver, assignment, dict(result.stats)
+
+
+class BatchResult:
+    """
+    Outcome of one solver on one instance of a batch.
+
+    Attributes:
+        instance_index (int): Position of the instance in the batch
+        label (str): Label of the solver configuration
+        result (Optional[ScheduleResult]): Result of the run, None if the solver raised
+        error (Optional[str]): Error message if the solver raised
+    """
+
+    def __init__(self, instance_index, label, result=None, error=None):
+        self.instance_index = instance_index
+        self.label = label
+        self.result = result
+        self.error = error
+
+    def __repr__(self):
+        return f"BatchResult(instance={self.instance_index}, label={self.label!r}, result={self.result!r})"
+
+
+class BatchEvaluator:
+    """
+    Runs several solver configurations on many instances in a process pool.
+
+    Every (instance, configuration) pair is an independent task. Instances
+    are shipped to each worker once, when the worker starts, so a task only
+    carries indexes. Results stream back through results() in the order the
+    tasks complete, and a solver that raises is reported as an error instead
+    of stopping the batch.
+    """
+
+    def __init__(self, instances, solvers=None, workers=None, timeout=None, parallel=True):
+        """
+        Initialize a batch.
+
+        Args:
+            instances: JobSchedulingProblem instances to solve
+            solvers: SolverConfig objects, backtracking and the genetic algorithm by default
+            workers: Number of worker processes (defaults to the number of CPUs)
+            timeout: Seconds each task may run before its solver stops, None for no limit
+            parallel: Run tasks in worker processes instead of in this process
+
+        Raises:
+            ValueError: If the labels of the configurations are not unique
+        """
+        self.instances = list(instances)
+        self.solvers = list(solvers) if solvers is not None else [
+            SolverConfig("backtracking", "Backtracking"),
+            SolverConfig("genetic", "Genetic", stall_generations=20),
+        ]
+        if len({config.label for config in self.solvers}) != len(self.solvers):
+            raise ValueError("Solver labels must be unique")
+        self.workers = workers
+        self.timeout = timeout
+        self.parallel = parallel
+
+    def tasks(self):
+        return [(instance_index, config_index, config, self.timeout)
+                for instance_index in range(len(self.instances))
+                for config_index, config in enumerate(self.solvers)]
+
+    def batch_result(self, instance_index, config_index, solver, assignment, stats):
+        """Rebuild a worker's summary as a BatchResult on this process's copy of the instance."""
+        problem_instance = self.instances[instance_index]
+        config = self.solvers[config_index]
+        schedule = None
+        if assignment is not None:
+            schedule = [(problem_instance.jobs[job_index], problem_instance.resources[resource_index])
+                        for job_index, resource_index in assignment]
+        result = ScheduleResult(problem_instance, schedule, solver, **stats)
+        return BatchResult(instance_index, config.label, result)
+
+    def results(self):
+        """
+        Solve every task and yield a BatchResult as each one completes.
+
+        Yields:
+            BatchResult: Result of one solver configuration on one instance
+        """
+        tasks = self.tasks()
+        if not self.parallel:
+            for instance_index, config_index, config, timeout in tasks:
+                try:
+                    summary = config.run(self.instances[instance_index], timeout)
+                except Exception as e:
+                    yield BatchResult(instance_index, config.label, error=str(e))
+                else:
+                    yield self.batch_result(instance_index, config_index, *summary)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.instances,)) as executor:
+            futures = {executor.submit(_run_task, task): task for task in tasks}
+            try:
+                for future in as_completed(futures):
+                    instance_index, config_index, config, _ = futures[future]
+                    try:
+                        summary = future.result()
+                    except Exception as e:
+                        yield BatchResult(instance_index, config.label, error=str(e))
+                    else:
+                        yield self.batch_result(*summary)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def evaluate(self):
+        """Solve every task and return the results sorted by instance and configuration."""
+        order = {config.label: index for index, config in enumerate(self.solvers)}
+        return sorted(self.results(), key=lambda batch: (batch.instance_index, order[batch.label]))
\ No newline at end of file
@@ -0,0 +1,172 @@
+import numpy as np
+from models.job import Job
+from models.resource import Resource
+from models.job_scheduling_problem import JobSchedulingProblem
+
+DURATIONS = ("uniform", "exponential", "lognormal", "bimodal")
+DAG_SHAPES = ("independent", "chain", "layered", "fan_in")
+
+
+class InstanceGenerator:
+    """
+    Seeded generator of families of random problem instances.
+
+    Instance i of a family is drawn from its own child of the family seed, so
+    it is the same whichever other instances are generated, in whatever
+    order. Processing times, predecessors and capacities are drawn as NumPy
+    arrays; only the final Job and Resource objects are built one by one.
+
+    Predecessors always come from earlier jobs, so every instance is
+    acyclic. The shapes are:
+        independent: No dependencies
+        chain: Job i depends on job i - chains with probability dependency_probability
+            (one chain reproduces RandomGenerator's dependencies)
+        layered: Jobs are split into layers; each job after the first layer depends on
+            1 to max_fan_in jobs of the previous layer
+        fan_in: With probability dependency_probability, a job depends on 1 to max_fan_in
+            jobs drawn from all earlier jobs
+
+    Without a tightness, capacities are uniform in [min_capacity, max_capacity]
+    like RandomGenerator's. With one, the total capacity is set so the jobs
+    use that share of it, and split between the resources.
+    """
+
+    def __init__(self, jobs=5, resources=3, durations="uniform", min_duration=1, max_duration=10, dag="chain",
+                 dependency_probability=0.5, chains=1, layers=None, max_fan_in=3, tightness=None,
+                 capacity_spread=0.0, min_capacity=3, max_capacity=20, seed=None):
+        """
+        Initialize a generator.
+
+        Args:
+            jobs: Number of jobs per instance
+            resources: Number of resources per instance
+            durations: Processing time distribution, one of DURATIONS
+            min_duration: Shortest processing time
+            max_duration: Longest processing time
+            dag: Dependency shape, one of DAG_SHAPES
+            dependency_probability: Chance that a job has predecessors in the "chain" and "fan_in" shapes
+            chains: Number of interleaved chains in the "chain" shape
+            layers: Number of layers in the "layered" shape (defaults to the square root of jobs)
+            max_fan_in: Most predecessors a job gets in the "layered" and "fan_in" shapes
+            tightness: Share of the total capacity the jobs use, None for independent capacities
+            capacity_spread: With a tightness, how unevenly capacity is split (0 splits it evenly)
+            min_capacity: Smallest capacity without a tightness
+            max_capacity: Largest capacity without a tightness
+            seed: Family seed, random by default (kept in seed so the family can be regenerated)
+
+        Raises:
+            ValueError: If a distribution or shape is unknown or a size or bound is invalid
+        """
+        if durations not in DURATIONS:
+            raise ValueError(f"Durations must be one of {', '.join(DURATIONS)}")
+        if dag not in DAG_SHAPES:
+            raise ValueError(f"DAG shape must be one of {', '.join(DAG_SHAPES)}")
+        if jobs < 0 or resources <= 0 or chains <= 0 or max_fan_in <= 0:
+            raise ValueError("Resources, chains and fan-in must be positive and jobs cannot be negative")
+        if not 1 <= min_duration <= max_duration or not 1 <= min_capacity <= max_capacity:
+            raise ValueError("Duration and capacity ranges must be positive and ordered")
+        if tightness is not None and tightness <= 0:
+            raise ValueError("Tightness must be positive")
+
+        self.jobs = jobs
+        self.resources = resources
+        self.durations = durations
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.dag = dag
+        self.dependency_probability = dependency_probability
+        self.chains = chains
+        # More layers than jobs would leave layers empty.
+        self.layers = min(layers or max(1, int(round(jobs ** 0.5))), max(jobs, 1))
+        self.max_fan_in = max_fan_in
+        self.tightness = tightness
+        self.capacity_spread = capacity_spread
+        self.min_capacity = min_capacity
+        self.max_capacity = max_capacity
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2 ** 32)
+
+    def rng(self, index):
+        """Return the random generator of instance index."""
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(index,)))
+
+    def processing_times(self, rng):
+        """Return the processing time of every job, drawn from the duration distribution and clipped to its range."""
+        low, high = self.min_duration, self.max_duration
+        if self.durations == "uniform":
+            return rng.integers(low, high + 1, self.jobs)
+
+        mean = (low + high) / 2
+        if self.durations == "exponential":
+            values = low + rng.exponential(mean - low, self.jobs)
+        elif self.durations == "lognormal":
+            values = rng.lognormal(np.log(mean), 0.75, self.jobs)
+        else:
+            # Mostly short jobs with a minority of long ones.
+            long_jobs = rng.random(self.jobs) < 0.2
+            values = np.where(long_jobs, rng.uniform(mean, high, self.jobs), rng.uniform(low, mean, self.jobs))
+        return np.clip(np.rint(values), low, high).astype(np.int64)
+
+    def predecessor_matrix(self, rng):
+        """
+        Return each job's predecessor indexes as an (jobs, max predecessors) array, padded with -1.
+
+        Indexes may repeat within a row; Job keeps predecessors in a set.
+        """
+        indexes = np.arange(self.jobs)
+        if self.dag == "independent" or self.jobs == 0:
+            return np.full((self.jobs, 0), -1)
+
+        if self.dag == "chain":
+            has_predecessor = (rng.random(self.jobs) < self.dependency_probability) & (indexes >= self.chains)
+            return np.where(has_predecessor, indexes - self.chains, -1)[:, None]
+
+        if self.dag == "layered":
+            layer = indexes * self.layers // self.jobs
+            layer_start = np.searchsorted(layer, np.arange(self.layers + 1))
+            previous_start = layer_start[np.maximum(layer - 1, 0)]
+            previous_size = layer_start[layer] - previous_start
+            fan_in = np.where(layer > 0, rng.integers(1, self.max_fan_in + 1, self.jobs), 0)
+        else:
+            previous_start = np.zeros(self.jobs, dtype=np.int64)
+            previous_size = indexes
+            has_predecessor = (rng.random(self.jobs) < self.dependency_probability) & (indexes > 0)
+            fan_in = np.where(has_predecessor, rng.integers(1, self.max_fan_in + 1, self.jobs), 0)
+
+        offsets = (rng.random((self.jobs, self.max_fan_in)) * previous_size[:, None]).astype(np.int64)
+        matrix = previous_start[:, None] + offsets
+        matrix[np.arange(self.max_fan_in)[None, :] >= fan_in[:, None]] = -1
+        return matrix
+
+    def capacities(self, rng, total_work):
+        """Return the capacity of every resource, sized from total_work when a tightness is set."""
+        if self.tightness is None:
+            return rng.integers(self.min_capacity, self.max_capacity + 1, self.resources)
+
+        weights = 1 + self.capacity_spread * rng.uniform(-1, 1, self.resources)
+        weights = np.maximum(weights, 1e-9) / np.maximum(weights, 1e-9).sum()
+        return np.maximum(np.ceil(total_work / self.tightness * weights), 1).astype(np.int64)
+
+    def instance(self, index=0):
+        """
+        Generate instance index of the family.
+
+        Jobs are numbered 1 to jobs and resources 1 to resources.
+
+        Returns:
+            JobSchedulingProblem: The instance
+        """
+        rng = self.rng(index)
+        processing_times = self.processing_times(rng)
+        predecessors = self.predecessor_matrix(rng)
+        capacities = self.capacities(rng, int(processing_times.sum()))
+
+        jobs = [Job(job_id, processing_time, predecessors=[predecessor + 1 for predecessor in row if predecessor >= 0])
+                for job_id, processing_time, row in zip(range(1, self.jobs + 1), processing_times.tolist(),
+                                                        predecessors.tolist())]
+        resources = [Resource(resource_id, capacity)
+                     for resource_id, capacity in enumerate(capacities.tolist(), start=1)]
+        return JobSchedulingProblem(jobs, resources)
+
+    def family(self, count, start=0):
+        """Return instances start to start + count - 1 of the family."""
+        return [self.instance(index) for index in range(start, start + count)]
\ No newline at end of file
@@ -0,0 +1,183 @@
+import csv
+import json
+import statistics
+import time
+import tracemalloc
+
+
+def summarize(values):
+    """
+    Return the median, 95th percentile and standard deviation of some measurements.
+
+    Args:
+        values: Measurements of one metric, at least one
+
+    Returns:
+        dict: {"median": ..., "p95": ..., "stddev": ...}; a single measurement has a stddev of 0
+    """
+    if len(values) == 1:
+        return {"median": values[0], "p95": values[0], "stddev": 0.0}
+    return {
+        "median": statistics.median(values),
+        "p95": statistics.quantiles(values, n=20, method="inclusive")[18],
+        "stddev": statistics.stdev(values),
+    }
+
+
+def solver_counters(result):
+    """Return the integer counters of a ScheduleResult's stats, such as nodes_expanded or generations_run."""
+    return {name: value for name, value in result.stats.items()
+            if isinstance(value, int) and not isinstance(value, bool)}
+
+
+class RunMeasurement:
+    """
+    Cost of one timed solver run.
+
+    Attributes:
+        wall_time_ns (int): Wall-clock nanoseconds from perf_counter_ns
+        cpu_time (float): CPU seconds used by this process, from process_time
+        makespan (Optional[int]): Makespan of the returned schedule
+        counters (dict): Solver-internal counters taken from the result's stats
+    """
+
+    def __init__(self, wall_time_ns, cpu_time, makespan, counters):
+        self.wall_time_ns = wall_time_ns
+        self.cpu_time = cpu_time
+        self.makespan = makespan
+        self.counters = counters
+
+    @property
+    def wall_time(self) -> float:
+        """Return the wall-clock time in seconds."""
+        return self.wall_time_ns / 1e9
+
+    def to_dict(self):
+        return {"wall_time": self.wall_time, "cpu_time": self.cpu_time, "makespan": self.makespan,
+                **self.counters}
+
+
+class SolverProfile:
+    """
+    Repeated measurements of one solver configuration.
+
+    Attributes:
+        label (str): Name the profile is reported under
+        runs (list): RunMeasurement of every timed run, warmup runs excluded
+        peak_memory (Optional[int]): Peak bytes allocated during a traced run, None if not traced
+        result (ScheduleResult): Result of the last timed run
+    """
+
+    def __init__(self, label, runs, peak_memory, result):
+        self.label = label
+        self.runs = runs
+        self.peak_memory = peak_memory
+        self.result = result
+
+    def summary(self):
+        """
+        Return the profile as one flat dict.
+
+        Wall and CPU time get their median, p95 and stddev; solver counters
+        and the makespan are reported as their median over the runs.
+        """
+        summary = {"label": self.label, "runs": len(self.runs)}
+        for metric in ("wall_time", "cpu_time"):
+            values = [getattr(run, metric) for run in self.runs]
+            for name, value in summarize(values).items():
+                summary[f"{metric}_{name}"] = value
+        summary["peak_memory"] = self.peak_memory
+        makespans = [run.makespan for run in self.runs if run.makespan is not None]
+        summary["makespan"] = statistics.median(makespans) if makespans else None
+        for name in self.runs[0].counters if self.runs else ():
+            summary[name] = statistics.median(run.counters.get(name, 0) for run in self.runs)
+        return summary
+
+    def to_dict(self):
+        return {"summary": self.summary(), "runs": [run.to_dict() for run in self.runs]}
+
+
+def measure_run(make_solver):
+    """
+    Solve once with a fresh solver and return (RunMeasurement, ScheduleResult).
+
+    Only solve() is timed; building the solver happens before the clock starts.
+    """
+    solver = make_solver()
+    wall_start = time.perf_counter_ns()
+    cpu_start = time.process_time()
+    solver.solve()
+    cpu_time = time.process_time() - cpu_start
+    wall_time_ns = time.perf_counter_ns() - wall_start
+
+    result = solver.result
+    return RunMeasurement(wall_time_ns, cpu_time, result.makespan, solver_counters(result)), result
+
+
+def measure_peak_memory(make_solver):
+    """Return the peak bytes allocated while a fresh solver solves once."""
+    solver = make_solver()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        solver.solve()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return peak
+
+
+def profile_solver(make_solver, label=None, repeats=5, warmup=1, trace_memory=True):
+    """
+    Measure a solver configuration over repeated runs.
+
+    Every run builds a new solver, so caches do not carry over between runs.
+    Warmup runs are discarded. tracemalloc slows Python down considerably,
+    so peak memory comes from one extra traced run instead of the timed ones.
+
+    Args:
+        make_solver: Callable returning a new AnytimeSolver
+        label: Name of the profile, the solver's name by default
+        repeats: Number of timed runs
+        warmup: Number of untimed runs before them
+        trace_memory: Measure peak memory in an extra run
+
+    Returns:
+        SolverProfile: The measurements
+
+    Raises:
+        ValueError: If repeats is not positive or warmup is negative
+    """
+    if repeats <= 0 or warmup < 0:
+        raise ValueError("Repeats must be positive and warmup cannot be negative")
+
+    for _ in range(warmup):
+        measure_run(make_solver)
+    runs = []
+    result = None
+    for _ in range(repeats):
+        run, result = measure_run(make_solver)
+        runs.append(run)
+    peak_memory = measure_peak_memory(make_solver) if trace_memory else None
+    return SolverProfile(label or result.solver, runs, peak_memory, result)
+
+
+def export_json(profiles, path):
+    """Write the summary and every run of some profiles to a JSON file."""
+    with open(path, "w") as file:
+        json.dump([profile.to_dict() for profile in profiles], file, indent=2)
+
+
+def export_csv(profiles, path):
+    """Write one summary row per profile to a CSV file."""
+    rows = [profile.summary() for profile in profiles]
+    fieldnames = []
+    for row in rows:
+        fieldnames.extend(name for name in row if name not in fieldnames)
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
\ No newline at end of file
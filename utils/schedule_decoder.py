@@ -0,0 +1,96 @@
+from models.dag_index import DagIndex
+
+
+class DecodedSchedule:
+    """
+    Start and end times of every job in a schedule.
+
+    Attributes:
+        assignments (list): (job, resource) pairs in processing order
+        start_times (dict): Start time of each job, keyed by job_id
+        end_times (dict): End time of each job, keyed by job_id
+        resource_end (dict): Time each resource becomes free, keyed by resource_id
+        resource_load (dict): Total processing time on each resource, keyed by resource_id
+        makespan (int): Latest resource end time
+        feasible (bool): True if no capacity is exceeded and every dependency is scheduled and acyclic
+    """
+
+    def __init__(self, assignments, start_times, end_times, resource_end, resource_load, feasible):
+        self.assignments = assignments
+        self.start_times = start_times
+        self.end_times = end_times
+        self.resource_end = resource_end
+        self.resource_load = resource_load
+        self.makespan = max(resource_end.values(), default=0)
+        self.feasible = feasible
+
+
+class ScheduleDecoder:
+    """
+    Turns (job, resource) schedules into start and end times.
+
+    Each resource processes its jobs in schedule order, and a job starts once
+    its resource is free and all of its predecessors have finished. Times are
+    computed in a single topological pass, so decoding costs O(V + E). A
+    schedule listing the problem's jobs in problem order reuses the problem's
+    cached DagIndex instead of building one.
+    """
+
+    def __init__(self, problem_instance):
+        """
+        Initialize a decoder for a problem instance.
+
+        Args:
+            problem_instance: Problem whose resources are reported even when unused
+        """
+        self.problem_instance = problem_instance
+
+    def decode(self, schedule):
+        """
+        Decode a schedule.
+
+        Args:
+            schedule: List of (job, resource) assignments
+
+        Returns:
+            DecodedSchedule: Timing, load and feasibility of the schedule
+        """
+        resource_end = dict.fromkeys(self.problem_instance.compile().resource_ids, 0)
+        resource_load = dict(resource_end)
+        start_times = {}
+        end_times = {}
+
+        dag = self.dag_for(schedule)
+        feasible = not dag.missing and not dag.cyclic
+        job_end = [0] * len(schedule)
+        assignments = []
+
+        for index in dag.order:
+            job, resource = schedule[index]
+            assignments.append((job, resource))
+
+            dependency_end = 0
+            for predecessor in dag.predecessors[index]:
+                if job_end[predecessor] > dependency_end:
+                    dependency_end = job_end[predecessor]
+
+            start_time = max(resource_end.get(resource.resource_id, 0), dependency_end)
+            end_time = start_time + job.processing_time
+            job_end[index] = end_time
+            start_times[job.job_id] = start_time
+            end_times[job.job_id] = end_time
+
+            resource_end[resource.resource_id] = end_time
+            load = resource_load.get(resource.resource_id, 0) + job.processing_time
+            resource_load[resource.resource_id] = load
+            if load > resource.capacity:
+                feasible = False
+
+        return DecodedSchedule(assignments, start_times, end_times, resource_end, resource_load, feasible)
+
+    def dag_for(self, schedule):
+        """Return the DagIndex of a schedule's jobs, reusing the problem's when the jobs match."""
+        jobs = self.problem_instance.jobs
+        if len(schedule) == len(jobs) and all(job is scheduled for job, (scheduled, _) in zip(jobs, schedule)):
+            return self.problem_instance.dag()
+        return DagIndex([job for job, _ in schedule])
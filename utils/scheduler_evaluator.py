@@ -1,6 +1,10 @@
-import time
 from algorithms.backtracking_algorithm import BacktrackingAlgorithm
 from algorithms.genetic_algorithm import GeneticAlgorithm
+from models.schedule_result import ScheduleResult
+from utils.instrumentation import profile_solver
+
+# Possible winners of a comparison.
+OUTCOMES = ("backtracking", "genetic", "tie", "none")
 
 class SchedulerEvaluator:
     def __init__(self, instance):
@@ -8,114 +12,117 @@ class SchedulerEvaluator:
         self.backtracking_results = []
         self.genetic_results = []
         self.problem_instance = instance
-
-    def run_algorithms(self):
-        # Run Backtracking Algorithm
-        backtracking_algorithm = BacktrackingAlgorithm(self.instance)
-        start_time_backtracking = time.time()
-        backtracking_algorithm.solve()
-        end_time_backtracking = time.time()
-        duration_backtracking = end_time_backtracking - start_time_backtracking
-        backtracking_schedule = backtracking_algorithm.best_schedule
-        self.backtracking_results.append((backtracking_schedule, duration_backtracking))
-
-        # Run Genetic Algorithm
-        genetic_algorithm = GeneticAlgorithm(self.instance)
-        start_time_genetic = time.time()
-        genetic_algorithm.initialize_population()
-        genetic_algorithm.evolve()
-        end_time_genetic = time.time()
-        duration_genetic = end_time_genetic - start_time_genetic
-        genetic_schedule = genetic_algorithm.best_schedule
-        self.genetic_results.append((genetic_schedule, duration_genetic))
+        self.profiles = []
+
+    def run_algorithms(self, repeats=1, warmup=0, trace_memory=False):
+        """
+        Solve the instance with both algorithms, measuring each with utils.instrumentation.
+
+        Args:
+            repeats: Timed runs per algorithm; the recorded duration is their median
+            warmup: Untimed runs per algorithm before the timed ones
+            trace_memory: Also record each algorithm's peak memory in profiles
+        """
+        for label, make_solver, results in (
+                ("Backtracking", lambda: BacktrackingAlgorithm(self.instance), self.backtracking_results),
+                ("Genetic", lambda: GeneticAlgorithm(self.instance, stall_generations=20), self.genetic_results)):
+            profile = profile_solver(make_solver, label, repeats=repeats, warmup=warmup, trace_memory=trace_memory)
+            self.profiles.append(profile)
+            results.append((list(profile.result.schedule) or None, profile.summary()['wall_time_median']))
+
+    def add_results(self, backtracking_result, genetic_result):
+        """Record a pair of ScheduleResults computed elsewhere, such as by a BatchEvaluator."""
+        self.backtracking_results.append((list(backtracking_result.schedule) or None,
+                                          backtracking_result.stats['elapsed']))
+        self.genetic_results.append((list(genetic_result.schedule) or None, genetic_result.stats['elapsed']))
     
-    def get_schedule_representation(self, schedule):
-        schedule_representation = ""
-        resource_occupancy = {resource.resource_id: 0 for resource in self.problem_instance.resources}
-        job_start_times = {job.job_id: 0 for job in self.problem_instance.jobs}
-
-        valid_schedule = True  # Flag to track the validity of the schedule
-
-        for assignment in schedule:
-            job = assignment[0]
-            resource = assignment[1]
-
-            dependency_start_time = job_start_times[job.dependency] if job.dependency is not None else 0
-            start_time = max(resource_occupancy[resource.resource_id], dependency_start_time)
-            end_time = start_time + job.processing_time
-
-            # Check if the assignment makes the schedule invalid
-            if resource_occupancy[resource.resource_id] + job.processing_time > resource.capacity \
-                    or (job.dependency is not None and job_start_times[job.dependency] > start_time):
-                valid_schedule = False
-                break
-
-            schedule_representation += (
-                f"Job {job.job_id} scheduled on Resource {resource.resource_id} "
-                f"Start Time: {start_time}, End Time: {end_time}\n"
-            )
-
-            resource_occupancy[resource.resource_id] = end_time
-            job_start_times[job.job_id] = end_time
-
-        if not valid_schedule:
-            schedule_representation = "No valid schedule found."
-
-        return schedule_representation
-
-    def extract_total_time_span(self, schedule_str):
-        lines = schedule_str.split("\n")
-
-        # Extract end times from each line and find the maximum
-        end_times = [int(line.split("End Time: ")[1]) for line in lines if "End Time" in line]
-
-        if not end_times:
-            # No valid schedule found, return a default value or indication
-            return "No valid schedule found."
-
-        total_time_span = max(end_times)
-        return total_time_span
+    def compare(self, backtracking_schedule, duration_backtracking, genetic_schedule, duration_genetic):
+        """Return the ComparisonMetrics of one backtracking run against one genetic run."""
+        backtracking = ScheduleResult(self.problem_instance, backtracking_schedule, "Backtracking Algorithm")
+        genetic = ScheduleResult(self.problem_instance, genetic_schedule, "Genetic Algorithm")
+        return ComparisonMetrics(backtracking, duration_backtracking, genetic, duration_genetic)
 
     def evaluate_performance(self):
-        comparison_results = []
-        backtracking_times = []
-        genetic_times = []
-
-        for i, (backtracking_schedule, duration_backtracking) in enumerate(self.backtracking_results):
-            genetic_schedule, duration_genetic = self.genetic_results[i]
-
-            if backtracking_schedule is None and genetic_schedule is not None:
-                comparison_results.append(1)  # Genetic is faster or valid when backtracking isn't
-            elif backtracking_schedule is not None and genetic_schedule is None:
-                comparison_results.append(0)  # Backtracking is faster or valid when genetic isn't
-            elif backtracking_schedule is None and genetic_schedule is None:
-                comparison_results.append(2)  # Both schedules are invalid
-            else:
-                # Get Schedule Representations
-                schedule_representation_backtracking = self.get_schedule_representation(backtracking_schedule)
-                schedule_representation_genetic = self.get_schedule_representation(genetic_schedule)
-
-                # Calculate Total Time Span
-                total_time_span_backtracking = self.extract_total_time_span(schedule_representation_backtracking)
-                total_time_span_genetic = self.extract_total_time_span(schedule_representation_genetic)
-
-                if total_time_span_backtracking == "No valid schedule found." and total_time_span_genetic != "No valid schedule found.":
-                    comparison_results.append(1)  # Genetic is faster or valid when backtracking isn't
-                elif total_time_span_backtracking != "No valid schedule found." and total_time_span_genetic == "No valid schedule found.":
-                    comparison_results.append(0)  # Backtracking is faster or valid when genetic isn't
-                elif total_time_span_backtracking < total_time_span_genetic:
-                    comparison_results.append(0)
-                elif total_time_span_backtracking > total_time_span_genetic:
-                    comparison_results.append(1)
-                else:
-                    comparison_results.append(2)
-
-            # Record Algorithm Times
-            backtracking_times.append(duration_backtracking)
-            genetic_times.append(duration_genetic)
+        """
+        Compare every recorded pair of runs on makespan, feasibility, utilization and time.
+
+        Returns:
+            tuple: (list of ComparisonMetrics, average backtracking seconds, average genetic seconds)
+        """
+        comparisons = [
+            self.compare(backtracking_schedule, duration_backtracking, genetic_schedule, duration_genetic)
+            for (backtracking_schedule, duration_backtracking), (genetic_schedule, duration_genetic)
+            in zip(self.backtracking_results, self.genetic_results)
+        ]
 
         # Calculate Average Times
-        avg_backtracking_time = sum(backtracking_times) / len(backtracking_times)
-        avg_genetic_time = sum(genetic_times) / len(genetic_times)
+        avg_backtracking_time = sum(comparison.backtracking_time for comparison in comparisons) / len(comparisons)
+        avg_genetic_time = sum(comparison.genetic_time for comparison in comparisons) / len(comparisons)
+
+        return comparisons, avg_backtracking_time, avg_genetic_time
+
+
+def mean_utilization(result):
+    """Return the average share of the makespan the resources of a ScheduleResult are busy."""
+    if not result.utilization:
+        return None
+    return sum(result.utilization.values()) / len(result.utilization)
+
+
+class ComparisonMetrics:
+    """
+    Backtracking against the genetic algorithm on one instance.
+
+    A schedule that is missing or breaks a constraint counts as not found.
+
+    Attributes:
+        backtracking_makespan (Optional[int]): Makespan of the backtracking schedule, None if not found
+        genetic_makespan (Optional[int]): Makespan of the genetic schedule, None if not found
+        backtracking_time (float): Seconds backtracking took
+        genetic_time (float): Seconds the genetic algorithm took
+        backtracking_utilization (Optional[float]): Mean resource utilization of the backtracking schedule
+        genetic_utilization (Optional[float]): Mean resource utilization of the genetic schedule
+        gap (Optional[float]): (genetic - backtracking) / backtracking makespan, None unless both were found
+        speedup (Optional[float]): Backtracking time / genetic time, None if the genetic time is 0
+        winner (str): One of OUTCOMES: the algorithm with the shorter valid schedule, "tie" when both
+            have the same makespan, "none" when neither found one
+    """
+
+    def __init__(self, backtracking, backtracking_time, genetic, genetic_time):
+        """
+        Compare two ScheduleResults of the same instance.
+
+        Args:
+            backtracking: ScheduleResult of backtracking
+            backtracking_time: Seconds backtracking took
+            genetic: ScheduleResult of the genetic algorithm
+            genetic_time: Seconds the genetic algorithm took
+        """
+        self.backtracking_makespan = backtracking.makespan if backtracking.feasible else None
+        self.genetic_makespan = genetic.makespan if genetic.feasible else None
+        self.backtracking_time = backtracking_time
+        self.genetic_time = genetic_time
+        self.backtracking_utilization = mean_utilization(backtracking) if backtracking.feasible else None
+        self.genetic_utilization = mean_utilization(genetic) if genetic.feasible else None
+        self.speedup = backtracking_time / genetic_time if genetic_time else None
+
+        self.gap = None
+        if self.backtracking_makespan is None and self.genetic_makespan is None:
+            self.winner = "none"
+        elif self.backtracking_makespan is None:
+            self.winner = "genetic"
+        elif self.genetic_makespan is None:
+            self.winner = "backtracking"
+        else:
+            if self.backtracking_makespan:
+                self.gap = (self.genetic_makespan - self.backtracking_makespan) / self.backtracking_makespan
+            if self.backtracking_makespan < self.genetic_makespan:
+                self.winner = "backtracking"
+            elif self.backtracking_makespan > self.genetic_makespan:
+                self.winner = "genetic"
+            else:
+                self.winner = "tie"
 
-        return comparison_results, avg_backtracking_time, avg_genetic_time
+    def __repr__(self):
+        return (f"ComparisonMetrics(winner={self.winner!r}, backtracking_makespan={self.backtracking_makespan}, "
+                f"genetic_makespan={self.genetic_makespan}, gap={self.gap}, speedup={self.speedup})")
\ No newline at end of file